@@ -9,57 +9,1117 @@ and generating intuitive control rigs for animation.
 """
 
 import os
+import re
 import sys
 import json
 import math
+import bisect
+import heapq
+import contextlib
+from collections import defaultdict
+from functools import partial
+
+# NumPy ships with Maya 2022+; older builds fall back to pure-Python loops
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional Qhull convex hulls (SciPy is not bundled with Maya); falls back to a Graham scan
+try:
+    from scipy.spatial import ConvexHull
+except ImportError:
+    ConvexHull = None
+
+# Optional JIT for the point-ordering/clustering loops (not bundled with Maya; needs NumPy)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional C JSON parser (not bundled with Maya); falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Maya imports
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.api.OpenMaya as om2
 
 # Python 2/3 compatibility
 if sys.version_info[0] >= 3:
     string_types = str
     text_type = str
+    intern_string = sys.intern
 else:
     string_types = basestring
     text_type = unicode
+    intern_string = intern
 
 # PySide compatibility for Maya versions
+# Only the base classes subclassed at import time are imported up front; the remaining
+# Qt symbols are bound by _lazy_import_qt() the first time the tool is opened.
 try:
     # Maya 2025+ (PySide6)
-    from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout, QLabel, QPushButton, 
-                                   QLineEdit, QComboBox, QListWidget, QListWidgetItem, QTextEdit, 
-                                   QFileDialog, QMessageBox, QSplitter, QWidget, QScrollArea, QFrame, QCheckBox,
-                                   QSpinBox, QDoubleSpinBox, QGroupBox, QRadioButton, QButtonGroup, QTabWidget)
-    from PySide6.QtCore import Qt, QSize
-    from PySide6.QtGui import QPixmap, QFont
-    from shiboken6 import wrapInstance
+    from PySide6.QtWidgets import QDialog
+    from PySide6.QtCore import QAbstractTableModel
     pyside_version = 6
 except ImportError:
     try:
         # Maya 2022 and earlier (PySide2)
-        from PySide2.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout, QLabel, QPushButton, 
-                                       QLineEdit, QComboBox, QListWidget, QListWidgetItem, QTextEdit, 
-                                       QFileDialog, QMessageBox, QSplitter, QWidget, QScrollArea, QFrame, QCheckBox,
-                                       QSpinBox, QDoubleSpinBox, QGroupBox, QRadioButton, QButtonGroup, QTabWidget)
-        from PySide2.QtCore import Qt, QSize
-        from PySide2.QtGui import QPixmap, QFont
-        from shiboken2 import wrapInstance
+        from PySide2.QtWidgets import QDialog
+        from PySide2.QtCore import QAbstractTableModel
         pyside_version = 2
     except ImportError:
         print("Error: Could not import PySide. Please ensure Maya is running.")
         pyside_version = None
 
-if pyside_version:
+_qt_symbols_loaded = False
+
+
+def _lazy_import_qt():
+    """Import the Qt widget symbols used by the dialog (once per session)"""
+    global _qt_symbols_loaded, omui, wrapInstance
+    global QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout, QLabel, QPushButton
+    global QLineEdit, QComboBox, QListWidget, QListWidgetItem, QListView, QTableView, QTextEdit
+    global QFileDialog, QMessageBox, QSplitter, QWidget, QScrollArea, QFrame, QCheckBox
+    global QSpinBox, QDoubleSpinBox, QGroupBox, QRadioButton, QButtonGroup, QTabWidget
+    global Qt, QSize, QStringListModel, QTimer, QPixmap, QFont, QColor
+    
+    if _qt_symbols_loaded or not pyside_version:
+        return
+    
+    if pyside_version == 6:
+        from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout, QLabel, QPushButton, 
+                                       QLineEdit, QComboBox, QListWidget, QListWidgetItem, QListView, QTableView, QTextEdit, 
+                                       QFileDialog, QMessageBox, QSplitter, QWidget, QScrollArea, QFrame, QCheckBox,
+                                       QSpinBox, QDoubleSpinBox, QGroupBox, QRadioButton, QButtonGroup, QTabWidget)
+        from PySide6.QtCore import Qt, QSize, QStringListModel, QTimer
+        from PySide6.QtGui import QPixmap, QFont, QColor
+        from shiboken6 import wrapInstance
+    else:
+        from PySide2.QtWidgets import (QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout, QLabel, QPushButton, 
+                                       QLineEdit, QComboBox, QListWidget, QListWidgetItem, QListView, QTableView, QTextEdit, 
+                                       QFileDialog, QMessageBox, QSplitter, QWidget, QScrollArea, QFrame, QCheckBox,
+                                       QSpinBox, QDoubleSpinBox, QGroupBox, QRadioButton, QButtonGroup, QTabWidget)
+        from PySide2.QtCore import Qt, QSize, QStringListModel, QTimer
+        from PySide2.QtGui import QPixmap, QFont, QColor
+        from shiboken2 import wrapInstance
+    
     import maya.OpenMayaUI as omui
+    _qt_symbols_loaded = True
+
+
+# Dark theme stylesheet consistent with the STALKER 2 toolkit, built once at import.
+DARK_STYLE = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+        font-size: 11px;
+    }
+    .title-label {
+        color: #ffffff;
+        font-size: 18px;
+        font-weight: bold;
+        padding: 10px;
+        background-color: #1a1a1a;
+        border: 2px solid #333333;
+        border-radius: 6px;
+        margin-bottom: 10px;
+    }
+    .section-header {
+        color: #cccccc;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 8px 4px;
+        background-color: #252525;
+        border-left: 3px solid #0078d4;
+        margin-bottom: 8px;
+    }
+    .section-frame {
+        background-color: #222222;
+        border: 1px solid #333333;
+        border-radius: 4px;
+        padding: 10px;
+    }
+    .info-label {
+        color: #cccccc;
+        font-size: 10px;
+        background-color: #333333;
+        padding: 8px;
+        border-radius: 3px;
+        margin-top: 5px;
+    }
+    QPushButton {
+        background-color: #404040;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: #505050;
+        border: 1px solid #777777;
+    }
+    QPushButton:pressed {
+        background-color: #353535;
+    }
+    QPushButton:disabled {
+        background-color: #2a2a2a;
+        color: #666666;
+        border: 1px solid #333333;
+    }
+    .primary-button {
+        background-color: #0078d4;
+        color: #ffffff;
+        border: 1px solid #106ebe;
+        padding: 12px 20px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    .primary-button:hover {
+        background-color: #106ebe;
+    }
+    .primary-button:pressed {
+        background-color: #005a9e;
+    }
+    .secondary-button {
+        background-color: #404040;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    .secondary-button:hover {
+        background-color: #555555;
+    }
+    .create-all-button {
+        background-color: #228B22;
+        color: #ffffff;
+        border: 1px solid #32CD32;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    .create-all-button:hover {
+        background-color: #32CD32;
+    }
+    .create-all-button:pressed {
+        background-color: #006400;
+    }
+    .complete-rig-button {
+        background-color: #8A2BE2;
+        color: #ffffff;
+        border: 1px solid #9370DB;
+        padding: 12px 24px;
+        border-radius: 4px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    .complete-rig-button:hover {
+        background-color: #9370DB;
+    }
+    .complete-rig-button:pressed {
+        background-color: #6A0DAD;
+    }
+    .warning-button {
+        background-color: #dc3545;
+        color: #ffffff;
+        border: 1px solid #c82333;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    .warning-button:hover {
+        background-color: #c82333;
+    }
+    .warning-button:pressed {
+        background-color: #a71e2a;
+    }
+    QLineEdit, QSpinBox, QDoubleSpinBox {
+        background-color: #404040;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 6px;
+        border-radius: 3px;
+        font-size: 11px;
+    }
+    QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {
+        border: 1px solid #0078d4;
+    }
+    QTabWidget::pane {
+        border: 1px solid #444444;
+        background-color: #222222;
+    }
+    QTabWidget::tab-bar {
+        alignment: left;
+    }
+    QTabBar::tab {
+        background-color: #333333;
+        color: #cccccc;
+        border: 1px solid #555555;
+        padding: 8px 16px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #0078d4;
+        color: #ffffff;
+    }
+    QTabBar::tab:hover {
+        background-color: #555555;
+    }
+    QListWidget {
+        background-color: #404040;
+        border: 1px solid #555555;
+        selection-background-color: #0078d4;
+        color: #ffffff;
+    }
+    QListWidget::item {
+        padding: 4px 8px;
+        border-bottom: 1px solid #555555;
+    }
+    QListWidget::item:selected {
+        background-color: #0078d4;
+    }
+    QListWidget::item:hover {
+        background-color: #505050;
+    }
+    QGroupBox {
+        color: #ffffff;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        margin-top: 8px;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 8px;
+        padding: 0 4px 0 4px;
+        color: #cccccc;
+        font-weight: bold;
+    }
+    QRadioButton {
+        color: #ffffff;
+        font-size: 11px;
+        padding: 4px;
+    }
+    QRadioButton::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid #555555;
+        border-radius: 9px;
+        background-color: #404040;
+    }
+    QRadioButton::indicator:checked {
+        background-color: #0078d4;
+        border: 2px solid #106ebe;
+    }
+    QRadioButton::indicator:hover {
+        border: 2px solid #777777;
+    }
+    QTableView {
+        background-color: #333333;
+        alternate-background-color: #2e2e2e;
+        border: 1px solid #444444;
+        gridline-color: #444444;
+        selection-background-color: #0078d4;
+        color: #ffffff;
+        font-size: 11px;
+    }
+    QHeaderView::section {
+        background-color: #252525;
+        color: #cccccc;
+        border: 1px solid #444444;
+        padding: 4px;
+    }
+    .joint-name {
+        color: #ffffff;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    .mesh-info {
+        color: #cccccc;
+        font-size: 10px;
+        margin-left: 10px;
+        margin-top: 2px;
+    }
+    .control-info {
+        color: #90EE90;
+        font-size: 10px;
+        margin-left: 10px;
+        margin-top: 2px;
+    }
+    .no-control {
+        color: #888888;
+        font-size: 10px;
+        font-style: italic;
+        margin-left: 10px;
+        margin-top: 2px;
+    }
+    .excluded-joint {
+        color: #ff6b6b;
+        font-size: 10px;
+        font-weight: bold;
+        margin-left: 10px;
+        margin-top: 2px;
+    }
+    .info-text {
+        color: #66ff66;
+        font-size: 11px;
+        font-style: italic;
+        padding: 2px 4px;
+    }
+    .curve-adjustment-frame {
+        background-color: #2a2a2a;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        margin: 3px 0px;
+    }
+    .reset-button {
+        background-color: #666666;
+        color: #ffffff;
+        border: 1px solid #777777;
+        border-radius: 3px;
+        padding: 3px 6px;
+        font-size: 9px;
+    }
+    .reset-button:hover {
+        background-color: #777777;
+    }
+    .preview-button {
+        background-color: #228B22;
+        color: #ffffff;
+        border: 1px solid #32CD32;
+        border-radius: 3px;
+        padding: 3px 6px;
+        font-size: 9px;
+    }
+    .preview-button:hover {
+        background-color: #32CD32;
+    }
+    """
+
+
+# Weapon database (same mappings as the weapon importer)
+WEAPON_CATEGORIES = {
+    "Melee": [("Knife", "knife")],
+    "Pistols": [
+        ("PTM", "pm"), ("UDP Compact", "udp"), ("APSB", "apb"), 
+        ("Rhino", "rhino00000"), ("Kora-1911", "kora")
+    ],
+    "Shotguns": [
+        ("Boomstick", "obrez"), ("TOZ-34", "toz34"), ("M680 Cracker", "m86000"),
+        ("SPSA-14", "spsa00"), ("Saiga D-12", "d1200"), ("RAM-2", "ram2")
+    ],
+    "Submachine Guns": [
+        ("Viper-5", "vip"), ("AKM-74U", "aku"), ("M10 Gordon", "m1000"),
+        ("Buket S-2", "bucket0"), ("ZUBR-19", "zubr0"), ("Integral-A", "integ")
+    ],
+    "Assault Rifles": [
+        ("AK74", "ak74"), ("Fora-221", "fora0"), ("Dnipro", "dnipro"),
+        ("GROM S-14", "grim0"), ("AS Lavina", "lav"), ("AR416", "m160"),
+        ("GP37", "gp37"), ("Kharod", "kharod000"), ("Sotnyk", "sotnyk")
+    ],
+    "Sniper Rifles": [
+        ("SVU MK S-3", "svu"), ("SVDM-2", "svm"), ("VS Vintar", "vintar"),
+        ("M701 Super", "m701"), ("Mark 1 EMR", "mar"), ("Three-Line Rifle", "threeline"),
+        ("Gauss Rifle", "gauss")
+    ],
+    "Machine Guns": [
+        ("RPM-74", "pkp00000"), ("PKP", "mgp")
+    ],
+    "Launchers": [
+        ("RPG7U", "rpg7")
+    ],
+    "Grenades": [
+        ("F1 Grenade", "f1"), ("RGD5 Grenade", "rgd5"), ("Smoke Grenade", "smoke")
+    ]
+}
+
+# Category to folder mapping (same as weapon importer)
+CATEGORY_FOLDERS = {
+    "Melee": "knifes",
+    "Pistols": "pt",
+    "Shotguns": "shg", 
+    "Submachine Guns": "smg",
+    "Assault Rifles": "ar",
+    "Sniper Rifles": "sr",
+    "Machine Guns": "mg",
+    "Launchers": "gl",
+    "Grenades": "grenades"
+}
+
+
+def _normalize_weapon_name(name):
+    """Normalize a weapon display name for lookups ("Kora-1911" -> "kora1911")"""
+    return name.lower().replace(' ', '').replace('-', '')
+
+
+def _build_weapon_index():
+    """Map lowercased folder ids and normalized display names to (category, folder_id).
+    
+    Earlier entries win, matching the order the categories were previously scanned in.
+    """
+    index = {}
+    for category_name, weapons in WEAPON_CATEGORIES.items():
+        for weapon_name, weapon_folder_id in weapons:
+            index.setdefault(weapon_folder_id.lower(), (category_name, weapon_folder_id))
+            index.setdefault(_normalize_weapon_name(weapon_name), (category_name, weapon_folder_id))
+    return index
+
+
+WEAPON_INDEX = _build_weapon_index()
+
+
+# Mesh-name fragments that identify a weapon, in priority order (add more as needed)
+WEAPON_NAME_PATTERNS = (
+    ('ak74', 'AK74'),
+    ('ak_', 'AK74'),
+    ('m16', 'M16'),
+    ('m4', 'M4'),
+    ('glock', 'GLOCK'),
+    ('ar15', 'AR15'),
+)
+_WEAPON_NAME_PRIORITY = dict((pattern, index) for index, (pattern, _) in enumerate(WEAPON_NAME_PATTERNS))
+_WEAPON_NAME_MAP = dict(WEAPON_NAME_PATTERNS)
+_WEAPON_NAME_RE = re.compile('|'.join(re.escape(pattern) for pattern, _ in WEAPON_NAME_PATTERNS), re.IGNORECASE)
+
+
+def match_weapon_id_from_name(name):
+    """Return the weapon id for the highest-priority pattern found in name, or None"""
+    found = set(match.group(0).lower() for match in _WEAPON_NAME_RE.finditer(name))
+    if not found:
+        return None
+    return _WEAPON_NAME_MAP[min(found, key=_WEAPON_NAME_PRIORITY.get)]
+
+
+def vertices_bounds(vertices):
+    """Return ([min_x, min_y, min_z], [max_x, max_y, max_z]) for a list of points"""
+    if np is not None:
+        pts = np.asarray(vertices, dtype=np.float64)
+        return pts.min(axis=0).tolist(), pts.max(axis=0).tolist()
+    lo = list(vertices[0][:3])
+    hi = list(lo)
+    for v in vertices:
+        for i in range(3):
+            if v[i] < lo[i]:
+                lo[i] = v[i]
+            elif v[i] > hi[i]:
+                hi[i] = v[i]
+    return lo, hi
+
+
+def vertices_mean(vertices):
+    """Return the centroid [x, y, z] of a non-empty list of points"""
+    if np is not None:
+        return np.asarray(vertices, dtype=np.float64).mean(axis=0).tolist()
+    count = float(len(vertices))
+    sum_x = sum_y = sum_z = 0.0
+    for v in vertices:
+        sum_x += v[0]
+        sum_y += v[1]
+        sum_z += v[2]
+    return [sum_x / count, sum_y / count, sum_z / count]
+
+
+def offset_points(points, origin):
+    """Return [point - origin] for a list of points, as lists"""
+    if np is not None:
+        return (np.asarray(points, dtype=np.float64) - np.asarray(origin, dtype=np.float64)).tolist()
+    ox, oy, oz = origin[0], origin[1], origin[2]
+    return [[p[0] - ox, p[1] - oy, p[2] - oz] for p in points]
+
+
+def scale_points(points, center, scale_factor):
+    """Return points scaled by scale_factor about center, as lists"""
+    if np is not None:
+        c = np.asarray(center, dtype=np.float64)
+        return (c + (np.asarray(points, dtype=np.float64) - c) * scale_factor).tolist()
+    cx, cy, cz = center[0], center[1], center[2]
+    return [[cx + (p[0] - cx) * scale_factor,
+             cy + (p[1] - cy) * scale_factor,
+             cz + (p[2] - cz) * scale_factor] for p in points]
+
+
+def relative_curve_points(world_points, origin, scale_factor=1.0):
+    """Return world points moved into origin-relative space and scaled about their centroid
+    
+    Done as a single pass: the centroid shifts with the points, so the offset is folded
+    into it. The unscaled case is a plain offset.
+    """
+    if scale_factor == 1.0 or not len(world_points):
+        return offset_points(world_points, origin)
+    center = vertices_mean(world_points)
+    shifted_center = [center[0] - origin[0], center[1] - origin[1], center[2] - origin[2]]
+    if np is not None:
+        return (np.asarray(shifted_center, dtype=np.float64) +
+                (np.asarray(world_points, dtype=np.float64) - np.asarray(center, dtype=np.float64)) *
+                scale_factor).tolist()
+    cx, cy, cz = center[0], center[1], center[2]
+    sx, sy, sz = shifted_center[0], shifted_center[1], shifted_center[2]
+    return [[sx + (p[0] - cx) * scale_factor,
+             sy + (p[1] - cy) * scale_factor,
+             sz + (p[2] - cz) * scale_factor] for p in world_points]
+
+
+def euler_rotation_matrix(rot_x, rot_y, rot_z):
+    """Return the 3x3 row-major matrix Rz * Ry * Rx for rotations in degrees
+    
+    Applied to a column vector, this rotates about X first, then Y, then Z.
+    """
+    cx, sx = math.cos(math.radians(rot_x)), math.sin(math.radians(rot_x))
+    cy, sy = math.cos(math.radians(rot_y)), math.sin(math.radians(rot_y))
+    cz, sz = math.cos(math.radians(rot_z)), math.sin(math.radians(rot_z))
+    return [[cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx],
+            [sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx],
+            [-sy, cy * sx, cy * cx]]
+
+
+def rotate_and_offset_points(points, center, matrix, offset):
+    """Return (point - center) * matrix^T + center + offset for each point, as lists
+    
+    matrix may be None to only apply the offset.
+    """
+    if np is not None:
+        pts = np.asarray(points, dtype=np.float64)
+        if matrix is not None:
+            c = np.asarray(center, dtype=np.float64)
+            pts = (pts - c).dot(np.asarray(matrix, dtype=np.float64).T) + c
+        return (pts + np.asarray(offset, dtype=np.float64)).tolist()
+    ox, oy, oz = offset[0], offset[1], offset[2]
+    if matrix is None:
+        return [[p[0] + ox, p[1] + oy, p[2] + oz] for p in points]
+    cx, cy, cz = center[0], center[1], center[2]
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = matrix
+    result = []
+    for p in points:
+        x, y, z = p[0] - cx, p[1] - cy, p[2] - cz
+        result.append([m00 * x + m01 * y + m02 * z + cx + ox,
+                       m10 * x + m11 * y + m12 * z + cy + oy,
+                       m20 * x + m21 * y + m22 * z + cz + oz])
+    return result
+
+
+def _segment_distances_sq(points, lo, hi):
+    """Squared distances of points[lo + 1:hi] to the segment points[lo]..points[hi]"""
+    a = points[lo]
+    b = points[hi]
+    if np is not None:
+        d = points[lo + 1:hi] - a
+        ab = b - a
+        ab_len_sq = ab.dot(ab)
+        if ab_len_sq > 0.0:
+            t = np.clip(d.dot(ab) / ab_len_sq, 0.0, 1.0)
+            d = d - t[:, None] * ab
+        return (d * d).sum(axis=1)
+    ax, ay, az = a[0], a[1], a[2]
+    abx, aby, abz = b[0] - ax, b[1] - ay, b[2] - az
+    ab_len_sq = abx * abx + aby * aby + abz * abz
+    distances = []
+    for i in range(lo + 1, hi):
+        p = points[i]
+        dx, dy, dz = p[0] - ax, p[1] - ay, p[2] - az
+        if ab_len_sq > 0.0:
+            t = (dx * abx + dy * aby + dz * abz) / ab_len_sq
+            t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+            dx, dy, dz = dx - t * abx, dy - t * aby, dz - t * abz
+        distances.append(dx * dx + dy * dy + dz * dz)
+    return distances
+
+
+def douglas_peucker_simplify(points, tolerance_sq, points_array=None, max_points=None):
+    """Douglas-Peucker simplification of a 3D polyline against a squared tolerance
+    
+    Iterative (a heap of index ranges, worst offender first), so long polylines do not
+    recurse. With max_points, splitting stops once that many points are kept, so the
+    result keeps the most significant points rather than an arbitrary subset.
+    points_array may pass a precomputed (N, 3) float64 array of points when numpy is
+    available, for callers that simplify the same points at several tolerances.
+    """
+    count = len(points)
+    if count <= 2:
+        return list(points)
+    if np is not None:
+        pts = points_array if points_array is not None else np.asarray(points, dtype=np.float64)
+    else:
+        pts = points
+    
+    if max_points is None and _douglas_peucker_jit is not None:
+        # Uncapped: the kept set does not depend on split order, so the compiled
+        # stack kernel gives the same result
+        keep = _douglas_peucker_jit(pts, float(tolerance_sq)).tolist()
+        return [points[i] for i in range(count) if keep[i]]
+    
+    def farthest(lo, hi):
+        distances = _segment_distances_sq(pts, lo, hi)
+        if np is not None:
+            offset = int(np.argmax(distances))
+        else:
+            offset = max(range(len(distances)), key=distances.__getitem__)
+        return distances[offset], lo + 1 + offset
+    
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    kept_count = 2
+    heap = []
+    
+    def push(lo, hi):
+        if hi - lo >= 2:
+            distance_sq, split = farthest(lo, hi)
+            if distance_sq > tolerance_sq:
+                heapq.heappush(heap, (-distance_sq, lo, hi, split))
+    
+    push(0, count - 1)
+    while heap and (max_points is None or kept_count < max_points):
+        _, lo, hi, split = heapq.heappop(heap)
+        keep[split] = True
+        kept_count += 1
+        push(lo, split)
+        push(split, hi)
+    return [points[i] for i in range(count) if keep[i]]
+
+
+def subdivide_segments(points, counts):
+    """Return the polyline with counts[i] evenly spaced points inserted into segment i, as lists
+    
+    counts has one entry per segment (len(points) - 1); original points are kept.
+    """
+    if np is not None:
+        pts = np.asarray(points, dtype=np.float64)
+        steps = np.asarray(counts, dtype=np.int64) + 1
+        segments = np.repeat(np.arange(len(steps)), steps)
+        # Position of each output point within its segment: 0, 1/(k+1), ..., k/(k+1)
+        starts = np.cumsum(steps) - steps
+        t = (np.arange(segments.shape[0]) - starts[segments]) / steps[segments].astype(np.float64)
+        result = pts[segments] + t[:, None] * (pts[segments + 1] - pts[segments])
+        return result.tolist() + [pts[-1].tolist()]
+    result = []
+    for i, count in enumerate(counts):
+        a = points[i]
+        b = points[i + 1]
+        result.append(list(a))
+        for j in range(1, count + 1):
+            t = float(j) / (count + 1)
+            result.append([a[0] + t * (b[0] - a[0]),
+                           a[1] + t * (b[1] - a[1]),
+                           a[2] + t * (b[2] - a[2])])
+    result.append(list(points[-1]))
+    return result
+
+
+def sample_evenly(points, count):
+    """Return exactly count items of points at evenly spaced indices, keeping both ends
+    
+    Returns points unchanged when it has count or fewer items.
+    """
+    total = len(points)
+    if total <= count:
+        return points
+    if count < 2:
+        return [points[0]] if count == 1 else []
+    if np is not None:
+        indices = np.linspace(0, total - 1, count).round().astype(np.int64).tolist()
+    else:
+        scale = float(total - 1) / (count - 1)
+        indices = [int(round(i * scale)) for i in range(count)]
+    return [points[i] for i in indices]
+
+
+def _cluster_representatives_kernel(pts, order, radius_sq, max_count):
+    """Indices (in order) of points farther than the cluster radius from every earlier pick"""
+    accepted = np.empty(max_count, dtype=np.int64)
+    accepted_count = 0
+    for k in range(order.shape[0]):
+        index = order[k]
+        is_new_cluster = True
+        for j in range(accepted_count):
+            other = accepted[j]
+            dx = pts[index, 0] - pts[other, 0]
+            dy = pts[index, 1] - pts[other, 1]
+            dz = pts[index, 2] - pts[other, 2]
+            if dx * dx + dy * dy + dz * dz < radius_sq:
+                is_new_cluster = False
+                break
+        if is_new_cluster:
+            accepted[accepted_count] = index
+            accepted_count += 1
+            if accepted_count >= max_count:
+                break
+    return accepted[:accepted_count]
+
+
+def _douglas_peucker_kernel(pts, tolerance_sq):
+    """Keep mask of an (N, 3) polyline under Douglas-Peucker with a squared tolerance
+    
+    Same clamped point-to-segment distances and first-maximum split as
+    douglas_peucker_simplify, over an explicit stack of index ranges.
+    """
+    count = pts.shape[0]
+    keep = np.zeros(count, dtype=np.bool_)
+    keep[0] = True
+    keep[count - 1] = True
+    stack = np.empty((count, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = count - 1
+    depth = 1
+    while depth > 0:
+        depth -= 1
+        lo = stack[depth, 0]
+        hi = stack[depth, 1]
+        if hi - lo < 2:
+            continue
+        ax, ay, az = pts[lo, 0], pts[lo, 1], pts[lo, 2]
+        abx, aby, abz = pts[hi, 0] - ax, pts[hi, 1] - ay, pts[hi, 2] - az
+        ab_len_sq = abx * abx + aby * aby + abz * abz
+        split = -1
+        max_distance_sq = 0.0
+        for i in range(lo + 1, hi):
+            dx, dy, dz = pts[i, 0] - ax, pts[i, 1] - ay, pts[i, 2] - az
+            if ab_len_sq > 0.0:
+                t = (dx * abx + dy * aby + dz * abz) / ab_len_sq
+                if t < 0.0:
+                    t = 0.0
+                elif t > 1.0:
+                    t = 1.0
+                dx -= t * abx
+                dy -= t * aby
+                dz -= t * abz
+            distance_sq = dx * dx + dy * dy + dz * dz
+            if split < 0 or distance_sq > max_distance_sq:
+                max_distance_sq = distance_sq
+                split = i
+        if max_distance_sq > tolerance_sq:
+            keep[split] = True
+            stack[depth, 0] = split
+            stack[depth, 1] = hi
+            stack[depth + 1, 0] = lo
+            stack[depth + 1, 1] = split
+            depth += 2
+    return keep
+
+
+# Compiled on first use when Numba is available; None means use the NumPy/Python paths.
+# Compiled code is cached on disk so only the first session pays the compile time
+# (caching needs a source file, so not when this module is exec'd from the script editor)
+if njit is not None and np is not None:
+    _JIT_CACHE = '__file__' in globals()
+    _cluster_representatives_jit = njit(cache=_JIT_CACHE)(_cluster_representatives_kernel)
+    _douglas_peucker_jit = njit(cache=_JIT_CACHE)(_douglas_peucker_kernel)
+else:
+    _cluster_representatives_jit = None
+    _douglas_peucker_jit = None
+
+
+def vertices_max_distance(vertices, center, axes=(0, 1, 2)):
+    """Return the largest distance from center to any point, measured on the given axes"""
+    if np is not None:
+        axes = list(axes)
+        pts = np.asarray(vertices, dtype=np.float64)[:, axes]
+        offsets = pts - np.asarray(center, dtype=np.float64)[axes]
+        return float(np.sqrt((offsets * offsets).sum(axis=1).max()))
+    # Compare squared distances; one sqrt at the end. Center components are looked up
+    # once, not per vertex
+    axis_centers = [(axis, center[axis]) for axis in axes]
+    max_distance_sq = 0.0
+    for vertex in vertices:
+        distance_sq = 0.0
+        for axis, axis_center in axis_centers:
+            d = vertex[axis] - axis_center
+            distance_sq += d * d
+        if distance_sq > max_distance_sq:
+            max_distance_sq = distance_sq
+    return math.sqrt(max_distance_sq)
+
+
+# Reused for name lookups so existence checks never walk the DAG
+_LOOKUP_SELECTION = om2.MSelectionList()
+
+
+def find_node(name):
+    """Return the MObject for an exact node name, or None if it doesn't exist (or is ambiguous)"""
+    _LOOKUP_SELECTION.clear()
+    try:
+        _LOOKUP_SELECTION.add(name)
+    except Exception:
+        return None
+    if _LOOKUP_SELECTION.length() != 1:
+        return None
+    return _LOOKUP_SELECTION.getDependNode(0)
+
+
+def node_exists(name):
+    """MSelectionList-based replacement for cmds.objExists on plain node names"""
+    return find_node(name) is not None
+
+
+def find_dag_path(name):
+    """Return the MDagPath for an exact DAG node name, or None"""
+    _LOOKUP_SELECTION.clear()
+    try:
+        _LOOKUP_SELECTION.add(name)
+        if _LOOKUP_SELECTION.length() != 1:
+            return None
+        return _LOOKUP_SELECTION.getDagPath(0)
+    except Exception:
+        return None
+
+
+def find_shape_path(name, shape_type):
+    """Return the MDagPath of a shape of shape_type (an om2.MFn type), given the shape or
+    its transform (first non-intermediate shape), or None
+    """
+    path = find_dag_path(name)
+    if path is None:
+        return None
+    if path.apiType() == shape_type:
+        return path
+    
+    for index in range(path.childCount()):
+        child = path.child(index)
+        if child.apiType() == shape_type and not om2.MFnDagNode(child).isIntermediateObject:
+            path.push(child)
+            return path
+    return None
+
+
+def find_mesh_fn(name):
+    """Return an MFnMesh for a mesh shape, or for the visible mesh shape under a transform
+    
+    Returns None if the node doesn't exist or has no non-intermediate mesh shape.
+    """
+    path = find_shape_path(name, om2.MFn.kMesh)
+    return om2.MFnMesh(path) if path is not None else None
+
+
+def mesh_world_points(name):
+    """Return every vertex position of a mesh in world space as [x, y, z] lists, or None
+    
+    One MFnMesh.getPoints call instead of a cmds query per vertex.
+    """
+    mesh_fn = find_mesh_fn(name)
+    if mesh_fn is None:
+        return None
+    return [[point.x, point.y, point.z] for point in mesh_fn.getPoints(om2.MSpace.kWorld)]
+
+
+def set_shape_display_overrides(shapes, color_index, line_width=None, undoable=False):
+    """Enable the drawing override color (and optionally lineWidth) on shape nodes
+    
+    Writes the plugs through OpenMaya rather than one cmds.setAttr per attribute. Plug
+    writes bypass the undo queue, so pass undoable=True for persistent nodes (final
+    controls) to use cmds.setAttr instead.
+    """
+    if undoable:
+        for shape in shapes:
+            cmds.setAttr(shape + '.overrideEnabled', True)
+            cmds.setAttr(shape + '.overrideColor', color_index)
+            # lineWidth is not available on all curve types
+            if line_width is not None and cmds.attributeQuery('lineWidth', node=shape, exists=True):
+                cmds.setAttr(shape + '.lineWidth', line_width)
+        return
+    
+    selection = om2.MSelectionList()
+    for shape in shapes:
+        selection.add(shape)
+    
+    for index in range(selection.length()):
+        shape_fn = om2.MFnDependencyNode(selection.getDependNode(index))
+        shape_fn.findPlug('overrideEnabled', False).setBool(True)
+        shape_fn.findPlug('overrideColor', False).setInt(color_index)
+        # lineWidth is not available on all curve types
+        if line_width is not None and shape_fn.hasAttribute('lineWidth'):
+            shape_fn.findPlug('lineWidth', False).setFloat(line_width)
+
+
+def delete_nodes(nodes):
+    """Delete whichever of nodes still exist in one cmds.delete call (one undo step)
+    
+    Returns the number of nodes deleted.
+    """
+    existing = cmds.ls(nodes) if nodes else []
+    if not existing:
+        return 0
+    
+    cmds.undoInfo(openChunk=True)
+    try:
+        cmds.delete(existing)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    return len(existing)
+
+
+@contextlib.contextmanager
+def select_tool_context():
+    """Switch to the Select tool for the duration of a bulk edit
+    
+    Move/Rotate/Scale manipulators update on every node change, which makes long
+    create/xform/delete sequences much slower; the user's tool is restored afterwards.
+    """
+    previous_context = cmds.currentCtx()
+    cmds.setToolTo('selectSuperContext')
+    try:
+        yield
+    finally:
+        try:
+            cmds.setToolTo(previous_context)
+        except RuntimeError:
+            pass  # Context was deleted meanwhile; stay in Select
+
+
+@contextlib.contextmanager
+def suspended_scene_updates(chunk_name):
+    """Group a bulk edit into one undo step with viewport refresh and cycle checks off
+    
+    Each create/xform/constraint call otherwise redraws the viewport, pushes its own
+    undo entry and runs the cycle check; all three are restored when the block exits.
+    """
+    cycle_check = cmds.cycleCheck(query=True, evaluation=True)
+    cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+    cmds.refresh(suspend=True)
+    cmds.cycleCheck(evaluation=False)
+    try:
+        yield
+    finally:
+        cmds.cycleCheck(evaluation=cycle_check)
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+
+
+@contextlib.contextmanager
+def maintained_selection():
+    """Restore the current selection (minus deleted nodes) after the block"""
+    previous_selection = cmds.ls(selection=True, long=True) or []
+    try:
+        yield
+    finally:
+        remaining = cmds.ls(previous_selection, long=True) if previous_selection else []
+        if remaining:
+            cmds.select(remaining, replace=True)
+        else:
+            cmds.select(clear=True)
+
+
+# Case-insensitive name heuristics for rig groups and the controls under them
+_WEAPON_RIG_NAME_RE = re.compile(r'(?=.*weapon)(?=.*rig)', re.IGNORECASE | re.DOTALL)
+_CONTROL_CHILD_NAME_RE = re.compile(r'ctrl|control', re.IGNORECASE)
+
+# Preview curve names ("PREVIEW_<joint>_curve", plus any Maya clash suffix)
+_PREVIEW_CURVE_NAME_RE = re.compile(r'PREVIEW_(.+?)_curve')
+
+# Attribute name cleanup: runs of non-alphanumerics (underscore included), and any
+# character other than alphanumerics/underscore
+_NON_ALNUM_RUN_RE = re.compile(r'[\W_]+', re.UNICODE)
+_NON_WORD_CHAR_RE = re.compile(r'\W', re.UNICODE)
+
+# make_safe_attribute_name results ({display_name: attribute_name})
+SAFE_ATTRIBUTE_NAME_CACHE = {}
+
+# Common control naming patterns, in lookup priority order, and the matching ls globs
+CONTROL_NAME_FORMATS = ("{0}_ctrl", "{0}_control", "{0}Ctrl", "{0}Control", "ctrl_{0}", "control_{0}")
+CONTROL_NAME_GLOBS = tuple(fmt.format('*') for fmt in CONTROL_NAME_FORMATS)
+
+# Control color names (as listed in the color combo) to Maya override color indices
+MAYA_COLOR_INDEX = {
+    "yellow": 17,
+    "red": 13,
+    "blue": 6,
+    "green": 14,
+    "purple": 9,
+    "light blue": 18,
+    "orange": 12,
+    "pink": 20,
+    "light green": 19,
+    "white": 16
+}
+
+# Delay before spinbox edits (smoothness, global and per-joint offsets) refresh preview curves
+PREVIEW_REFRESH_DELAY_MS = 150
+
+# Delay before per-joint curve adjustments are auto-saved (a spinbox drag saves once)
+AUTOSAVE_DELAY_MS = 250
+
+
+def _encode_curve_settings(settings):
+    """Encode curve settings as indented JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2).encode('utf-8')
+
+
+def _decode_curve_settings(data):
+    """Decode curve settings file contents (JSON bytes)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _atomic_write_bytes(path, data):
+    """Write data to path via a temp file so a crash never leaves a partial file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    if hasattr(os, 'replace'):
+        os.replace(tmp_path, path)
+    else:
+        # Python 2: rename cannot overwrite on Windows
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(tmp_path, path)
+
+
+# Unit rectangular prism traced as one degree-1 curve (16 CVs); scaled per control
+BOX_CURVE_TEMPLATE = (
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+    (-1, -1, -1), (-1, -1, 1), (1, -1, 1), (1, 1, 1),
+    (-1, 1, 1), (-1, -1, 1), (1, -1, 1), (1, -1, -1),
+    (1, 1, -1), (1, 1, 1), (-1, 1, 1), (-1, 1, -1),
+)
+
+# Shape codes returned by _finalize_bbox
+BBOX_SHAPE_SPHERE = 0
+BBOX_SHAPE_CYLINDER = 1
+BBOX_SHAPE_CUBE = 2
+BBOX_SHAPE_NAMES = ("sphere", "cylinder", "cube")
+
+# Indexed by (tall * 1 + wide * 2); both bits set is unreachable but falls back to sphere
+_BBOX_SHAPE_BY_PATTERN = (BBOX_SHAPE_SPHERE, BBOX_SHAPE_CYLINDER, BBOX_SHAPE_CUBE, BBOX_SHAPE_SPHERE)
+
+
+def _finalize_bbox(mins, maxs):
+    """Return (control_scale, shape_code) for a bounding box given its min/max corners.
+    
+    Kept purely numeric so it stays cheap to call for every joint on re-analysis.
+    """
+    width = maxs[0] - mins[0]
+    height = maxs[1] - mins[1]
+    depth = maxs[2] - mins[2]
+    
+    # Use the largest dimension for scale, with minimum and maximum limits
+    max_dimension = max(width, height, depth)
+    scale = max(0.5, min(5.0, max_dimension * 1.2))
+    
+    # Suggest control shape based on mesh dimensions: bit 0 = tall, bit 1 = wide/long
+    horizontal = max(width, depth)
+    pattern = (height > horizontal * 1.5) + (horizontal > height * 2) * 2
+    
+    return scale, _BBOX_SHAPE_BY_PATTERN[pattern]
 
 
 class JointControlAssociation:
     """Class to store information about a joint-control association"""
     def __init__(self, joint_name, mesh_objects, control_name=None):
         self.joint_name = joint_name
-        self.mesh_objects = mesh_objects if isinstance(mesh_objects, list) else [mesh_objects]
+        if not isinstance(mesh_objects, (list, tuple)):
+            mesh_objects = (mesh_objects,)
+        # Interned tuple: mesh names repeat across joints, so share one string object each
+        self.mesh_objects = tuple(intern_string(str(m)) for m in mesh_objects)
         self.control_name = control_name
         self.has_control = control_name is not None
         self.bounding_box = None
@@ -68,6 +1128,7 @@ class JointControlAssociation:
         self.control_scale = 1.0  # Per-joint scale multiplier
         self.control_color = "red"  # Per-joint control color
         self.is_excluded = False  # Whether this joint is excluded from rigging
+        self.settings_dirty = False  # Curve settings edited since the last save
         
         # Per-joint curve offset settings
         self.curve_offset_x = 0.0
@@ -76,68 +1137,137 @@ class JointControlAssociation:
         self.curve_rotation_x = 0.0
         self.curve_rotation_y = 0.0
         self.curve_rotation_z = 0.0
+    
+    @property
+    def control_color_index(self):
+        """Maya override color index for control_color (red if unknown)"""
+        return MAYA_COLOR_INDEX.get(self.control_color, 13)
         
     def calculate_bounding_box(self):
         """Calculate combined bounding box of all mesh objects"""
         if not self.mesh_objects:
             return None
-            
-        all_bbox_points = []
-        
-        for mesh_obj in self.mesh_objects:
-            if cmds.objExists(mesh_obj):
-                try:
-                    bbox = cmds.exactWorldBoundingBox(mesh_obj)
-                    if bbox and len(bbox) >= 6:
-                        # Add all 8 corners of the bounding box
-                        all_bbox_points.extend([
-                            [bbox[0], bbox[1], bbox[2]],  # min corner
-                            [bbox[3], bbox[4], bbox[5]],  # max corner
-                            [bbox[0], bbox[1], bbox[5]],
-                            [bbox[0], bbox[4], bbox[2]],
-                            [bbox[0], bbox[4], bbox[5]],
-                            [bbox[3], bbox[1], bbox[2]],
-                            [bbox[3], bbox[1], bbox[5]],
-                            [bbox[3], bbox[4], bbox[2]]
-                        ])
-                except:
-                    print("Warning: Could not get bounding box for {0}".format(mesh_obj))
         
-        if not all_bbox_points:
+        # One exactWorldBoundingBox call returns the combined extents of every mesh
+        existing = [mesh_obj for mesh_obj in self.mesh_objects if cmds.objExists(mesh_obj)]
+        if not existing:
             return None
-            
+        try:
+            bbox = cmds.exactWorldBoundingBox(existing)
+        except:
+            print("Warning: Could not get bounding box for {0}".format(", ".join(existing)))
+            return None
+        if not bbox or len(bbox) < 6:
+            return None
+        
         # Calculate overall bounding box
-        min_x = min(p[0] for p in all_bbox_points)
-        max_x = max(p[0] for p in all_bbox_points)
-        min_y = min(p[1] for p in all_bbox_points)
-        max_y = max(p[1] for p in all_bbox_points)
-        min_z = min(p[2] for p in all_bbox_points)
-        max_z = max(p[2] for p in all_bbox_points)
+        min_x, min_y, min_z = bbox[0:3]
+        max_x, max_y, max_z = bbox[3:6]
         
         self.bounding_box = [min_x, min_y, min_z, max_x, max_y, max_z]
         
-        # Calculate control scale based on bounding box size
-        width = max_x - min_x
-        height = max_y - min_y
-        depth = max_z - min_z
-        
-        # Use the largest dimension for scale, with minimum and maximum limits
-        max_dimension = max(width, height, depth)
-        self.control_scale = max(0.5, min(5.0, max_dimension * 1.2))
-        
-        # Suggest control shape based on mesh dimensions
-        if height > width * 1.5 and height > depth * 1.5:
-            self.suggested_shape = "cylinder"  # Tall objects
-        elif width > height * 2 or depth > height * 2:
-            self.suggested_shape = "cube"      # Wide/long objects
-        else:
-            self.suggested_shape = "sphere"    # General purpose
+        # Derive control scale and shape suggestion from the bounds
+        scale, shape_code = _finalize_bbox((min_x, min_y, min_z), (max_x, max_y, max_z))
+        self.control_scale = scale
+        self.suggested_shape = BBOX_SHAPE_NAMES[shape_code]
             
         return self.bounding_box
 
 
+# Status column text colors (same as the .excluded-joint/.control-info/.no-control styles)
+ASSOCIATION_STATUS_COLORS = {
+    "excluded-joint": "#ff6b6b",
+    "control-info": "#90EE90",
+    "no-control": "#888888",
+}
+
+
+def association_status(association):
+    """Return (status_text, style_class) describing an association's control state"""
+    if association.is_excluded:
+        return "✖ EXCLUDED - will not create control", "excluded-joint"
+    if association.has_control:
+        return "✓ Control exists: " + association.control_name, "control-info"
+    return "○ No control - ready to create", "no-control"
+
+
+class JointAssociationModel(QAbstractTableModel):
+    """Table model listing joint associations, one row per joint"""
+    
+    COLUMNS = ("Joint", "Meshes", "Shape", "Status")
+    
+    def __init__(self, parent=None):
+        super(JointAssociationModel, self).__init__(parent)
+        self.associations = []
+        self.row_by_joint = {}
+    
+    def set_associations(self, associations):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self.associations = list(associations)
+        self.row_by_joint = dict((association.joint_name, row)
+                                 for row, association in enumerate(self.associations))
+        self.endResetModel()
+    
+    def association_at(self, row):
+        """Return the association shown in row, or None"""
+        if 0 <= row < len(self.associations):
+            return self.associations[row]
+        return None
+    
+    def refresh_joints(self, joint_names):
+        """Notify views that the rows of joint_names changed (no reset)"""
+        last_column = len(self.COLUMNS) - 1
+        for joint_name in joint_names:
+            row = self.row_by_joint.get(joint_name)
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+    
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.associations)
+    
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=None):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=None):
+        if not index.isValid():
+            return None
+        
+        association = self.associations[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return association.joint_name
+            if column == 1:
+                return ", ".join(association.mesh_objects)
+            if column == 2:
+                if association.bounding_box:
+                    return "{0} (scale: {1:.1f})".format(association.suggested_shape, association.control_scale)
+                return ""
+            return association_status(association)[0]
+        
+        if role == Qt.ForegroundRole and column == 3:
+            return QColor(ASSOCIATION_STATUS_COLORS[association_status(association)[1]])
+        
+        if role == Qt.ToolTipRole and column == 1:
+            return "\n".join(association.mesh_objects)
+        
+        return None
+
+
 class WeaponRigToolDialog(QDialog):
     def __init__(self, parent=None):
+        _lazy_import_qt()
         super(WeaponRigToolDialog, self).__init__(parent)
         self.setWindowTitle("Weapon Rig Tool - STALKER 2 Toolkit")
         self.setMinimumSize(900, 700)
@@ -145,18 +1275,36 @@ class WeaponRigToolDialog(QDialog):
         
         # Data
         self.joint_associations = []  # List of JointControlAssociation objects
+        self.associations_by_joint = {}  # {joint_name: JointControlAssociation}
+        self.association_counts = {'has_control': 0, 'excluded': 0, 'needs_control': 0}
         self.rig_group = None
+        self.verbose = False  # Per-item Script Editor logging (slow on large scenes)
         self.excluded_joints = set()  # Set of joint names to exclude from rigging
+        self.excluded_joints_sorted = []  # Same names kept in sorted order for the status label
         
         # Weapon detection and caching
         self.current_weapon_id = None
         self.current_weapon_path = None
         self.curve_settings_cache = {}
+        self.settings_path_cache = {}  # {(weapon_id, weapon_path, master_path): settings_file}
+        self.ensured_settings_dirs = set()  # Settings folders already created this session
+        
+        # Memoized scene queries (cleared by refresh_all)
+        self.joint_xform_cache = None  # {joint_name: (pos, rot)} while controls are being built
+        self.existing_control_names = None  # Names matching control patterns, built once per analysis
+        self.constraint_scan_cache = {}  # {constraint: (signature, constrained_object, target_list)}
+        
+        # Association shown in the shared curve adjustment panel
+        self.detail_association = None
+        
+        # Preview curves created by this tool, kept in step with creation/deletion
+        self.preview_curves = set()
+        self.sync_preview_curves()
         
         # Attachment detection
-        self.attachments_by_joint = {}  # {joint_name: [attachment_objects]}
-        self.attachment_names_by_joint = {}  # {joint_name: [attachment_names]}
-        self.attachment_categories_by_joint = {}  # {joint_name: [attachment_categories]}
+        self.attachments_by_joint = defaultdict(list)  # {joint_name: [attachment_objects]}
+        self.attachment_names_by_joint = defaultdict(list)  # {joint_name: [attachment_names]}
+        self.attachment_categories_by_joint = defaultdict(list)  # {joint_name: [attachment_categories]}
         
         # Load master path from weapon importer settings
         self.master_path = ""
@@ -188,6 +1336,10 @@ class WeaponRigToolDialog(QDialog):
     def refresh_all(self):
         """Refresh master path settings and re-analyze scene"""
         print("Refreshing weapon rig tool data...")
+        self.existing_control_names = None
+        self.constraint_scan_cache.clear()
+        self.settings_path_cache.clear()
+        self.sync_preview_curves()
         self.load_weapon_importer_settings()
         self.analyze_scene()
         
@@ -270,18 +1422,27 @@ class WeaponRigToolDialog(QDialog):
         assoc_header.setProperty("class", "section-header")
         assoc_layout.addWidget(assoc_header)
         
-        # Scroll area for associations
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setMinimumHeight(300)
-        
-        self.associations_widget = QWidget()
-        self.associations_layout = QVBoxLayout(self.associations_widget)
-        self.associations_layout.setSpacing(5)
-        self.associations_layout.setContentsMargins(5, 5, 5, 5)
-        
-        scroll_area.setWidget(self.associations_widget)
-        assoc_layout.addWidget(scroll_area)
+        # Association table; the selected row is edited in the adjustment panel below it
+        self.associations_model = JointAssociationModel(self)
+        self.associations_view = QTableView()
+        self.associations_view.setModel(self.associations_model)
+        self.associations_view.setSelectionBehavior(QTableView.SelectRows)
+        self.associations_view.setSelectionMode(QTableView.SingleSelection)
+        self.associations_view.setEditTriggers(QTableView.NoEditTriggers)
+        self.associations_view.setAlternatingRowColors(True)
+        self.associations_view.setWordWrap(False)
+        self.associations_view.verticalHeader().setVisible(False)
+        self.associations_view.horizontalHeader().setStretchLastSection(True)
+        self.associations_view.setMinimumHeight(300)
+        self.associations_view.selectionModel().currentRowChanged.connect(self.on_association_selection_changed)
+        assoc_layout.addWidget(self.associations_view)
+        
+        self.associations_empty_label = QLabel("No joint-mesh associations found.\n\nImport a weapon using the Weapon Importer to see associations here.")
+        self.associations_empty_label.setProperty("class", "info-label")
+        self.associations_empty_label.setAlignment(Qt.AlignCenter)
+        assoc_layout.addWidget(self.associations_empty_label)
+        
+        assoc_layout.addWidget(self.create_association_detail_panel())
         
         layout.addWidget(assoc_frame)
         
@@ -352,6 +1513,12 @@ class WeaponRigToolDialog(QDialog):
         self.smoothness_spin.setSingleStep(2)
         self.smoothness_spin.setToolTip("Number of control points for smooth curves (more = smoother but heavier)\nAffects both preview curves and final control curves")
         self.smoothness_spin.valueChanged.connect(self.on_smoothness_changed)
+        
+        # Debounce timer: a burst of spinbox changes triggers one preview refresh
+        self.preview_refresh_timer = QTimer(self)
+        self.preview_refresh_timer.setSingleShot(True)
+        self.preview_refresh_timer.setInterval(PREVIEW_REFRESH_DELAY_MS)
+        self.preview_refresh_timer.timeout.connect(self.refresh_existing_preview_curves)
         smoothness_layout.addWidget(self.smoothness_spin)
         
         smoothness_layout.addStretch()
@@ -391,6 +1558,7 @@ class WeaponRigToolDialog(QDialog):
         self.offset_x_spin.setSingleStep(0.1)
         self.offset_x_spin.setDecimals(2)
         self.offset_x_spin.setToolTip("Global offset for all curve points in X direction")
+        self.offset_x_spin.valueChanged.connect(self.on_global_offset_changed)
         global_offset_layout.addWidget(QLabel("X:"))
         global_offset_layout.addWidget(self.offset_x_spin)
         
@@ -400,6 +1568,7 @@ class WeaponRigToolDialog(QDialog):
         self.offset_y_spin.setSingleStep(0.1)
         self.offset_y_spin.setDecimals(2)
         self.offset_y_spin.setToolTip("Global offset for all curve points in Y direction")
+        self.offset_y_spin.valueChanged.connect(self.on_global_offset_changed)
         global_offset_layout.addWidget(QLabel("Y:"))
         global_offset_layout.addWidget(self.offset_y_spin)
         
@@ -409,6 +1578,7 @@ class WeaponRigToolDialog(QDialog):
         self.offset_z_spin.setSingleStep(0.1)
         self.offset_z_spin.setDecimals(2)
         self.offset_z_spin.setToolTip("Global offset for all curve points in Z direction")
+        self.offset_z_spin.valueChanged.connect(self.on_global_offset_changed)
         global_offset_layout.addWidget(QLabel("Z:"))
         global_offset_layout.addWidget(self.offset_z_spin)
         
@@ -441,7 +1611,7 @@ class WeaponRigToolDialog(QDialog):
         
         save_settings_btn = QPushButton("Save Settings Now")
         save_settings_btn.setProperty("class", "secondary-button")
-        save_settings_btn.clicked.connect(self.save_weapon_curve_settings)
+        save_settings_btn.clicked.connect(lambda: self.save_weapon_curve_settings(force=True))
         save_settings_btn.setToolTip("Manually save current curve settings for this weapon")
         cache_info_layout.addWidget(save_settings_btn)
         
@@ -525,7 +1695,12 @@ class WeaponRigToolDialog(QDialog):
         existing_header.setProperty("class", "section-header")
         existing_layout.addWidget(existing_header)
         
-        self.existing_rigs_list = QListWidget()
+        # Model/view list: repopulating is a single setStringList() call
+        self.rig_names = []
+        self.existing_rigs_model = QStringListModel()
+        self.existing_rigs_list = QListView()
+        self.existing_rigs_list.setModel(self.existing_rigs_model)
+        self.existing_rigs_list.setEditTriggers(QListView.NoEditTriggers)
         self.existing_rigs_list.setMinimumHeight(200)
         existing_layout.addWidget(self.existing_rigs_list)
         
@@ -550,7 +1725,7 @@ class WeaponRigToolDialog(QDialog):
         layout.addWidget(existing_frame)
         
         # Connect list selection
-        self.existing_rigs_list.itemSelectionChanged.connect(self.on_rig_selection_changed)
+        self.existing_rigs_list.selectionModel().selectionChanged.connect(self.on_rig_selection_changed)
         
         # Rig info section
         info_frame = QFrame()
@@ -572,313 +1747,18 @@ class WeaponRigToolDialog(QDialog):
     
     def setup_dark_style(self):
         """Apply dark theme styling consistent with STALKER 2 toolkit"""
-        dark_style = """
-        QDialog {
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        QLabel {
-            color: #ffffff;
-            font-size: 11px;
-        }
-        .title-label {
-            color: #ffffff;
-            font-size: 18px;
-            font-weight: bold;
-            padding: 10px;
-            background-color: #1a1a1a;
-            border: 2px solid #333333;
-            border-radius: 6px;
-            margin-bottom: 10px;
-        }
-        .section-header {
-            color: #cccccc;
-            font-size: 14px;
-            font-weight: bold;
-            padding: 8px 4px;
-            background-color: #252525;
-            border-left: 3px solid #0078d4;
-            margin-bottom: 8px;
-        }
-        .section-frame {
-            background-color: #222222;
-            border: 1px solid #333333;
-            border-radius: 4px;
-            padding: 10px;
-        }
-        .info-label {
-            color: #cccccc;
-            font-size: 10px;
-            background-color: #333333;
-            padding: 8px;
-            border-radius: 3px;
-            margin-top: 5px;
-        }
-        QPushButton {
-            background-color: #404040;
-            color: #ffffff;
-            border: 1px solid #555555;
-            padding: 8px 16px;
-            border-radius: 4px;
-            font-size: 11px;
-        }
-        QPushButton:hover {
-            background-color: #505050;
-            border: 1px solid #777777;
-        }
-        QPushButton:pressed {
-            background-color: #353535;
-        }
-        QPushButton:disabled {
-            background-color: #2a2a2a;
-            color: #666666;
-            border: 1px solid #333333;
-        }
-        .primary-button {
-            background-color: #0078d4;
-            color: #ffffff;
-            border: 1px solid #106ebe;
-            padding: 12px 20px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-        }
-        .primary-button:hover {
-            background-color: #106ebe;
-        }
-        .primary-button:pressed {
-            background-color: #005a9e;
-        }
-        .secondary-button {
-            background-color: #404040;
-            color: #ffffff;
-            border: 1px solid #555555;
-            padding: 8px 16px;
-            border-radius: 4px;
-        }
-        .secondary-button:hover {
-            background-color: #555555;
-        }
-        .create-all-button {
-            background-color: #228B22;
-            color: #ffffff;
-            border: 1px solid #32CD32;
-            padding: 10px 20px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-        }
-        .create-all-button:hover {
-            background-color: #32CD32;
-        }
-        .create-all-button:pressed {
-            background-color: #006400;
-        }
-        .complete-rig-button {
-            background-color: #8A2BE2;
-            color: #ffffff;
-            border: 1px solid #9370DB;
-            padding: 12px 24px;
-            border-radius: 4px;
-            font-size: 13px;
-            font-weight: bold;
-        }
-        .complete-rig-button:hover {
-            background-color: #9370DB;
-        }
-        .complete-rig-button:pressed {
-            background-color: #6A0DAD;
-        }
-        .warning-button {
-            background-color: #dc3545;
-            color: #ffffff;
-            border: 1px solid #c82333;
-            padding: 8px 16px;
-            border-radius: 4px;
-        }
-        .warning-button:hover {
-            background-color: #c82333;
-        }
-        .warning-button:pressed {
-            background-color: #a71e2a;
-        }
-        QLineEdit, QSpinBox, QDoubleSpinBox {
-            background-color: #404040;
-            color: #ffffff;
-            border: 1px solid #555555;
-            padding: 6px;
-            border-radius: 3px;
-            font-size: 11px;
-        }
-        QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {
-            border: 1px solid #0078d4;
-        }
-        QTabWidget::pane {
-            border: 1px solid #444444;
-            background-color: #222222;
-        }
-        QTabWidget::tab-bar {
-            alignment: left;
-        }
-        QTabBar::tab {
-            background-color: #333333;
-            color: #cccccc;
-            border: 1px solid #555555;
-            padding: 8px 16px;
-            margin-right: 2px;
-        }
-        QTabBar::tab:selected {
-            background-color: #0078d4;
-            color: #ffffff;
-        }
-        QTabBar::tab:hover {
-            background-color: #555555;
-        }
-        QListWidget {
-            background-color: #404040;
-            border: 1px solid #555555;
-            selection-background-color: #0078d4;
-            color: #ffffff;
-        }
-        QListWidget::item {
-            padding: 4px 8px;
-            border-bottom: 1px solid #555555;
-        }
-        QListWidget::item:selected {
-            background-color: #0078d4;
-        }
-        QListWidget::item:hover {
-            background-color: #505050;
-        }
-        QGroupBox {
-            color: #ffffff;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            margin-top: 8px;
-            padding-top: 8px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 8px;
-            padding: 0 4px 0 4px;
-            color: #cccccc;
-            font-weight: bold;
-        }
-        QRadioButton {
-            color: #ffffff;
-            font-size: 11px;
-            padding: 4px;
-        }
-        QRadioButton::indicator {
-            width: 16px;
-            height: 16px;
-            border: 2px solid #555555;
-            border-radius: 9px;
-            background-color: #404040;
-        }
-        QRadioButton::indicator:checked {
-            background-color: #0078d4;
-            border: 2px solid #106ebe;
-        }
-        QRadioButton::indicator:hover {
-            border: 2px solid #777777;
-        }
-        .joint-association {
-            background-color: #333333;
-            border: 1px solid #444444;
-            border-radius: 3px;
-            padding: 8px;
-            margin: 2px 0px;
-        }
-        .joint-name {
-            color: #ffffff;
-            font-size: 12px;
-            font-weight: bold;
-        }
-        .mesh-info {
-            color: #cccccc;
-            font-size: 10px;
-            margin-left: 10px;
-            margin-top: 2px;
-        }
-        .control-info {
-            color: #90EE90;
-            font-size: 10px;
-            margin-left: 10px;
-            margin-top: 2px;
-        }
-        .no-control {
-            color: #888888;
-            font-size: 10px;
-            font-style: italic;
-            margin-left: 10px;
-            margin-top: 2px;
-        }
-        .excluded-joint {
-            color: #ff6b6b;
-            font-size: 10px;
-            font-weight: bold;
-            margin-left: 10px;
-            margin-top: 2px;
-        }
-        .info-text {
-            color: #66ff66;
-            font-size: 11px;
-            font-style: italic;
-            padding: 2px 4px;
-        }
-        .curve-adjustment-frame {
-            background-color: #2a2a2a;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            margin: 3px 0px;
-        }
-        .toggle-button {
-            background-color: #404040;
-            color: #cccccc;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 4px 8px;
-            font-size: 10px;
-            text-align: left;
-        }
-        .toggle-button:hover {
-            background-color: #505050;
-        }
-        .toggle-button:checked {
-            background-color: #0078d4;
-            color: #ffffff;
-        }
-        .reset-button {
-            background-color: #666666;
-            color: #ffffff;
-            border: 1px solid #777777;
-            border-radius: 3px;
-            padding: 3px 6px;
-            font-size: 9px;
-        }
-        .reset-button:hover {
-            background-color: #777777;
-        }
-        .preview-button {
-            background-color: #228B22;
-            color: #ffffff;
-            border: 1px solid #32CD32;
-            border-radius: 3px;
-            padding: 3px 6px;
-            font-size: 9px;
-        }
-        .preview-button:hover {
-            background-color: #32CD32;
-        }
-        """
-        self.setStyleSheet(dark_style)
+        self.setStyleSheet(DARK_STYLE)
     
     def analyze_scene(self):
         """Analyze the current scene for joint-mesh associations"""
         print("\n=== ANALYZING SCENE FOR WEAPON RIG ===")
         
+        # Save pending edits to the current associations before they are replaced
+        self.flush_pending_autosave()
+        
         self.joint_associations = []
+        self.associations_by_joint = {}
+        self.existing_control_names = None  # Controls may have been created or deleted since last time
         
         # Detect current weapon and load cached settings
         self.detect_current_weapon()
@@ -886,64 +1766,73 @@ class WeaponRigToolDialog(QDialog):
         
         # Find all joints with constraints
         all_joints = cmds.ls(type='joint')
-        joints_with_meshes = {}
+        joints_with_meshes = defaultdict(set)
         
         print("Found {0} joints in scene".format(len(all_joints)))
         
         # Look for parent and scale constraints
         all_constraints = cmds.ls(type=['parentConstraint', 'scaleConstraint'])
         
+        # Bulk lookups: constraint types in one ls call, joints as a set for membership tests
+        typed_constraints = cmds.ls(all_constraints, showType=True) or []
+        constraint_types = dict(zip(typed_constraints[0::2], typed_constraints[1::2]))
+        joint_set = set(all_joints)
+        
+        # Reverse map constraint -> driven transform from one bulk listConnections call.
+        # With connections=True the result alternates [constraint.plug, destination, ...].
+        driven_candidates = defaultdict(list)
+        if all_constraints:
+            conn_pairs = cmds.listConnections(all_constraints, source=False, destination=True,
+                                              connections=True) or []
+            destinations = set(conn_pairs[1::2])
+            typed_destinations = cmds.ls(list(destinations), showType=True) if destinations else []
+            transform_nodes = set(node for node, node_type in zip(typed_destinations[0::2], typed_destinations[1::2])
+                                  if node_type == 'transform')
+            for plug, destination in zip(conn_pairs[0::2], conn_pairs[1::2]):
+                if destination in transform_nodes:
+                    driven_candidates[plug.split('.')[0]].append(destination)
+        
+        # Incoming connections (targets etc.) per constraint, used as a change signature
+        sources_by_constraint = defaultdict(set)
+        if all_constraints:
+            source_pairs = cmds.listConnections(all_constraints, source=True, destination=False,
+                                                connections=True) or []
+            for plug, source in zip(source_pairs[0::2], source_pairs[1::2]):
+                sources_by_constraint[plug.split('.')[0]].add(source)
+        
+        # Constraints whose connections are unchanged since the last scan reuse that result
+        previous_scan = self.constraint_scan_cache
+        self.constraint_scan_cache = {}
+        
         for constraint in all_constraints:
             try:
-                constraint_type = cmds.objectType(constraint)
-                
-                # Get constraint information using proper Maya constraint queries
-                if constraint_type == 'parentConstraint':
-                    # Get the drivers (source objects) and constrained object
-                    target_list = cmds.parentConstraint(constraint, query=True, targetList=True) or []
-                    weight_alias_list = cmds.parentConstraint(constraint, query=True, weightAliasList=True) or []
-                    
-                elif constraint_type == 'scaleConstraint':
-                    # Get the drivers (source objects) and constrained object  
-                    target_list = cmds.scaleConstraint(constraint, query=True, targetList=True) or []
-                    weight_alias_list = cmds.scaleConstraint(constraint, query=True, weightAliasList=True) or []
-                else:
+                constraint_type = constraint_types.get(constraint)
+                if constraint_type not in ('parentConstraint', 'scaleConstraint'):
                     continue
                 
-                # Get the constrained object by finding what the constraint is connected to
-                constrained_object = None
-                
-                # Check constraint connections to find the driven object
-                all_connections = cmds.listConnections(constraint, source=False, destination=True) or []
-                for conn in all_connections:
-                    if cmds.objectType(conn) == 'transform' and conn not in target_list:
-                        constrained_object = conn
-                        break
-                
-                if not constrained_object:
-                    # Alternative approach: check constraint node name for clues
-                    constraint_parts = constraint.split('_')
-                    if len(constraint_parts) > 1:
-                        potential_name = '_'.join(constraint_parts[:-1])  # Remove constraint suffix
-                        if cmds.objExists(potential_name):
-                            constrained_object = potential_name
+                driven = driven_candidates.get(constraint, ())
+                signature = (constraint_type, frozenset(sources_by_constraint.get(constraint, ())), tuple(driven))
+                cached = previous_scan.get(constraint)
+                if cached and cached[0] == signature:
+                    constrained_object, target_list = cached[1], cached[2]
+                else:
+                    constrained_object, target_list = self.resolve_constraint(constraint, constraint_type, driven)
+                self.constraint_scan_cache[constraint] = (signature, constrained_object, target_list)
                 
                 if not constrained_object or not target_list:
                     continue
                 
                 # Find joints in the target (driver) objects
-                joints_in_constraint = [obj for obj in target_list if cmds.objectType(obj) == 'joint']
+                joints_in_constraint = [obj for obj in target_list if obj in joint_set]
                 
                 if joints_in_constraint:
-                    print("Found constraint: {0} -> {1} driven by joints: {2}".format(
-                        constraint, constrained_object, ', '.join(joints_in_constraint)))
+                    if self.verbose:
+                        print("Found constraint: {0} -> {1} driven by joints: {2}".format(
+                            constraint, constrained_object, ', '.join(joints_in_constraint)))
                     
                     # Associate joints with the constrained mesh
                     for joint in joints_in_constraint:
-                        if joint not in joints_with_meshes:
-                            joints_with_meshes[joint] = []
-                        if constrained_object not in joints_with_meshes[joint]:
-                            joints_with_meshes[joint].append(constrained_object)
+                        joints_with_meshes[joint].add(constrained_object)
                         
             except Exception as e:
                 print("Warning: Error analyzing constraint {0}: {1}".format(constraint, str(e)))
@@ -951,8 +1840,7 @@ class WeaponRigToolDialog(QDialog):
         # Create associations
         for joint_name, mesh_objects in joints_with_meshes.items():
             if mesh_objects:  # Only include joints that have associated meshes
-                # Remove duplicates
-                unique_meshes = list(set(mesh_objects))
+                unique_meshes = list(mesh_objects)
                 
                 # Check if control already exists
                 control_name = self.find_existing_control(joint_name)
@@ -964,11 +1852,13 @@ class WeaponRigToolDialog(QDialog):
                 self.apply_cached_curve_settings(association)
                 
                 self.joint_associations.append(association)
+                self.associations_by_joint[joint_name] = association
                 
-                print("Joint '{0}' associated with meshes: {1}".format(
-                    joint_name, ', '.join(unique_meshes)))
-                if control_name:
-                    print("  -> Existing control found: {0}".format(control_name))
+                if self.verbose:
+                    print("Joint '{0}' associated with meshes: {1}".format(
+                        joint_name, ', '.join(unique_meshes)))
+                    if control_name:
+                        print("  -> Existing control found: {0}".format(control_name))
         
         # Update exclusion status for existing associations
         self.update_association_exclusions()
@@ -976,16 +1866,48 @@ class WeaponRigToolDialog(QDialog):
         # Detect attachments
         self.detect_attachments()
         
-        # Update UI
-        self.update_scene_info()
-        self.update_associations_display()
-        self.update_button_states()
-        self.update_existing_rigs_list()
-        self.update_exclusion_status()
-        self.update_cache_status()
+        # Update UI in one batch so the dialog repaints once, not after each section
+        self.setUpdatesEnabled(False)
+        try:
+            self.update_scene_info()
+            self.update_associations_display()
+            self.update_button_states()
+            self.update_existing_rigs_list()
+            self.update_exclusion_status()
+            self.update_cache_status()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
         
         print("Analysis complete: found {0} joint-mesh associations".format(len(self.joint_associations)))
     
+    def resolve_constraint(self, constraint, constraint_type, driven_candidates):
+        """Return (constrained_object, target_list) for a parent/scale constraint"""
+        # Get the drivers (source objects) using proper Maya constraint queries
+        if constraint_type == 'parentConstraint':
+            target_list = cmds.parentConstraint(constraint, query=True, targetList=True) or []
+        else:
+            target_list = cmds.scaleConstraint(constraint, query=True, targetList=True) or []
+        
+        # Get the constrained object by finding what the constraint is connected to
+        constrained_object = None
+        
+        # Check constraint connections to find the driven object
+        for conn in driven_candidates:
+            if conn not in target_list:
+                constrained_object = conn
+                break
+        
+        if not constrained_object:
+            # Alternative approach: check constraint node name for clues
+            constraint_parts = constraint.split('_')
+            if len(constraint_parts) > 1:
+                potential_name = '_'.join(constraint_parts[:-1])  # Remove constraint suffix
+                if node_exists(potential_name):
+                    constrained_object = potential_name
+        
+        return constrained_object, target_list
+    
     def detect_attachments(self):
         """Detect attachments in the S2_Attachments group"""
         print("\n=== DETECTING ATTACHMENTS ===")
@@ -996,17 +1918,20 @@ class WeaponRigToolDialog(QDialog):
         
         # Look for S2_Attachments group
         attachments_group = None
-        s2_groups = cmds.ls("S2_Attachments", type='transform')
+        group_node = find_node("S2_Attachments")
         
-        if s2_groups:
-            attachments_group = s2_groups[0]
+        if group_node is not None and group_node.hasFn(om2.MFn.kTransform):
+            attachments_group = "S2_Attachments"
             print("Found S2_Attachments group: {0}".format(attachments_group))
         else:
             print("No S2_Attachments group found in scene")
             return
         
-        # Get all transforms under the attachments group
-        attachment_transforms = cmds.listRelatives(attachments_group, children=True, type='transform') or []
+        # Get all transforms under the attachments group. Constraints are transforms too,
+        # so any constraint node parented directly under the group is left out
+        children = cmds.listRelatives(attachments_group, children=True, type='transform') or []
+        constraint_children = set(cmds.ls(children, type='constraint') or []) if children else set()
+        attachment_transforms = [child for child in children if child not in constraint_children]
         
         if not attachment_transforms:
             print("No attachment objects found in S2_Attachments group")
@@ -1014,34 +1939,46 @@ class WeaponRigToolDialog(QDialog):
         
         print("Found {0} attachment objects".format(len(attachment_transforms)))
         
+        # jnt_* joints as a set, filtered by name inside Maya in one ls call
+        jnt_set = set(cmds.ls('jnt_*', type='joint') or [])
+        
+        # Bulk-query constraints for every attachment at once (one call per constraint type).
+        # With connections=True the result alternates [attachment.plug, constraint, ...].
+        constraints_by_attachment = defaultdict(list)
+        for constraint_type in ('parentConstraint', 'scaleConstraint'):
+            conn_pairs = cmds.listConnections(attachment_transforms, type=constraint_type, connections=True) or []
+            for plug, constraint in zip(conn_pairs[0::2], conn_pairs[1::2]):
+                entry = (constraint, constraint_type)
+                attachment_constraints = constraints_by_attachment[plug.split('.')[0]]
+                if entry not in attachment_constraints:
+                    attachment_constraints.append(entry)
+        
+        # Category/display name attributes for every attachment, read through the API
+        attachment_metadata = self.read_string_attributes(
+            attachment_transforms, ('S2_AttachmentCategory', 'S2_AttachmentName'))
+        
+        # Joint drivers per constraint, queried once even if shared by several attachments
+        joint_targets_by_constraint = {}
+        
         # For each attachment, find which joint it's constrained to
         for attachment_obj in attachment_transforms:
             try:
-                # Find constraints on this attachment object
-                parent_constraints = cmds.listConnections(attachment_obj, type='parentConstraint') or []
-                scale_constraints = cmds.listConnections(attachment_obj, type='scaleConstraint') or []
-                constraints = parent_constraints + scale_constraints
-                
                 joint_name = None
-                for constraint in constraints:
+                for constraint, constraint_type in constraints_by_attachment.get(attachment_obj, ()):
                     try:
-                        constraint_type = cmds.objectType(constraint)
-                        
-                        # Get constraint drivers
-                        if constraint_type == 'parentConstraint':
-                            target_list = cmds.parentConstraint(constraint, query=True, targetList=True) or []
-                        elif constraint_type == 'scaleConstraint':
-                            target_list = cmds.scaleConstraint(constraint, query=True, targetList=True) or []
-                        else:
-                            continue
+                        if constraint not in joint_targets_by_constraint:
+                            # Get constraint drivers
+                            if constraint_type == 'parentConstraint':
+                                target_list = cmds.parentConstraint(constraint, query=True, targetList=True) or []
+                            else:
+                                target_list = cmds.scaleConstraint(constraint, query=True, targetList=True) or []
+                            joint_targets_by_constraint[constraint] = [
+                                target for target in target_list if target in jnt_set]
                         
-                        # Find joint in target list
-                        for target in target_list:
-                            if cmds.objectType(target) == 'joint' and target.startswith('jnt_'):
-                                joint_name = target
-                                break
-                        
-                        if joint_name:
+                        # First joint in target list
+                        joint_targets = joint_targets_by_constraint[constraint]
+                        if joint_targets:
+                            joint_name = joint_targets[0]
                             break
                     except:
                         continue
@@ -1051,30 +1988,24 @@ class WeaponRigToolDialog(QDialog):
                     category = "Uncategorized"  # Default category
                     display_name = attachment_obj  # Default to object name
                     
-                    try:
-                        if cmds.attributeQuery('S2_AttachmentCategory', node=attachment_obj, exists=True):
-                            category = cmds.getAttr(attachment_obj + '.S2_AttachmentCategory') or "Uncategorized"
-                    except:
-                        pass  # Use default if attribute can't be read
+                    metadata = attachment_metadata.get(attachment_obj, {})
+                    category = metadata.get('S2_AttachmentCategory') or category
+                    display_name = metadata.get('S2_AttachmentName') or display_name
                     
-                    try:
-                        if cmds.attributeQuery('S2_AttachmentName', node=attachment_obj, exists=True):
-                            display_name = cmds.getAttr(attachment_obj + '.S2_AttachmentName') or attachment_obj
-                    except:
-                        pass  # Use default if attribute can't be read
+                    # Categories/names repeat across many attachments; share one string each
+                    if isinstance(category, str):
+                        category = intern_string(category)
+                    if isinstance(display_name, str):
+                        display_name = intern_string(display_name)
                     
                     # Add attachment to the joint's lists
-                    if joint_name not in self.attachments_by_joint:
-                        self.attachments_by_joint[joint_name] = []
-                        self.attachment_names_by_joint[joint_name] = []
-                        self.attachment_categories_by_joint[joint_name] = []
-                    
                     self.attachments_by_joint[joint_name].append(attachment_obj)
                     self.attachment_names_by_joint[joint_name].append(display_name)
                     self.attachment_categories_by_joint[joint_name].append(category)
                     
-                    print("  Attachment '{0}' -> Category: '{1}', Name: '{2}' -> Joint '{3}'".format(
-                        attachment_obj, category, display_name, joint_name))
+                    if self.verbose:
+                        print("  Attachment '{0}' -> Category: '{1}', Name: '{2}' -> Joint '{3}'".format(
+                            attachment_obj, category, display_name, joint_name))
                 else:
                     print("  Warning: Could not find constraining joint for attachment '{0}'".format(attachment_obj))
                     
@@ -1086,8 +2017,44 @@ class WeaponRigToolDialog(QDialog):
         print("Attachment detection complete: found {0} attachments across {1} joints".format(
             total_attachments, len(self.attachments_by_joint)))
         
-        for joint_name, attachments in self.attachments_by_joint.items():
-            print("  Joint '{0}': {1} attachment(s)".format(joint_name, len(attachments)))
+        if self.verbose:
+            for joint_name, attachments in self.attachments_by_joint.items():
+                print("  Joint '{0}': {1} attachment(s)".format(joint_name, len(attachments)))
+    
+    def read_string_attributes(self, nodes, attr_names):
+        """Read string attributes from many nodes via API 2.0 without per-node MEL calls.
+        
+        Returns {node: {attr_name: value}}; missing attributes are simply absent.
+        """
+        results = dict((node, {}) for node in nodes)
+        
+        # One selection list for every node; track which index belongs to which node
+        sel = om2.MSelectionList()
+        indexed_nodes = []
+        for node in nodes:
+            try:
+                before = sel.length()
+                sel.add(node)
+                if sel.length() > before:
+                    indexed_nodes.append(node)
+            except Exception:
+                continue  # Node does not exist or name is ambiguous
+        
+        for index, node in enumerate(indexed_nodes):
+            dep_fn = om2.MFnDependencyNode(sel.getDependNode(index))
+            values = results[node]
+            for attr_name in attr_names:
+                if not dep_fn.hasAttribute(attr_name):
+                    continue
+                try:
+                    values[attr_name] = dep_fn.findPlug(attr_name, False).asString()
+                except Exception:
+                    # Non-string attribute; fall back to a regular getAttr
+                    try:
+                        values[attr_name] = cmds.getAttr("{0}.{1}".format(node, attr_name))
+                    except Exception:
+                        pass
+        return results
     
     def detect_current_weapon(self):
         """Detect the current weapon based on imported skeleton and metadata"""
@@ -1144,31 +2111,12 @@ class WeaponRigToolDialog(QDialog):
                         mesh_name = mesh_transform[0]
                         
                         # Check for patterns like SM_wpn_ak74_*, SM_ak_*, etc.
-                        if 'ak74' in mesh_name.lower():
-                            self.current_weapon_id = 'AK74'
-                            print("Detected weapon from mesh naming: AK74 (found: {0})".format(mesh_name))
-                            self.guess_weapon_path_from_id('AK74')
-                            return True
-                        elif 'ak_' in mesh_name.lower():
-                            self.current_weapon_id = 'AK74'
-                            print("Detected weapon from mesh naming: AK74 (found: {0})".format(mesh_name))
-                            self.guess_weapon_path_from_id('AK74')
+                        weapon_id = match_weapon_id_from_name(mesh_name)
+                        if weapon_id:
+                            self.current_weapon_id = weapon_id
+                            print("Detected weapon from mesh naming: {0} (found: {1})".format(weapon_id, mesh_name))
+                            self.guess_weapon_path_from_id(weapon_id)
                             return True
-                        
-                        # Add more weapon patterns as needed
-                        weapon_patterns = {
-                            'm16': 'M16',
-                            'm4': 'M4',
-                            'glock': 'GLOCK',
-                            'ar15': 'AR15'
-                        }
-                        
-                        for pattern, weapon_id in weapon_patterns.items():
-                            if pattern in mesh_name.lower():
-                                self.current_weapon_id = weapon_id
-                                print("Detected weapon from mesh naming: {0} (found: {1})".format(weapon_id, mesh_name))
-                                self.guess_weapon_path_from_id(weapon_id)
-                                return True
             
             # No weapon detected
             self.current_weapon_id = None
@@ -1188,75 +2136,11 @@ class WeaponRigToolDialog(QDialog):
                 print("No master path available - please configure master path in Weapon Importer first")
                 return
             
-            # Use the exact same weapon database as the weapon importer
-            weapon_categories = {
-                "Melee": [("Knife", "knife")],
-                "Pistols": [
-                    ("PTM", "pm"), ("UDP Compact", "udp"), ("APSB", "apb"), 
-                    ("Rhino", "rhino00000"), ("Kora-1911", "kora")
-                ],
-                "Shotguns": [
-                    ("Boomstick", "obrez"), ("TOZ-34", "toz34"), ("M680 Cracker", "m86000"),
-                    ("SPSA-14", "spsa00"), ("Saiga D-12", "d1200"), ("RAM-2", "ram2")
-                ],
-                "Submachine Guns": [
-                    ("Viper-5", "vip"), ("AKM-74U", "aku"), ("M10 Gordon", "m1000"),
-                    ("Buket S-2", "bucket0"), ("ZUBR-19", "zubr0"), ("Integral-A", "integ")
-                ],
-                "Assault Rifles": [
-                    ("AK74", "ak74"), ("Fora-221", "fora0"), ("Dnipro", "dnipro"),
-                    ("GROM S-14", "grim0"), ("AS Lavina", "lav"), ("AR416", "m160"),
-                    ("GP37", "gp37"), ("Kharod", "kharod000"), ("Sotnyk", "sotnyk")
-                ],
-                "Sniper Rifles": [
-                    ("SVU MK S-3", "svu"), ("SVDM-2", "svm"), ("VS Vintar", "vintar"),
-                    ("M701 Super", "m701"), ("Mark 1 EMR", "mar"), ("Three-Line Rifle", "threeline"),
-                    ("Gauss Rifle", "gauss")
-                ],
-                "Machine Guns": [
-                    ("RPM-74", "pkp00000"), ("PKP", "mgp")
-                ],
-                "Launchers": [
-                    ("RPG7U", "rpg7")
-                ],
-                "Grenades": [
-                    ("F1 Grenade", "f1"), ("RGD5 Grenade", "rgd5"), ("Smoke Grenade", "smoke")
-                ]
-            }
-            
-            # Category to folder mapping (same as weapon importer)
-            category_folders = {
-                "Melee": "knifes",
-                "Pistols": "pt",
-                "Shotguns": "shg", 
-                "Submachine Guns": "smg",
-                "Assault Rifles": "ar",
-                "Sniper Rifles": "sr",
-                "Machine Guns": "mg",
-                "Launchers": "gl",
-                "Grenades": "grenades"
-            }
-            
             # Find which category this weapon belongs to
-            found_category = None
-            found_weapon_id = None
-            
-            weapon_id_lower = weapon_id.lower()
-            
-            for category_name, weapons in weapon_categories.items():
-                for weapon_name, weapon_folder_id in weapons:
-                    # Check both exact match and case-insensitive match
-                    if (weapon_folder_id.lower() == weapon_id_lower or 
-                        weapon_folder_id == weapon_id or
-                        weapon_name.lower().replace(' ', '').replace('-', '') == weapon_id_lower):
-                        found_category = category_name
-                        found_weapon_id = weapon_folder_id
-                        break
-                if found_category:
-                    break
+            found_category, found_weapon_id = WEAPON_INDEX.get(weapon_id.lower(), (None, None))
             
-            if found_category and found_category in category_folders:
-                category_folder = category_folders[found_category]
+            if found_category and found_category in CATEGORY_FOLDERS:
+                category_folder = CATEGORY_FOLDERS[found_category]
                 weapon_path = os.path.join(self.master_path, "Source", "Weapons", category_folder, found_weapon_id)
                 
                 print("Found weapon '{0}' in category '{1}' (folder: {2})".format(
@@ -1275,11 +2159,46 @@ class WeaponRigToolDialog(QDialog):
                     return
             else:
                 print("Could not determine weapon path for: {0}".format(weapon_id))
-                print("Available weapon IDs: {0}".format([wid for cat_weapons in weapon_categories.values() for name, wid in cat_weapons]))
+                print("Available weapon IDs: {0}".format([wid for cat_weapons in WEAPON_CATEGORIES.values() for name, wid in cat_weapons]))
             
         except Exception as e:
             print("Error guessing weapon path: {0}".format(str(e)))
     
+    def resolve_curve_settings_path(self):
+        """Return the curve settings file for the current weapon.
+        
+        Memoized on (weapon id, weapon path, master path); creating the cache folder
+        is left to ensure_settings_dir() so loads never touch the disk beyond a stat.
+        """
+        cache_key = (self.current_weapon_id, self.current_weapon_path, self.master_path)
+        cached_path = self.settings_path_cache.get(cache_key)
+        if cached_path:
+            return cached_path
+        
+        if self.current_weapon_path and os.path.exists(self.current_weapon_path):
+            # Use weapon-specific folder
+            settings_file = os.path.join(self.current_weapon_path, "curve_settings.json")
+        else:
+            if self.master_path:
+                # Use master path cache directory if available
+                cache_dir = os.path.join(self.master_path, "Scripts", "weapon_cache")
+            else:
+                # Fallback to script directory
+                cache_dir = os.path.join(os.path.dirname(__file__), "weapon_cache")
+            settings_file = os.path.join(cache_dir, "{0}_curve_settings.json".format(self.current_weapon_id))
+        
+        self.settings_path_cache[cache_key] = settings_file
+        return settings_file
+    
+    def ensure_settings_dir(self, settings_file):
+        """Create the folder for a settings file once per session"""
+        settings_dir = os.path.dirname(settings_file)
+        if settings_dir in self.ensured_settings_dirs:
+            return
+        if not os.path.exists(settings_dir):
+            os.makedirs(settings_dir)
+        self.ensured_settings_dirs.add(settings_dir)
+    
     def load_weapon_curve_settings(self):
         """Load cached curve settings for the current weapon"""
         if not self.current_weapon_id:
@@ -1288,31 +2207,11 @@ class WeaponRigToolDialog(QDialog):
         
         try:
             # Determine settings file path
-            settings_file = None
-            
-            if self.current_weapon_path and os.path.exists(self.current_weapon_path):
-                # Use weapon-specific folder
-                settings_file = os.path.join(self.current_weapon_path, "curve_settings.json")
-            elif self.master_path:
-                # Use master path cache directory if available
-                cache_dir = os.path.join(self.master_path, "Scripts", "weapon_cache")
-                if not os.path.exists(cache_dir):
-                    try:
-                        os.makedirs(cache_dir)
-                    except:
-                        pass
-                settings_file = os.path.join(cache_dir, "{0}_curve_settings.json".format(self.current_weapon_id))
-            else:
-                # Fallback to script directory
-                script_dir = os.path.dirname(__file__)
-                cache_dir = os.path.join(script_dir, "weapon_cache")
-                if not os.path.exists(cache_dir):
-                    os.makedirs(cache_dir)
-                settings_file = os.path.join(cache_dir, "{0}_curve_settings.json".format(self.current_weapon_id))
+            settings_file = self.resolve_curve_settings_path()
             
             if os.path.exists(settings_file):
-                with open(settings_file, 'r') as f:
-                    self.curve_settings_cache = json.load(f)
+                with open(settings_file, 'rb') as f:
+                    self.curve_settings_cache = _decode_curve_settings(f.read())
                 print("Loaded curve settings for weapon: {0}".format(self.current_weapon_id))
                 print("Settings file: {0}".format(settings_file))
             else:
@@ -1323,18 +2222,24 @@ class WeaponRigToolDialog(QDialog):
             print("Error loading weapon curve settings: {0}".format(str(e)))
             self.curve_settings_cache = {}
     
-    def save_weapon_curve_settings(self):
-        """Save current curve settings for the current weapon"""
+    def save_weapon_curve_settings(self, force=False):
+        """Save current curve settings for the current weapon
+        
+        Only associations edited since the last save are merged into the cache and
+        the file is left untouched when nothing changed, unless force is True.
+        """
         if not self.current_weapon_id:
             print("No weapon detected, skipping curve settings save")
             return
         
+        changed = [a for a in self.joint_associations if force or a.settings_dirty]
+        if not changed:
+            return
+        
         try:
-            # Collect current settings from all associations
-            settings = {}
-            for association in self.joint_associations:
-                joint_name = association.joint_name
-                settings[joint_name] = {
+            # Merge settings from the changed associations into the cache
+            for association in changed:
+                self.curve_settings_cache[association.joint_name] = {
                     'curve_offset_x': association.curve_offset_x,
                     'curve_offset_y': association.curve_offset_y,
                     'curve_offset_z': association.curve_offset_z,
@@ -1345,36 +2250,22 @@ class WeaponRigToolDialog(QDialog):
                     'control_scale': getattr(association, 'control_scale', 1.0),
                     'control_color': getattr(association, 'control_color', 'red')
                 }
+            settings = self.curve_settings_cache
             
             # Determine settings file path
-            settings_file = None
+            settings_file = self.resolve_curve_settings_path()
             
-            if self.current_weapon_path and os.path.exists(self.current_weapon_path):
-                # Use weapon-specific folder
-                settings_file = os.path.join(self.current_weapon_path, "curve_settings.json")
-            elif self.master_path:
-                # Use master path cache directory if available
-                cache_dir = os.path.join(self.master_path, "Scripts", "weapon_cache")
-                if not os.path.exists(cache_dir):
-                    try:
-                        os.makedirs(cache_dir)
-                    except:
-                        pass
-                settings_file = os.path.join(cache_dir, "{0}_curve_settings.json".format(self.current_weapon_id))
-            else:
-                # Fallback to script directory
-                script_dir = os.path.dirname(__file__)
-                cache_dir = os.path.join(script_dir, "weapon_cache")
-                if not os.path.exists(cache_dir):
-                    os.makedirs(cache_dir)
-                settings_file = os.path.join(cache_dir, "{0}_curve_settings.json".format(self.current_weapon_id))
+            self.ensure_settings_dir(settings_file)
+            
+            # Save settings (JSON, written atomically)
+            _atomic_write_bytes(settings_file, _encode_curve_settings(settings))
             
-            # Save settings
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            for association in changed:
+                association.settings_dirty = False
             
-            print("Saved curve settings for weapon: {0}".format(self.current_weapon_id))
-            print("Settings file: {0}".format(settings_file))
+            if self.verbose:
+                print("Saved curve settings for weapon: {0}".format(self.current_weapon_id))
+                print("Settings file: {0}".format(settings_file))
             
         except Exception as e:
             print("Error saving weapon curve settings: {0}".format(str(e)))
@@ -1409,17 +2300,17 @@ class WeaponRigToolDialog(QDialog):
                 "Please select one or more joints to exclude from rig creation.")
             return
         
-        excluded_count = 0
-        for joint in selected_objects:
-            if joint not in self.excluded_joints:
-                self.excluded_joints.add(joint)
-                excluded_count += 1
-                print("Excluded joint: {0}".format(joint))
+        changed_joints = set(selected_objects) - self.excluded_joints
+        excluded_count = len(changed_joints)
+        for joint in changed_joints:
+            self.excluded_joints.add(joint)
+            bisect.insort(self.excluded_joints_sorted, joint)
+            if self.verbose:
+                print("Excluded joint: " + joint)
         
         if excluded_count > 0:
-            # Update association exclusion status
-            self.update_association_exclusions()
-            self.update_associations_display()
+            # Update exclusion status (and table rows) of the affected associations only
+            self.update_association_exclusions(changed_joints)
             self.update_button_states()
             self.update_exclusion_status()
             
@@ -1438,17 +2329,17 @@ class WeaponRigToolDialog(QDialog):
                 "Please select one or more joints to include back into rig creation.")
             return
         
-        included_count = 0
-        for joint in selected_objects:
-            if joint in self.excluded_joints:
-                self.excluded_joints.remove(joint)
-                included_count += 1
-                print("Included joint: {0}".format(joint))
+        changed_joints = self.excluded_joints.intersection(selected_objects)
+        included_count = len(changed_joints)
+        for joint in changed_joints:
+            self.excluded_joints.remove(joint)
+            del self.excluded_joints_sorted[bisect.bisect_left(self.excluded_joints_sorted, joint)]
+            if self.verbose:
+                print("Included joint: " + joint)
         
         if included_count > 0:
-            # Update association exclusion status
-            self.update_association_exclusions()
-            self.update_associations_display()
+            # Update exclusion status (and table rows) of the affected associations only
+            self.update_association_exclusions(changed_joints)
             self.update_button_states()
             self.update_exclusion_status()
             
@@ -1469,34 +2360,81 @@ class WeaponRigToolDialog(QDialog):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
         
         if reply == QMessageBox.Yes:
-            excluded_count = len(self.excluded_joints)
+            changed_joints = set(self.excluded_joints)
+            excluded_count = len(changed_joints)
             self.excluded_joints.clear()
+            del self.excluded_joints_sorted[:]
             
-            # Update association exclusion status
-            self.update_association_exclusions()
-            self.update_associations_display()
+            # Update exclusion status (and table rows) of the affected associations only
+            self.update_association_exclusions(changed_joints)
             self.update_button_states()
             self.update_exclusion_status()
             
             QMessageBox.information(self, "Exclusions Cleared", 
                 "Included {0} joint(s) back into rig creation.".format(excluded_count))
     
-    def update_association_exclusions(self):
-        """Update the exclusion status of all associations"""
+    def update_association_exclusions(self, changed_joints=None):
+        """Update the exclusion status of all associations, or only those of changed_joints"""
+        if changed_joints is None:
+            for association in self.joint_associations:
+                association.is_excluded = association.joint_name in self.excluded_joints
+            self.recount_associations()
+            return
+        
+        for joint_name in changed_joints:
+            association = self.associations_by_joint.get(joint_name)
+            if association is not None:
+                self.adjust_association_counts(association, -1)
+                association.is_excluded = joint_name in self.excluded_joints
+                self.adjust_association_counts(association, 1)
+        
+        # Repaint just the affected table rows
+        self.associations_model.refresh_joints(changed_joints)
+        if self.detail_association is not None and self.detail_association.joint_name in changed_joints:
+            self.show_association_details(self.detail_association)
+    
+    def adjust_association_counts(self, association, delta):
+        """Add (delta=1) or remove (delta=-1) an association's contribution to association_counts"""
+        counts = self.association_counts
+        if association.has_control:
+            counts['has_control'] += delta
+        if association.is_excluded:
+            counts['excluded'] += delta
+        elif not association.has_control:
+            counts['needs_control'] += delta
+    
+    def recount_associations(self):
+        """Rebuild association_counts from scratch (after a scene analysis)"""
+        self.association_counts = {'has_control': 0, 'excluded': 0, 'needs_control': 0}
         for association in self.joint_associations:
-            association.is_excluded = association.joint_name in self.excluded_joints
+            self.adjust_association_counts(association, 1)
+    
+    def get_active_control_associations(self):
+        """Associations that have a control and are not excluded, in association order"""
+        return [association for association in self.joint_associations
+                if association.has_control and not association.is_excluded]
+    
+    def mark_association_controlled(self, association, control_name):
+        """Record a newly created control on an association, keeping the counts in sync"""
+        self.adjust_association_counts(association, -1)
+        association.control_name = control_name
+        association.has_control = True
+        self.adjust_association_counts(association, 1)
     
     def update_exclusion_status(self):
         """Update the exclusion status label"""
         if not self.excluded_joints:
             self.exclusion_status_label.setText("No joints excluded")
         else:
-            excluded_list = sorted(list(self.excluded_joints))
-            if len(excluded_list) <= 5:
-                status_text = "Excluded joints: {0}".format(", ".join(excluded_list))
+            excluded_count = len(self.excluded_joints)
+            # excluded_joints_sorted is maintained incrementally, so only slice it here
+            first_joints = self.excluded_joints_sorted[:5]
+            
+            if excluded_count <= 5:
+                status_text = "Excluded joints: {0}".format(", ".join(first_joints))
             else:
                 status_text = "Excluded joints: {0} ... and {1} more".format(
-                    ", ".join(excluded_list[:5]), len(excluded_list) - 5)
+                    ", ".join(first_joints), excluded_count - 5)
             
             self.exclusion_status_label.setText(status_text)
     
@@ -1516,33 +2454,36 @@ class WeaponRigToolDialog(QDialog):
         
         self.cache_status_label.setText(status_text)
     
+    def collect_existing_control_names(self):
+        """Return the set of node names matching any control naming pattern (one ls call)
+        
+        Controls inside namespaces (e.g. referenced rigs) are included, indexed both by
+        their namespaced leaf name and with the namespaces stripped.
+        """
+        names = cmds.ls(*CONTROL_NAME_GLOBS, recursive=True) or []
+        # Non-unique names come back as partial paths; index them by their leaf name
+        leaf_names = set(name.rsplit('|', 1)[-1] for name in names)
+        return leaf_names | set(name.rsplit(':', 1)[-1] for name in leaf_names)
+    
     def find_existing_control(self, joint_name):
         """Check if a control already exists for this joint"""
-        # Common control naming patterns
-        possible_names = [
-            joint_name + "_ctrl",
-            joint_name + "_control",
-            joint_name + "Ctrl",
-            joint_name + "Control",
-            "ctrl_" + joint_name,
-            "control_" + joint_name
-        ]
-        
-        for name in possible_names:
-            if cmds.objExists(name):
-                return name
+        if self.existing_control_names is None:
+            self.existing_control_names = self.collect_existing_control_names()
         
-        return None
+        # First candidate (in naming-pattern priority order) present in the scene index
+        existing_names = self.existing_control_names
+        return next((name for name in (fmt.format(joint_name) for fmt in CONTROL_NAME_FORMATS)
+                     if name in existing_names), None)
     
     def update_scene_info(self):
         """Update the scene information display"""
         total_joints = len(cmds.ls(type='joint'))
         constrained_joints = len(self.joint_associations)
-        existing_controls = len([assoc for assoc in self.joint_associations if assoc.has_control])
-        excluded_joints = len([assoc for assoc in self.joint_associations if assoc.is_excluded])
+        # Maintained incrementally by update_association_exclusions/mark_association_controlled
+        existing_controls = self.association_counts['has_control']
+        excluded_joints = self.association_counts['excluded']
         available_joints = constrained_joints - excluded_joints
-        joints_needing_controls = len([assoc for assoc in self.joint_associations 
-                                     if not assoc.has_control and not assoc.is_excluded])
+        joints_needing_controls = self.association_counts['needs_control']
         
         info_text = "Scene Analysis Results:\n\n"
         
@@ -1587,328 +2528,252 @@ class WeaponRigToolDialog(QDialog):
     
     def update_associations_display(self):
         """Update the associations display"""
-        # Clear existing widgets
-        while self.associations_layout.count():
-            child = self.associations_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        selected_joint = self.detail_association.joint_name if self.detail_association else None
         
-        if not self.joint_associations:
-            no_assoc_label = QLabel("No joint-mesh associations found.\n\nImport a weapon using the Weapon Importer to see associations here.")
-            no_assoc_label.setProperty("class", "info-label")
-            no_assoc_label.setAlignment(Qt.AlignCenter)
-            self.associations_layout.addWidget(no_assoc_label)
+        # One model reset; the view only creates what is visible
+        self.associations_model.set_associations(self.joint_associations)
+        
+        has_associations = bool(self.joint_associations)
+        self.associations_view.setVisible(has_associations)
+        self.associations_empty_label.setVisible(not has_associations)
+        
+        # Keep the same joint selected across re-analysis
+        row = self.associations_model.row_by_joint.get(selected_joint)
+        if row is not None:
+            self.associations_view.setCurrentIndex(self.associations_model.index(row, 0))
+        else:
+            self.show_association_details(None)
+    
+    def on_association_selection_changed(self, current, previous=None):
+        """Load the selected association into the shared adjustment panel"""
+        association = self.associations_model.association_at(current.row()) if current.isValid() else None
+        self.show_association_details(association)
+    
+    def show_association_details(self, association):
+        """Show an association's curve settings in the adjustment panel (None clears it)"""
+        self.detail_association = association
+        
+        if association is None:
+            self.detail_title_label.setText("Curve Adjustments - select a joint above")
+            self.detail_status_label.setText("")
+            if self.detail_controls is not None:
+                self.detail_controls.setEnabled(False)
             return
         
-        # Create widgets for each association
-        for association in self.joint_associations:
-            assoc_widget = QFrame()
-            assoc_widget.setProperty("class", "joint-association")
-            assoc_layout = QVBoxLayout(assoc_widget)
-            assoc_layout.setContentsMargins(8, 8, 8, 8)
-            assoc_layout.setSpacing(4)
-            
-            # Joint name
-            joint_label = QLabel(association.joint_name)
-            joint_label.setProperty("class", "joint-name")
-            assoc_layout.addWidget(joint_label)
-            
-            # Mesh objects
-            mesh_text = "Meshes: {0}".format(", ".join(association.mesh_objects))
-            mesh_label = QLabel(mesh_text)
-            mesh_label.setProperty("class", "mesh-info")
-            mesh_label.setWordWrap(True)
-            assoc_layout.addWidget(mesh_label)
-            
-            # Shape suggestion
-            if association.bounding_box:
-                shape_text = "Suggested shape: {0} (scale: {1:.1f})".format(
-                    association.suggested_shape, association.control_scale)
-                shape_label = QLabel(shape_text)
-                shape_label.setProperty("class", "mesh-info")
-                assoc_layout.addWidget(shape_label)
-            
-            # Control status
-            if association.is_excluded:
-                control_text = "✖ EXCLUDED - will not create control"
-                control_label = QLabel(control_text)
-                control_label.setProperty("class", "excluded-joint")
-            elif association.has_control:
-                control_text = "✓ Control exists: {0}".format(association.control_name)
-                control_label = QLabel(control_text)
-                control_label.setProperty("class", "control-info")
-            else:
-                control_text = "○ No control - ready to create"
-                control_label = QLabel(control_text)
-                control_label.setProperty("class", "no-control")
-            
-            assoc_layout.addWidget(control_label)
-            
-            # Add per-joint curve offset controls (only if not excluded)
-            if not association.is_excluded:
-                self.add_per_joint_offset_controls(assoc_layout, association)
-            
-            self.associations_layout.addWidget(assoc_widget)
+        if self.detail_controls is None:
+            self.build_association_detail_controls()
         
-        # Add stretch at the end
-        self.associations_layout.addStretch()
+        self.detail_title_label.setText("Curve Adjustments - {0}".format(association.joint_name))
+        status_text, style_class = association_status(association)
+        self.detail_status_label.setText(status_text)
+        if self.detail_status_label.property("class") != style_class:
+            self.detail_status_label.setProperty("class", style_class)
+            # Re-evaluate the stylesheet for the new class selector
+            self.detail_status_label.style().unpolish(self.detail_status_label)
+            self.detail_status_label.style().polish(self.detail_status_label)
+        
+        # Excluded joints get no control, so there is nothing to adjust
+        self.detail_controls.setEnabled(not association.is_excluded)
+        
+        self.load_detail_widget_values(association)
     
-    def add_per_joint_offset_controls(self, layout, association):
-        """Add per-joint curve offset and rotation controls"""
+    def load_detail_widget_values(self, association):
+        """Copy an association's settings into the panel widgets without emitting change signals"""
+        # Loading values must not write them back, save or rebuild previews
+        widgets = list(self.detail_spins.values()) + list(self.detail_combos.values())
+        for widget in widgets:
+            widget.blockSignals(True)
         try:
-            # Create collapsible section for curve adjustments
-            adjustment_frame = QFrame()
-            adjustment_frame.setProperty("class", "curve-adjustment-frame")
-            adjustment_layout = QVBoxLayout(adjustment_frame)
-            adjustment_layout.setContentsMargins(10, 5, 10, 5)
-            adjustment_layout.setSpacing(3)
-            
-            # Toggle button for showing/hiding controls
-            toggle_btn = QPushButton("v Curve Adjustments")
-            toggle_btn.setProperty("class", "toggle-button")
-            toggle_btn.setCheckable(True)
-            toggle_btn.setChecked(False)
-            
-            # Controls container (initially hidden)
-            controls_container = QWidget()
-            controls_layout = QVBoxLayout(controls_container)
-            controls_layout.setContentsMargins(0, 5, 0, 0)
-            controls_layout.setSpacing(5)
-            
-            # Position offset controls
-            pos_layout = QHBoxLayout()
-            pos_layout.addWidget(QLabel("Position:"))
-            
-            # X offset
-            pos_x_spin = QDoubleSpinBox()
-            pos_x_spin.setRange(-999.0, 999.0)
-            pos_x_spin.setValue(association.curve_offset_x)
-            pos_x_spin.setSingleStep(0.1)
-            pos_x_spin.setDecimals(2)
-            pos_x_spin.setFixedWidth(60)
-            pos_x_spin.setToolTip("X position offset for this joint's curve points")
-            pos_layout.addWidget(QLabel("X:"))
-            pos_layout.addWidget(pos_x_spin)
-            
-            # Y offset
-            pos_y_spin = QDoubleSpinBox()
-            pos_y_spin.setRange(-999.0, 999.0)
-            pos_y_spin.setValue(association.curve_offset_y)
-            pos_y_spin.setSingleStep(0.1)
-            pos_y_spin.setDecimals(2)
-            pos_y_spin.setFixedWidth(60)
-            pos_y_spin.setToolTip("Y position offset for this joint's curve points")
-            pos_layout.addWidget(QLabel("Y:"))
-            pos_layout.addWidget(pos_y_spin)
-            
-            # Z offset
-            pos_z_spin = QDoubleSpinBox()
-            pos_z_spin.setRange(-999.0, 999.0)
-            pos_z_spin.setValue(association.curve_offset_z)
-            pos_z_spin.setSingleStep(0.1)
-            pos_z_spin.setDecimals(2)
-            pos_z_spin.setFixedWidth(60)
-            pos_z_spin.setToolTip("Z position offset for this joint's curve points")
-            pos_layout.addWidget(QLabel("Z:"))
-            pos_layout.addWidget(pos_z_spin)
-            
-            pos_layout.addStretch()
-            controls_layout.addLayout(pos_layout)
-            
-            # Rotation controls
-            rot_layout = QHBoxLayout()
-            rot_layout.addWidget(QLabel("Rotation:"))
-            
-            # X rotation
-            rot_x_spin = QDoubleSpinBox()
-            rot_x_spin.setRange(-180.0, 180.0)
-            rot_x_spin.setValue(association.curve_rotation_x)
-            rot_x_spin.setSingleStep(5.0)
-            rot_x_spin.setDecimals(1)
-            rot_x_spin.setFixedWidth(60)
-            rot_x_spin.setToolTip("X rotation for this joint's curve points (degrees)")
-            rot_layout.addWidget(QLabel("X:"))
-            rot_layout.addWidget(rot_x_spin)
-            
-            # Y rotation
-            rot_y_spin = QDoubleSpinBox()
-            rot_y_spin.setRange(-180.0, 180.0)
-            rot_y_spin.setValue(association.curve_rotation_y)
-            rot_y_spin.setSingleStep(5.0)
-            rot_y_spin.setDecimals(1)
-            rot_y_spin.setFixedWidth(60)
-            rot_y_spin.setToolTip("Y rotation for this joint's curve points (degrees)")
-            rot_layout.addWidget(QLabel("Y:"))
-            rot_layout.addWidget(rot_y_spin)
-            
-            # Z rotation
-            rot_z_spin = QDoubleSpinBox()
-            rot_z_spin.setRange(-180.0, 180.0)
-            rot_z_spin.setValue(association.curve_rotation_z)
-            rot_z_spin.setSingleStep(5.0)
-            rot_z_spin.setDecimals(1)
-            rot_z_spin.setFixedWidth(60)
-            rot_z_spin.setToolTip("Z rotation for this joint's curve points (degrees)")
-            rot_layout.addWidget(QLabel("Z:"))
-            rot_layout.addWidget(rot_z_spin)
-            
-            rot_layout.addStretch()
-            controls_layout.addLayout(rot_layout)
-            
-            # Control shape selection
-            shape_layout = QHBoxLayout()
-            shape_layout.addWidget(QLabel("Shape:"))
-            
-            shape_combo = QComboBox()
-            shape_combo.addItems(["Custom", "box", "cylinder", "sphere"])
-            shape_combo.setCurrentText(association.control_shape)
-            shape_combo.setFixedWidth(80)
-            shape_combo.setToolTip("Control shape type for this joint\nCustom = auto-generated from mesh geometry")
-            shape_layout.addWidget(shape_combo)
-            
-            shape_layout.addStretch()
-            controls_layout.addLayout(shape_layout)
-            
-            # Scale multiplier
-            scale_layout = QHBoxLayout()
-            scale_layout.addWidget(QLabel("Scale:"))
-            
-            scale_spin = QDoubleSpinBox()
-            scale_spin.setRange(0.1, 10.0)
-            scale_spin.setValue(association.control_scale)
-            scale_spin.setSingleStep(0.1)
-            scale_spin.setDecimals(1)
-            scale_spin.setFixedWidth(60)
-            scale_spin.setToolTip("Scale multiplier for this joint's control")
-            scale_layout.addWidget(scale_spin)
-            
-            scale_layout.addStretch()
-            controls_layout.addLayout(scale_layout)
-            
-            # Control color selection
-            color_layout = QHBoxLayout()
-            color_layout.addWidget(QLabel("Color:"))
-            
-            color_combo = QComboBox()
-            color_combo.addItems(["red", "yellow", "blue", "green", "purple", "light blue", "orange", "pink", "light green", "white"])
-            color_combo.setCurrentText(association.control_color)
-            color_combo.setFixedWidth(90)
-            color_combo.setToolTip("Control color for this joint")
-            color_layout.addWidget(color_combo)
-            
-            color_layout.addStretch()
-            controls_layout.addLayout(color_layout)
-            
-            # Action buttons
-            action_layout = QHBoxLayout()
-            
-            preview_btn = QPushButton("Preview")
-            preview_btn.setProperty("class", "preview-button")
-            preview_btn.setFixedWidth(60)
-            preview_btn.setToolTip("Create a preview of the curve with current settings")
-            action_layout.addWidget(preview_btn)
-            
-            reset_btn = QPushButton("Reset")
-            reset_btn.setProperty("class", "reset-button")
-            reset_btn.setFixedWidth(60)
-            reset_btn.setToolTip("Reset all curve adjustments for this joint")
-            action_layout.addWidget(reset_btn)
-            
-            action_layout.addStretch()
-            controls_layout.addLayout(action_layout)
-            
-            # Initially hide controls
-            controls_container.setVisible(False)
-            
-            # Connect toggle button
-            def toggle_controls():
-                visible = not controls_container.isVisible()
-                controls_container.setVisible(visible)
-                toggle_btn.setText("^ Curve Adjustments" if visible else "v Curve Adjustments")
-            
-            toggle_btn.clicked.connect(toggle_controls)
-            
-            # Connect value change signals to update association and auto-save
-            def update_pos_x(value):
-                association.curve_offset_x = value
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_pos_y(value):
-                association.curve_offset_y = value
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_pos_z(value):
-                association.curve_offset_z = value
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_rot_x(value):
-                association.curve_rotation_x = value
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_rot_y(value):
-                association.curve_rotation_y = value
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_rot_z(value):
-                association.curve_rotation_z = value
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_shape(text):
-                association.control_shape = text
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_scale(value):
-                association.control_scale = value
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def update_color(text):
-                association.control_color = text
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            def reset_values():
-                association.curve_offset_x = 0.0
-                association.curve_offset_y = 0.0
-                association.curve_offset_z = 0.0
-                association.curve_rotation_x = 0.0
-                association.curve_rotation_y = 0.0
-                association.curve_rotation_z = 0.0
-                association.control_shape = "Custom"
-                association.control_scale = 1.0
-                association.control_color = "red"
-                pos_x_spin.setValue(0.0)
-                pos_y_spin.setValue(0.0)
-                pos_z_spin.setValue(0.0)
-                rot_x_spin.setValue(0.0)
-                rot_y_spin.setValue(0.0)
-                rot_z_spin.setValue(0.0)
-                shape_combo.setCurrentText("Custom")
-                scale_spin.setValue(1.0)
-                color_combo.setCurrentText("red")
-                self.save_weapon_curve_settings()
-                self.update_preview_for_joint(association)
-            
-            def preview_curve():
-                self.create_preview_curve_for_joint(association)
-            
-            pos_x_spin.valueChanged.connect(update_pos_x)
-            pos_y_spin.valueChanged.connect(update_pos_y)
-            pos_z_spin.valueChanged.connect(update_pos_z)
-            rot_x_spin.valueChanged.connect(update_rot_x)
-            rot_y_spin.valueChanged.connect(update_rot_y)
-            rot_z_spin.valueChanged.connect(update_rot_z)
-            shape_combo.currentTextChanged.connect(update_shape)
-            scale_spin.valueChanged.connect(update_scale)
-            color_combo.currentTextChanged.connect(update_color)
-            reset_btn.clicked.connect(reset_values)
-            preview_btn.clicked.connect(preview_curve)
-            
-            # Add to layout
-            adjustment_layout.addWidget(toggle_btn)
-            adjustment_layout.addWidget(controls_container)
-            layout.addWidget(adjustment_frame)
-            
-        except Exception as e:
-            print("Error adding per-joint offset controls: {0}".format(str(e)))
+            for attr_name, spin in self.detail_spins.items():
+                spin.setValue(getattr(association, attr_name))
+            for attr_name, combo in self.detail_combos.items():
+                combo.setCurrentText(getattr(association, attr_name))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+    
+    def create_association_detail_panel(self):
+        """Build the curve offset/rotation panel shared by all associations
+        
+        The panel edits whichever association is selected in the table, so its
+        widgets are created once instead of once per joint. The adjustment
+        widgets themselves are only built when a joint is first selected.
+        """
+        adjustment_frame = QFrame()
+        adjustment_frame.setProperty("class", "curve-adjustment-frame")
+        adjustment_layout = QVBoxLayout(adjustment_frame)
+        adjustment_layout.setContentsMargins(10, 5, 10, 5)
+        adjustment_layout.setSpacing(3)
+        
+        self.detail_title_label = QLabel()
+        self.detail_title_label.setProperty("class", "joint-name")
+        adjustment_layout.addWidget(self.detail_title_label)
+        
+        self.detail_status_label = QLabel()
+        self.detail_status_label.setProperty("class", "no-control")
+        adjustment_layout.addWidget(self.detail_status_label)
+        
+        self.detail_layout = adjustment_layout
+        self.detail_controls = None  # Built by build_association_detail_controls()
+        
+        # Spinbox drags emit many valueChanged signals; save and rebuild previews once they settle
+        self.pending_preview_associations = {}  # {joint_name: association}
+        
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(AUTOSAVE_DELAY_MS)
+        self.autosave_timer.timeout.connect(self.save_weapon_curve_settings)
+        
+        self.joint_preview_timer = QTimer(self)
+        self.joint_preview_timer.setSingleShot(True)
+        self.joint_preview_timer.setInterval(PREVIEW_REFRESH_DELAY_MS)
+        self.joint_preview_timer.timeout.connect(self.flush_pending_joint_previews)
+        
+        self.show_association_details(None)
+        return adjustment_frame
+    
+    def build_association_detail_controls(self):
+        """Create the adjustment widgets of the shared panel (first selection only)"""
+        self.detail_controls = QWidget()
+        controls_layout = QVBoxLayout(self.detail_controls)
+        controls_layout.setContentsMargins(0, 5, 0, 0)
+        controls_layout.setSpacing(5)
+        
+        self.detail_spins = {}  # {association attribute: QDoubleSpinBox}
+        self.detail_combos = {}  # {association attribute: QComboBox}
+        
+        def add_spin(row_layout, label, attr_name, minimum, maximum, step, decimals, tooltip):
+            spin = QDoubleSpinBox()
+            spin.setRange(minimum, maximum)
+            spin.setSingleStep(step)
+            spin.setDecimals(decimals)
+            spin.setFixedWidth(60)
+            spin.setToolTip(tooltip)
+            if label:
+                row_layout.addWidget(QLabel(label))
+            row_layout.addWidget(spin)
+            self.detail_spins[attr_name] = spin
+        
+        # Position offset controls
+        pos_layout = QHBoxLayout()
+        pos_layout.addWidget(QLabel("Position:"))
+        for axis in ("X", "Y", "Z"):
+            add_spin(pos_layout, axis + ":", "curve_offset_" + axis.lower(), -999.0, 999.0, 0.1, 2,
+                     "{0} position offset for this joint's curve points".format(axis))
+        pos_layout.addStretch()
+        controls_layout.addLayout(pos_layout)
+        
+        # Rotation controls
+        rot_layout = QHBoxLayout()
+        rot_layout.addWidget(QLabel("Rotation:"))
+        for axis in ("X", "Y", "Z"):
+            add_spin(rot_layout, axis + ":", "curve_rotation_" + axis.lower(), -180.0, 180.0, 5.0, 1,
+                     "{0} rotation for this joint's curve points (degrees)".format(axis))
+        rot_layout.addStretch()
+        controls_layout.addLayout(rot_layout)
+        
+        # Control shape selection
+        shape_layout = QHBoxLayout()
+        shape_layout.addWidget(QLabel("Shape:"))
+        
+        shape_combo = QComboBox()
+        shape_combo.addItems(["Custom", "box", "cylinder", "sphere"])
+        shape_combo.setFixedWidth(80)
+        shape_combo.setToolTip("Control shape type for this joint\nCustom = auto-generated from mesh geometry")
+        shape_layout.addWidget(shape_combo)
+        self.detail_combos['control_shape'] = shape_combo
+        
+        shape_layout.addStretch()
+        controls_layout.addLayout(shape_layout)
+        
+        # Scale multiplier
+        scale_layout = QHBoxLayout()
+        scale_layout.addWidget(QLabel("Scale:"))
+        add_spin(scale_layout, None, 'control_scale', 0.1, 10.0, 0.1, 1,
+                 "Scale multiplier for this joint's control")
+        scale_layout.addStretch()
+        controls_layout.addLayout(scale_layout)
+        
+        # Control color selection
+        color_layout = QHBoxLayout()
+        color_layout.addWidget(QLabel("Color:"))
+        
+        color_combo = QComboBox()
+        color_combo.addItems(["red", "yellow", "blue", "green", "purple", "light blue", "orange", "pink", "light green", "white"])
+        color_combo.setFixedWidth(90)
+        color_combo.setToolTip("Control color for this joint")
+        color_layout.addWidget(color_combo)
+        self.detail_combos['control_color'] = color_combo
+        
+        color_layout.addStretch()
+        controls_layout.addLayout(color_layout)
+        
+        # Action buttons
+        action_layout = QHBoxLayout()
+        
+        preview_btn = QPushButton("Preview")
+        preview_btn.setProperty("class", "preview-button")
+        preview_btn.setFixedWidth(60)
+        preview_btn.setToolTip("Create a preview of the curve with current settings")
+        action_layout.addWidget(preview_btn)
+        
+        reset_btn = QPushButton("Reset")
+        reset_btn.setProperty("class", "reset-button")
+        reset_btn.setFixedWidth(60)
+        reset_btn.setToolTip("Reset all curve adjustments for this joint")
+        action_layout.addWidget(reset_btn)
+        
+        action_layout.addStretch()
+        controls_layout.addLayout(action_layout)
+        
+        # Connect value change signals to update the selected association and auto-save
+        for attr_name, spin in self.detail_spins.items():
+            spin.valueChanged.connect(partial(self.on_detail_value_changed, attr_name))
+        for attr_name, combo in self.detail_combos.items():
+            combo.currentTextChanged.connect(partial(self.on_detail_value_changed, attr_name))
+        reset_btn.clicked.connect(self.reset_detail_values)
+        preview_btn.clicked.connect(self.preview_detail_association)
+        
+        self.detail_layout.addWidget(self.detail_controls)
+    
+    def on_detail_value_changed(self, attr_name, value):
+        """Store an adjustment panel edit on the selected association (save/preview are debounced)"""
+        association = self.detail_association
+        if association is None:
+            return
+        setattr(association, attr_name, value)
+        self.associations_model.refresh_joints([association.joint_name])  # Shape column
+        association.settings_dirty = True
+        self.pending_preview_associations[association.joint_name] = association
+        self.autosave_timer.start()
+        self.joint_preview_timer.start()
+    
+    def reset_detail_values(self, *args):
+        """Reset all curve adjustments of the selected association"""
+        association = self.detail_association
+        if association is None:
+            return
+        association.curve_offset_x = 0.0
+        association.curve_offset_y = 0.0
+        association.curve_offset_z = 0.0
+        association.curve_rotation_x = 0.0
+        association.curve_rotation_y = 0.0
+        association.curve_rotation_z = 0.0
+        association.control_shape = "Custom"
+        association.control_scale = 1.0
+        association.control_color = "red"
+        
+        # Update the widgets silently, then save and rebuild the preview exactly once
+        self.load_detail_widget_values(association)
+        self.associations_model.refresh_joints([association.joint_name])
+        association.settings_dirty = True
+        self.save_weapon_curve_settings()
+        self.update_preview_for_joint(association)
+    
+    def preview_detail_association(self, *args):
+        """Create a preview curve for the selected association"""
+        if self.detail_association is not None:
+            self.create_preview_curve_for_joint(self.detail_association)
     
     def create_preview_curve_for_joint(self, association):
         """Create a preview curve for a specific joint with current settings"""
@@ -1941,42 +2806,44 @@ class WeaponRigToolDialog(QDialog):
                 if preview_curve and cmds.objExists(preview_curve):
                     # Calculate mesh center for basic shapes to match custom shape behavior
                     mesh_center = self.calculate_mesh_center_for_association(association)
-                    cmds.xform(preview_curve, worldSpace=True, translation=mesh_center)
+                    
+                    # One transform function set instead of a cmds.xform round-trip per value
+                    preview_fn = om2.MFnTransform(find_dag_path(preview_curve))
+                    preview_fn.setTranslation(om2.MVector(*mesh_center), om2.MSpace.kWorld)
                     
                     # Set pivot and orientation to match joint for proper constraint behavior (same as final controls)
-                    if cmds.objExists(association.joint_name):
-                        joint_pos = cmds.xform(association.joint_name, query=True, worldSpace=True, translation=True)
-                        joint_rot = cmds.xform(association.joint_name, query=True, worldSpace=True, rotation=True)
+                    joint_path = find_dag_path(association.joint_name)
+                    if joint_path is not None:
+                        # World position and rotation of the joint from its world matrix
+                        joint_matrix = om2.MTransformationMatrix(joint_path.inclusiveMatrix())
+                        joint_pos = om2.MPoint(joint_matrix.translation(om2.MSpace.kWorld))
                         
                         # First set the preview's orientation to match the joint
-                        cmds.xform(preview_curve, worldSpace=True, rotation=joint_rot)
+                        preview_fn.setRotation(joint_matrix.rotation(asQuaternion=True), om2.MSpace.kWorld)
                         
-                        # Then set the pivot to the joint position
-                        cmds.xform(preview_curve, worldSpace=True, rotatePivot=joint_pos)
-                        cmds.xform(preview_curve, worldSpace=True, scalePivot=joint_pos)
+                        # Then set the pivot to the joint position (compensated, like xform's default)
+                        preview_fn.setRotatePivot(joint_pos, om2.MSpace.kWorld, True)
+                        preview_fn.setScalePivot(joint_pos, om2.MSpace.kWorld, True)
                     
                     # Apply per-joint transforms if any
                     if (association.curve_offset_x != 0 or association.curve_offset_y != 0 or association.curve_offset_z != 0 or
                         association.curve_rotation_x != 0 or association.curve_rotation_y != 0 or association.curve_rotation_z != 0):
-                        self.apply_per_joint_transforms_to_curve(preview_curve, association)
+                        self.apply_per_joint_transforms_to_curve(preview_curve, association, is_preview=True)
                     
                     # Apply preview styling (per-joint color and preview attribute)
-                    color_index = self.get_maya_color_index(getattr(association, 'control_color', 'red'))
-                    shapes = cmds.listRelatives(preview_curve, shapes=True) or []
-                    for shape in shapes:
-                        cmds.setAttr(shape + '.overrideEnabled', True)
-                        cmds.setAttr(shape + '.overrideColor', color_index)  # Use per-joint color
-                        try:
-                            cmds.setAttr(shape + '.lineWidth', 3)  # Make it thick
-                        except:
-                            pass
+                    color_index = association.control_color_index
+                    shapes = cmds.listRelatives(preview_curve, shapes=True, fullPath=True) or []
+                    set_shape_display_overrides(shapes, color_index, line_width=3)  # Per-joint color, thick line
                     
-                    # Add preview attribute
-                    if not cmds.attributeQuery('isPreview', node=preview_curve, exists=True):
+                    # Add preview attribute (new curve, so no existence query; defaultValue sets it on)
+                    try:
                         cmds.addAttr(preview_curve, longName='isPreview', attributeType='bool', defaultValue=True)
-                        cmds.setAttr(preview_curve + '.isPreview', True)
+                    except RuntimeError:
+                        pass  # Already tagged
             
             if preview_curve and cmds.objExists(preview_curve):
+                self.preview_curves.add(preview_curve)
+                
                 # Select the preview curve for easy visibility
                 cmds.select(preview_curve, replace=True)
                 
@@ -1993,38 +2860,15 @@ class WeaponRigToolDialog(QDialog):
             QMessageBox.critical(self, "Preview Error", 
                 "Error creating preview curve: {0}".format(str(e)))
     
-    def get_maya_color_index(self, color_name):
-        """Convert color name to Maya color index"""
-        color_map = {
-            "yellow": 17,
-            "red": 13,
-            "blue": 6,
-            "green": 14,
-            "purple": 9,
-            "light blue": 18,
-            "orange": 12,
-            "pink": 20,
-            "light green": 19,
-            "white": 16
-        }
-        return color_map.get(color_name, 13)  # Default to red
-    
     def calculate_mesh_center_for_association(self, association):
         """Calculate the center point of all mesh objects for an association"""
         try:
-            all_vertices = []
-            
             # Get vertices from all mesh objects
-            for mesh_obj in association.mesh_objects:
-                if cmds.objExists(mesh_obj):
-                    vertices = self.get_mesh_vertices_world_space(mesh_obj)
-                    if vertices:
-                        all_vertices.extend(vertices)
+            all_vertices = self.get_association_vertices(association)
             
-            if all_vertices:
+            if len(all_vertices):
                 # Calculate center point
-                center = self.calculate_mesh_center(all_vertices)
-                return center
+                return self.calculate_mesh_center(all_vertices)
             else:
                 # Fallback to joint position if no mesh data
                 if cmds.objExists(association.joint_name):
@@ -2040,21 +2884,37 @@ class WeaponRigToolDialog(QDialog):
             else:
                 return [0, 0, 0]
     
+    def sync_preview_curves(self):
+        """Rebuild the tracked preview set from a full scene scan (authoritative)"""
+        self.preview_curves = set(cmds.ls("PREVIEW_*_curve*", type='transform') or [])
+        return sorted(self.preview_curves)
+    
+    def get_tracked_preview_curves(self, joint_name=None):
+        """Return tracked preview curves that still exist, optionally for a specific joint"""
+        if not self.preview_curves:
+            return []
+        
+        # One ls over the tracked names drops anything deleted or renamed outside the tool
+        self.preview_curves = set(cmds.ls(list(self.preview_curves), type='transform') or [])
+        if joint_name:
+            prefix = "PREVIEW_{0}_curve".format(joint_name)
+            return sorted(name for name in self.preview_curves if name.startswith(prefix))
+        return sorted(self.preview_curves)
+    
+    def delete_preview_curves(self, previews):
+        """Delete the given preview curves and stop tracking them; returns the count"""
+        deleted_count = delete_nodes(previews)
+        self.preview_curves.difference_update(previews)
+        return deleted_count
+    
     def cleanup_preview_curves(self, joint_name=None):
         """Clean up existing preview curves, optionally for a specific joint"""
         try:
-            if joint_name:
-                # Clean up preview for specific joint
-                preview_name = "PREVIEW_{0}_curve*".format(joint_name)
-                existing_previews = cmds.ls(preview_name, type='transform') or []
-            else:
-                # Clean up all preview curves
-                existing_previews = cmds.ls("PREVIEW_*_curve*", type='transform') or []
+            existing_previews = self.get_tracked_preview_curves(joint_name)
             
-            for preview in existing_previews:
-                if cmds.objExists(preview):
-                    cmds.delete(preview)
-                    print("Cleaned up preview curve: {0}".format(preview))
+            deleted_count = self.delete_preview_curves(existing_previews)
+            if deleted_count:
+                print("Cleaned up {0} preview curve(s)".format(deleted_count))
                     
         except Exception as e:
             print("Error cleaning up preview curves: {0}".format(str(e)))
@@ -2063,15 +2923,57 @@ class WeaponRigToolDialog(QDialog):
     
     def on_smoothness_changed(self, value):
         """Handle smoothness control value changes"""
-        print("Smoothness changed to: {0} points".format(value))
-        print("Note: New smoothness will be applied to the next preview curve you create.")
-        print("To update existing previews, use the 'Update Previews' button or recreate them manually.")
+        # Restart the countdown; the refresh runs once the value settles
+        self.preview_refresh_timer.start()
+    
+    def on_global_offset_changed(self, value):
+        """Handle global curve offset changes"""
+        self.preview_refresh_timer.start()
+    
+    def refresh_existing_preview_curves(self):
+        """Regenerate existing preview curves after smoothness/offset edits settle"""
+        existing_previews = self.get_tracked_preview_curves()
+        if not existing_previews:
+            print("Curve settings changed (smoothness: {0} points); applies to the next preview curve you create.".format(
+                self.smoothness_spin.value()))
+            return
+        
+        regenerated_count, failed_count = self.regenerate_preview_curves(existing_previews)
+        print("Refreshed {0} preview curve(s) ({1} failed)".format(regenerated_count, failed_count))
+    
+    def regenerate_preview_curves(self, existing_previews):
+        """Recreate the given preview curves; returns (regenerated_count, failed_count)"""
+        regenerated_count = 0
+        failed_count = 0
+        
+        for preview_curve in existing_previews:
+            try:
+                # Extract joint name from preview curve name
+                match = _PREVIEW_CURVE_NAME_RE.match(preview_curve)
+                if not match:
+                    continue
+                
+                # Find the association for this joint
+                association = self.associations_by_joint.get(match.group(1))
+                if association is not None:
+                    # Safely regenerate the preview curve
+                    self.create_preview_curve_for_joint(association)
+                    regenerated_count += 1
+                else:
+                    print("Warning: Could not find joint association for preview curve: {0}".format(preview_curve))
+                    failed_count += 1
+                        
+            except Exception as e:
+                print("Error regenerating preview for {0}: {1}".format(preview_curve, str(e)))
+                failed_count += 1
+        
+        return regenerated_count, failed_count
     
     def cleanup_all_preview_curves(self):
         """Clean up all preview curves in the scene"""
         try:
-            # Find all preview curves
-            existing_previews = cmds.ls("PREVIEW_*_curve*", type='transform') or []
+            # Full scene scan so previews left by earlier sessions are caught too
+            existing_previews = self.sync_preview_curves()
             
             if not existing_previews:
                 QMessageBox.information(self, "No Previews", "No preview curves found in the scene.")
@@ -2084,12 +2986,9 @@ class WeaponRigToolDialog(QDialog):
                 QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
             
             if reply == QMessageBox.Yes:
-                deleted_count = 0
-                for preview in existing_previews:
-                    if cmds.objExists(preview):
-                        cmds.delete(preview)
-                        deleted_count += 1
-                        print("Deleted preview curve: {0}".format(preview))
+                with select_tool_context(), maintained_selection():
+                    deleted_count = self.delete_preview_curves(existing_previews)
+                print("Deleted {0} preview curve(s)".format(deleted_count))
                 
                 QMessageBox.information(self, "Cleanup Complete", 
                     "Deleted {0} preview curve(s) from the scene.".format(deleted_count))
@@ -2103,7 +3002,7 @@ class WeaponRigToolDialog(QDialog):
         """Safely regenerate existing preview curves with current smoothness settings"""
         try:
             # Find all preview curves
-            existing_previews = cmds.ls("PREVIEW_*_curve*", type='transform') or []
+            existing_previews = self.get_tracked_preview_curves()
             
             if not existing_previews:
                 QMessageBox.information(self, "No Previews", "No preview curves found in the scene.")
@@ -2123,32 +3022,8 @@ class WeaponRigToolDialog(QDialog):
                 return
             
             # Find which joints have preview curves and regenerate them safely
-            regenerated_count = 0
-            failed_count = 0
-            
-            for preview_curve in existing_previews:
-                try:
-                    # Extract joint name from preview curve name
-                    if preview_curve.startswith("PREVIEW_") and "_curve" in preview_curve:
-                        joint_name = preview_curve.replace("PREVIEW_", "").split("_curve")[0]
-                        
-                        # Find the association for this joint
-                        association_found = False
-                        for association in self.joint_associations:
-                            if association.joint_name == joint_name:
-                                # Safely regenerate the preview curve
-                                self.create_preview_curve_for_joint(association)
-                                regenerated_count += 1
-                                association_found = True
-                                break
-                        
-                        if not association_found:
-                            print("Warning: Could not find joint association for preview curve: {0}".format(preview_curve))
-                            failed_count += 1
-                            
-                except Exception as e:
-                    print("Error regenerating preview for {0}: {1}".format(preview_curve, str(e)))
-                    failed_count += 1
+            with select_tool_context(), maintained_selection(), suspended_scene_updates("Update Preview Curves"):
+                regenerated_count, failed_count = self.regenerate_preview_curves(existing_previews)
             
             # Show results
             if regenerated_count > 0:
@@ -2168,12 +3043,29 @@ class WeaponRigToolDialog(QDialog):
             QMessageBox.critical(self, "Update Error", 
                 "Error updating preview curves: {0}".format(str(e)))
     
+    def flush_pending_joint_previews(self):
+        """Rebuild the previews of joints edited since the last debounce timeout"""
+        pending = self.pending_preview_associations
+        self.pending_preview_associations = {}
+        for association in pending.values():
+            self.update_preview_for_joint(association)
+    
+    def flush_pending_autosave(self):
+        """Write a pending debounced auto-save now instead of when its timer fires"""
+        if self.autosave_timer.isActive():
+            self.autosave_timer.stop()
+            self.save_weapon_curve_settings()
+    
+    def closeEvent(self, event):
+        """Write a pending debounced auto-save before the dialog closes"""
+        self.flush_pending_autosave()
+        super(WeaponRigToolDialog, self).closeEvent(event)
+    
     def update_preview_for_joint(self, association):
         """Update the preview curve for a specific joint if it exists"""
         try:
             # Check if a preview curve exists for this joint
-            preview_name = "PREVIEW_{0}_curve".format(association.joint_name)
-            if cmds.objExists(preview_name):
+            if self.get_tracked_preview_curves(association.joint_name):
                 # Preview exists, regenerate it with current settings
                 self.create_preview_curve_for_joint(association)
                 print("Auto-updated preview curve for joint: {0}".format(association.joint_name))
@@ -2185,9 +3077,12 @@ class WeaponRigToolDialog(QDialog):
     def update_button_states(self):
         """Update button enabled states based on current analysis"""
         has_associations = len(self.joint_associations) > 0
-        # Only count non-excluded joints for button enabling
-        has_unconstrained = len([a for a in self.joint_associations if not a.has_control and not a.is_excluded]) > 0
-        has_available = len([a for a in self.joint_associations if not a.is_excluded]) > 0
+        # Only count non-excluded joints for button enabling (counters are kept in sync
+        # with the associations, so no pass over joint_associations is needed here)
+        unconstrained_count = self.association_counts['needs_control']
+        excluded_count = self.association_counts['excluded']
+        has_unconstrained = unconstrained_count > 0
+        has_available = len(self.joint_associations) - excluded_count > 0
         
         self.create_all_btn.setEnabled(has_associations and has_unconstrained)
         self.create_complete_rig_btn.setEnabled(has_associations and has_available)
@@ -2200,8 +3095,6 @@ class WeaponRigToolDialog(QDialog):
         elif not has_unconstrained:
             self.progress_label.setText("All available joints already have controls. Use Rig Management to work with existing rigs.")
         else:
-            unconstrained_count = len([a for a in self.joint_associations if not a.has_control and not a.is_excluded])
-            excluded_count = len([a for a in self.joint_associations if a.is_excluded])
             if excluded_count > 0:
                 self.progress_label.setText("Ready to create controls for {0} joint(s). ({1} excluded)".format(
                     unconstrained_count, excluded_count))
@@ -2210,54 +3103,77 @@ class WeaponRigToolDialog(QDialog):
     
     def update_existing_rigs_list(self):
         """Update the list of existing weapon rigs"""
-        self.existing_rigs_list.clear()
-        
-        # Look for weapon rig groups in the scene
-        all_groups = cmds.ls(type='transform')
+        # Look for weapon rig groups in the scene (names are matched case-insensitively
+        # below, which ls wildcards cannot do)
+        all_groups = cmds.ls(type='transform') or []
         rig_groups = []
         
         for group in all_groups:
             # Look for groups that contain weapon rig elements
-            if ('weapon' in group.lower() and 'rig' in group.lower()) or group.startswith('S2_WeaponRig'):
+            if group.startswith('S2_WeaponRig') or _WEAPON_RIG_NAME_RE.match(group):
                 children = cmds.listRelatives(group, children=True) or []
                 # Check if it looks like a weapon rig (has controls and joints)
-                has_controls = any('ctrl' in child.lower() or 'control' in child.lower() for child in children)
+                has_controls = any(_CONTROL_CHILD_NAME_RE.search(child) for child in children)
                 if has_controls:
                     rig_groups.append(group)
         
-        # Add to list
-        for rig_group in rig_groups:
-            self.existing_rigs_list.addItem(rig_group)
+        # Same rigs as before: keep the model (and the user's selection) untouched
+        if rig_groups and rig_groups == self.rig_names:
+            self.on_rig_selection_changed()
+            return
         
-        if not rig_groups:
-            item = QListWidgetItem("No weapon rigs found in scene")
-            item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
-            self.existing_rigs_list.addItem(item)
+        # Populate the model in one assignment, without repaints or selection signals in between
+        self.rig_names = rig_groups
+        selection_model = self.existing_rigs_list.selectionModel()
+        self.existing_rigs_list.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            if rig_groups:
+                self.existing_rigs_list.setSelectionMode(QListView.SingleSelection)
+                self.existing_rigs_model.setStringList(rig_groups)
+            else:
+                # Placeholder row; not backed by rig_names so it can never be acted on
+                self.existing_rigs_list.setSelectionMode(QListView.NoSelection)
+                self.existing_rigs_model.setStringList(["No weapon rigs found in scene"])
+        finally:
+            selection_model.blockSignals(False)
+            self.existing_rigs_list.setUpdatesEnabled(True)
+        
+        # The reset dropped any selection; sync the rig buttons and info once
+        self.on_rig_selection_changed()
+    
+    def get_selected_rig_name(self):
+        """Return the currently selected rig name, or None"""
+        index = self.existing_rigs_list.currentIndex()
+        if index.isValid() and index.row() < len(self.rig_names):
+            selection_model = self.existing_rigs_list.selectionModel()
+            if selection_model.isSelected(index):
+                return self.rig_names[index.row()]
+        return None
     
-    def on_rig_selection_changed(self):
+    def on_rig_selection_changed(self, *args):
         """Handle rig selection change"""
-        current_item = self.existing_rigs_list.currentItem()
-        if current_item and current_item.flags() & Qt.ItemIsSelectable:
-            rig_name = current_item.text()
+        rig_name = self.get_selected_rig_name()
+        if rig_name:
             self.select_rig_btn.setEnabled(True)
             self.delete_rig_btn.setEnabled(True)
             
             # Show rig info
             if cmds.objExists(rig_name):
                 children = cmds.listRelatives(rig_name, children=True) or []
-                controls = [child for child in children if 'ctrl' in child.lower() or 'control' in child.lower()]
+                controls = [child for child in children if _CONTROL_CHILD_NAME_RE.search(child)]
                 
-                info_text = "Rig: {0}\n\n".format(rig_name)
-                info_text += "Controls: {0}\n\n".format(len(controls))
+                # Collect the pieces and join once instead of growing a string per line
+                info_parts = ["Rig: {0}\n\n".format(rig_name),
+                              "Controls: {0}\n\n".format(len(controls))]
                 
                 if controls:
-                    info_text += "Control list:\n"
-                    for control in controls[:10]:  # Show first 10
-                        info_text += "- {0}\n".format(control)
+                    info_parts.append("Control list:\n")
+                    info_parts.extend("- {0}\n".format(control) for control in controls[:10])  # Show first 10
                     if len(controls) > 10:
-                        info_text += "... and {0} more".format(len(controls) - 10)
+                        info_parts.append("... and {0} more".format(len(controls) - 10))
                 
-                self.rig_info_label.setText(info_text)
+                self.rig_info_label.setText("".join(info_parts))
             else:
                 self.rig_info_label.setText("Rig group no longer exists in scene")
         else:
@@ -2283,45 +3199,48 @@ class WeaponRigToolDialog(QDialog):
             QMessageBox.warning(self, "No Associations", "No joint-mesh associations found. Analyze the scene first.")
             return
         
-        unconstrained = [assoc for assoc in self.joint_associations if not assoc.has_control and not assoc.is_excluded]
-        if not unconstrained:
+        if not self.association_counts['needs_control']:
             QMessageBox.information(self, "All Controls Exist", "All available joints already have controls or are excluded.")
             return
+        unconstrained = [assoc for assoc in self.joint_associations if not assoc.has_control and not assoc.is_excluded]
         
         try:
+            # Joint transforms don't change while controls are built; query each once
+            self.joint_xform_cache = {}
+            self.prefetch_joint_world_xforms(unconstrained)
             created_controls = []
             failed_controls = []
             
-            for association in unconstrained:
-                control_name = self.create_control_for_joint(association)
-                if control_name:
-                    created_controls.append(control_name)
-                    association.control_name = control_name
-                    association.has_control = True
-                else:
-                    failed_controls.append(association.joint_name)
-            
-            # Freeze transforms on created controls
-            if created_controls:
-                self.freeze_all_control_transforms()
+            with select_tool_context(), maintained_selection(), suspended_scene_updates("Create Weapon Controls"):
+                for association in unconstrained:
+                    control_name = self.create_control_for_joint(association)
+                    if control_name:
+                        created_controls.append(control_name)
+                        self.mark_association_controlled(association, control_name)
+                    else:
+                        failed_controls.append(association.joint_name)
+                
+                # Freeze transforms on created controls
+                if created_controls:
+                    self.freeze_all_control_transforms()
             
             # Show results
-            message = "Control creation completed!\n\n"
-            message += "Created: {0} controls\n".format(len(created_controls))
-            message += "Failed: {0} controls\n\n".format(len(failed_controls))
+            # Collect the pieces and join once; the failed list can be long
+            message_parts = ["Control creation completed!\n\n",
+                             "Created: {0} controls\n".format(len(created_controls)),
+                             "Failed: {0} controls\n\n".format(len(failed_controls))]
             
             if created_controls:
-                message += "Successfully created controls:\n"
-                for control in created_controls[:10]:  # Show first 10
-                    message += "- {0}\n".format(control)
+                message_parts.append("Successfully created controls:\n")
+                message_parts.extend("- {0}\n".format(control) for control in created_controls[:10])  # Show first 10
                 if len(created_controls) > 10:
-                    message += "... and {0} more\n".format(len(created_controls) - 10)
+                    message_parts.append("... and {0} more\n".format(len(created_controls) - 10))
             
             if failed_controls:
-                message += "\nFailed to create controls for:\n"
-                for joint in failed_controls:
-                    message += "- {0}\n".format(joint)
+                message_parts.append("\nFailed to create controls for:\n")
+                message_parts.extend("- {0}\n".format(joint) for joint in failed_controls)
             
+            message = "".join(message_parts)
             if failed_controls:
                 QMessageBox.warning(self, "Creation Complete (with errors)", message)
             else:
@@ -2332,6 +3251,8 @@ class WeaponRigToolDialog(QDialog):
             
         except Exception as e:
             QMessageBox.critical(self, "Creation Error", "Error creating controls: {0}".format(str(e)))
+        finally:
+            self.joint_xform_cache = None
     
     def create_complete_rig(self):
         """Create a complete weapon rig with controls, constraints, and organization"""
@@ -2340,36 +3261,38 @@ class WeaponRigToolDialog(QDialog):
             return
         
         try:
-            # Clean up any existing preview curves before creating the final rig
-            existing_previews = cmds.ls("PREVIEW_*_curve*", type='transform') or []
-            if existing_previews:
-                for preview in existing_previews:
-                    if cmds.objExists(preview):
-                        cmds.delete(preview)
-                print("Cleaned up {0} preview curves before creating rig".format(len(existing_previews)))
-            # Create all missing controls first (excluding excluded joints)
-            unconstrained = [assoc for assoc in self.joint_associations if not assoc.has_control and not assoc.is_excluded]
-            if unconstrained:
-                for association in unconstrained:
-                    control_name = self.create_control_for_joint(association)
-                    if control_name:
-                        association.control_name = control_name
-                        association.has_control = True
-            
-            # Create rig hierarchy
-            rig_group = self.create_rig_hierarchy()
-            
-            # IMPORTANT: Freeze all control transforms before creating constraints
-            self.freeze_all_control_transforms()
-            
-            # Set up constraints from joints to controls
-            self.setup_rig_constraints()
-            
-            # Set up attachment switching attributes
-            self.setup_attachment_attributes(rig_group)
+            # Joint transforms don't change while the rig is built; query each once
+            self.joint_xform_cache = {}
+            
+            with select_tool_context(), maintained_selection(), suspended_scene_updates("Create Weapon Rig"):
+                # Clean up any existing preview curves before creating the final rig
+                existing_previews = self.get_tracked_preview_curves()
+                if existing_previews:
+                    deleted_count = self.delete_preview_curves(existing_previews)
+                    print("Cleaned up {0} preview curves before creating rig".format(deleted_count))
+                # Create all missing controls first (excluding excluded joints)
+                unconstrained = [assoc for assoc in self.joint_associations if not assoc.has_control and not assoc.is_excluded]
+                if unconstrained:
+                    self.prefetch_joint_world_xforms(unconstrained)
+                    for association in unconstrained:
+                        control_name = self.create_control_for_joint(association)
+                        if control_name:
+                            self.mark_association_controlled(association, control_name)
+                
+                # Create rig hierarchy
+                rig_group = self.create_rig_hierarchy()
+                
+                # IMPORTANT: Freeze all control transforms before creating constraints
+                self.freeze_all_control_transforms()
+                
+                # Set up constraints from joints to controls
+                self.setup_rig_constraints()
+                
+                # Set up attachment switching attributes
+                self.setup_attachment_attributes(rig_group)
             
             # Show completion message
-            controls_count = len([assoc for assoc in self.joint_associations if assoc.has_control])
+            controls_count = self.association_counts['has_control']
             
             # Count attachment categories and display names
             attachment_categories = []
@@ -2384,34 +3307,36 @@ class WeaponRigToolDialog(QDialog):
                     total_display_names += len(attachment_names)
                 attachment_categories = list(categories)
             
-            message = "Complete weapon rig created successfully!\n\n"
-            message += "Rig group: {0}\n".format(rig_group)
-            message += "Controls created: {0}\n".format(controls_count)
-            message += "Constraint setup: Complete\n"
+            message_parts = ["Complete weapon rig created successfully!\n\n",
+                             "Rig group: {0}\n".format(rig_group),
+                             "Controls created: {0}\n".format(controls_count),
+                             "Constraint setup: Complete\n"]
             
             if attachment_categories:
-                message += "Attachment categories: {0}\n".format(len(attachment_categories))
-                message += "  Categories: {0}\n".format(", ".join(attachment_categories))
-                message += "  Total attachments: {0}\n".format(total_display_names)
+                message_parts.append("Attachment categories: {0}\n".format(len(attachment_categories)))
+                message_parts.append("  Categories: {0}\n".format(", ".join(attachment_categories)))
+                message_parts.append("  Total attachments: {0}\n".format(total_display_names))
             else:
-                message += "Attachment categories: None\n"
+                message_parts.append("Attachment categories: None\n")
             
-            message += "\nThe weapon rig is now ready for animation.\n"
-            message += "Animate the control curves to pose the weapon parts."
+            message_parts.append("\nThe weapon rig is now ready for animation.\n")
+            message_parts.append("Animate the control curves to pose the weapon parts.")
             
             if attachment_categories:
-                message += "\n\nAttachment switching (Two-Tier System):"
-                for category in attachment_categories:
-                    attr_name = self.make_safe_attribute_name(category)
-                    message += "\n• '{0}' category - select display names within category".format(attr_name)
+                message_parts.append("\n\nAttachment switching (Two-Tier System):")
+                message_parts.extend(
+                    "\n• '{0}' category - select display names within category".format(self.make_safe_attribute_name(category))
+                    for category in attachment_categories)
             
-            QMessageBox.information(self, "Rig Creation Complete", message)
+            QMessageBox.information(self, "Rig Creation Complete", "".join(message_parts))
             
             # Refresh display
             self.analyze_scene()
             
         except Exception as e:
             QMessageBox.critical(self, "Rig Creation Error", "Error creating complete rig: {0}".format(str(e)))
+        finally:
+            self.joint_xform_cache = None
     
     def create_control_for_joint(self, association):
         """Create a control curve for a specific joint association"""
@@ -2447,6 +3372,42 @@ class WeaponRigToolDialog(QDialog):
             print("Error creating control for joint '{0}': {1}".format(joint_name, str(e)))
             return None
     
+    def get_joint_world_xform(self, joint_name):
+        """Return a joint's (world translation, world rotation), cached while a rig is being built"""
+        cache = self.joint_xform_cache
+        if cache is not None and joint_name in cache:
+            return cache[joint_name]
+        
+        xform = (cmds.xform(joint_name, query=True, worldSpace=True, translation=True),
+                 cmds.xform(joint_name, query=True, worldSpace=True, rotation=True))
+        if cache is not None:
+            cache[joint_name] = xform
+        return xform
+    
+    def prefetch_joint_world_xforms(self, associations):
+        """Fill joint_xform_cache for the associations' joints from their world matrices
+        
+        Matches cmds.xform's world translation/rotation (rotation in the joint's own
+        rotate order, in degrees) without two xform queries per joint.
+        """
+        cache = self.joint_xform_cache
+        if cache is None:
+            return
+        
+        for association in associations:
+            joint_name = association.joint_name
+            if joint_name in cache:
+                continue
+            joint_path = find_dag_path(joint_name)
+            if joint_path is None:
+                continue  # Missing joints fall back to the regular query (and its warning)
+            
+            matrix = om2.MTransformationMatrix(joint_path.inclusiveMatrix())
+            matrix.reorderRotation(om2.MFnTransform(joint_path).rotationOrder())
+            rotation = matrix.rotation()
+            cache[joint_name] = (list(matrix.translation(om2.MSpace.kWorld)),
+                                 [math.degrees(rotation.x), math.degrees(rotation.y), math.degrees(rotation.z)])
+    
     def create_control_curve(self, name, shape_type, scale, association):
         """Create a control curve using unified method or basic shapes"""
         if shape_type == "Custom":
@@ -2469,32 +3430,31 @@ class WeaponRigToolDialog(QDialog):
             if control and cmds.objExists(control):
                 # Position the control at the mesh center (like custom shapes)
                 mesh_center = self.calculate_mesh_center_for_association(association)
-                cmds.xform(control, worldSpace=True, translation=mesh_center)
                 
-                # Set pivot and orientation to match joint for proper constraint behavior
+                # Set pivot and orientation to match joint for proper constraint behavior.
+                # This is a final control, so it goes through cmds.xform to stay undoable
                 if cmds.objExists(association.joint_name):
-                    joint_pos = cmds.xform(association.joint_name, query=True, worldSpace=True, translation=True)
-                    joint_rot = cmds.xform(association.joint_name, query=True, worldSpace=True, rotation=True)
+                    joint_pos, joint_rot = self.get_joint_world_xform(association.joint_name)
                     
-                    # First set the control's orientation to match the joint
-                    cmds.xform(control, worldSpace=True, rotation=joint_rot)
+                    # First place the control and match the joint's orientation (a new
+                    # control's pivot is at its origin, so the rotation doesn't move it)
+                    cmds.xform(control, worldSpace=True, translation=mesh_center, rotation=joint_rot)
                     
                     # Then set the pivot to the joint position
-                    cmds.xform(control, worldSpace=True, rotatePivot=joint_pos)
-                    cmds.xform(control, worldSpace=True, scalePivot=joint_pos)
+                    cmds.xform(control, worldSpace=True, rotatePivot=joint_pos, scalePivot=joint_pos)
                     
                     print("Set control orientation and pivot to match joint: pos={0}, rot={1}".format(joint_pos, joint_rot))
+                else:
+                    cmds.xform(control, worldSpace=True, translation=mesh_center)
                 
                 # THEN apply per-joint transformations to basic shapes (after positioning)
                 if association:
                     self.apply_per_joint_transforms_to_curve(control, association)
                 
                 # Set color using per-joint color setting
-                color_index = self.get_maya_color_index(getattr(association, 'control_color', 'red'))
-                shapes = cmds.listRelatives(control, shapes=True) or []
-                for shape in shapes:
-                    cmds.setAttr(shape + '.overrideEnabled', True)
-                    cmds.setAttr(shape + '.overrideColor', color_index)
+                color_index = association.control_color_index
+                shapes = cmds.listRelatives(control, shapes=True, fullPath=True) or []
+                set_shape_display_overrides(shapes, color_index, undoable=True)
                 
 
             
@@ -2505,10 +3465,11 @@ class WeaponRigToolDialog(QDialog):
     def create_unified_curve(self, name, association, is_preview=False):
         """Unified curve creation method used by both preview and control creation"""
         try:
-            # Get the joint position for reference
+            # Get the joint position and orientation for reference
             joint_pos = [0, 0, 0]  # Default to origin
+            joint_rot = [0, 0, 0]
             if cmds.objExists(association.joint_name):
-                joint_pos = cmds.xform(association.joint_name, query=True, worldSpace=True, translation=True)
+                joint_pos, joint_rot = self.get_joint_world_xform(association.joint_name)
             else:
                 print("Warning: Joint '{0}' not found, creating curve at origin".format(association.joint_name))
             
@@ -2529,9 +3490,7 @@ class WeaponRigToolDialog(QDialog):
                 cmds.xform(curve, worldSpace=True, translation=joint_pos)
                 
                 # Set pivot to joint position and orientation for proper constraint behavior
-                joint_rot = cmds.xform(association.joint_name, query=True, worldSpace=True, rotation=True)
-                cmds.xform(curve, worldSpace=True, rotatePivot=joint_pos)
-                cmds.xform(curve, worldSpace=True, scalePivot=joint_pos)
+                cmds.xform(curve, worldSpace=True, rotatePivot=joint_pos, scalePivot=joint_pos)
                 
                 # Apply joint rotation to match joint orientation
                 cmds.xform(curve, worldSpace=True, rotation=joint_rot)
@@ -2543,31 +3502,22 @@ class WeaponRigToolDialog(QDialog):
                     global_offset_z = self.offset_z_spin.value()
                     
                     if global_offset_x != 0 or global_offset_y != 0 or global_offset_z != 0:
-                        self.apply_curve_offset(curve, global_offset_x, global_offset_y, global_offset_z)
+                        self.apply_curve_offset(curve, global_offset_x, global_offset_y, global_offset_z,
+                                                is_preview=is_preview)
                 
                 # Apply styling based on whether this is a preview or control
-                shapes = cmds.listRelatives(curve, shapes=True) or []
-                for shape in shapes:
-                    cmds.setAttr(shape + '.overrideEnabled', True)
-                    
-                    # Make BOTH preview and control curves thick for visibility
+                # Per-joint color, used for both preview curves and final controls
+                color_index = association.control_color_index
+                shapes = cmds.listRelatives(curve, shapes=True, fullPath=True) or []
+                # Make BOTH preview and control curves thick for visibility
+                set_shape_display_overrides(shapes, color_index, line_width=3, undoable=not is_preview)
+                
+                if is_preview:
+                    # Add preview attribute (new curve, so no existence query; defaultValue sets it on)
                     try:
-                        cmds.setAttr(shape + '.lineWidth', 3)
-                    except:
-                        pass  # lineWidth may not be available on all curve types
-                    
-                    if is_preview:
-                        # Use per-joint color for preview curves
-                        color_index = self.get_maya_color_index(getattr(association, 'control_color', 'red'))
-                        cmds.setAttr(shape + '.overrideColor', color_index)
-                        # Add preview attribute
-                        if not cmds.attributeQuery('isPreview', node=curve, exists=True):
-                            cmds.addAttr(curve, longName='isPreview', attributeType='bool', defaultValue=True)
-                            cmds.setAttr(curve + '.isPreview', True)
-                    else:
-                        # Use per-joint color for final controls
-                        color_index = self.get_maya_color_index(getattr(association, 'control_color', 'red'))
-                        cmds.setAttr(shape + '.overrideColor', color_index)
+                        cmds.addAttr(curve, longName='isPreview', attributeType='bool', defaultValue=True)
+                    except RuntimeError:
+                        pass  # Already tagged
                 
 
                 
@@ -2584,15 +3534,11 @@ class WeaponRigToolDialog(QDialog):
 
     
     def calculate_mesh_center(self, vertices):
-        """Calculate the center point of a set of vertices"""
-        if not vertices:
+        """Calculate the center point of a set of vertices (a list or an (N, 3) array)"""
+        if not len(vertices):
             return [0, 0, 0]
         
-        avg_x = sum(v[0] for v in vertices) / len(vertices)
-        avg_y = sum(v[1] for v in vertices) / len(vertices) 
-        avg_z = sum(v[2] for v in vertices) / len(vertices)
-        
-        return [avg_x, avg_y, avg_z]
+        return vertices_mean(vertices)
     
     def create_curve_from_mesh_direct(self, mesh_objects, name, joint_pos, scale_multiplier):
         """Create a curve directly from mesh geometry using Maya's curve-on-mesh features"""
@@ -2990,44 +3936,31 @@ class WeaponRigToolDialog(QDialog):
     
     def convert_to_relative_points(self, world_points, joint_pos):
         """Convert world space points to joint-relative points"""
-        relative_points = []
-        for point in world_points:
-            relative_point = [
-                point[0] - joint_pos[0],
-                point[1] - joint_pos[1],
-                point[2] - joint_pos[2]
-            ]
-            relative_points.append(relative_point)
-        return relative_points
+        return offset_points(world_points, joint_pos)
     
     def scale_points_around_center(self, points, center, scale_factor):
         """Scale points around a center point"""
-        scaled_points = []
-        for point in points:
-            scaled_point = [
-                center[0] + (point[0] - center[0]) * scale_factor,
-                center[1] + (point[1] - center[1]) * scale_factor,
-                center[2] + (point[2] - center[2]) * scale_factor
-            ]
-            scaled_points.append(scaled_point)
-        return scaled_points
+        return scale_points(points, center, scale_factor)
     
     def close_curve_if_needed(self, curve):
         """Close a curve if it's not already closed"""
         try:
-            # Check if curve is closed by comparing first and last CVs
-            spans = cmds.getAttr(curve + ".spans")
-            degree = cmds.getAttr(curve + ".degree")
+            curve_path = find_shape_path(curve, om2.MFn.kNurbsCurve)
+            if curve_path is None:
+                return
+            
+            # Check if curve is closed by comparing first and last CVs (one function set
+            # for spans, degree and both positions)
+            curve_fn = om2.MFnNurbsCurve(curve_path)
+            spans = curve_fn.numSpans
+            current_degree = curve_fn.degree
             
-            first_cv = cmds.pointPosition(curve + ".cv[0]", world=True)
-            last_cv = cmds.pointPosition(curve + ".cv[{0}]".format(spans), world=True)
+            first_cv = curve_fn.cvPosition(0, om2.MSpace.kWorld)
+            last_cv = curve_fn.cvPosition(spans, om2.MSpace.kWorld)
             
-            distance = sum([(first_cv[i] - last_cv[i])**2 for i in range(3)])**0.5
+            distance = first_cv.distanceTo(last_cv)
             
             if distance > 0.001:  # If not closed
-                # Get current degree to maintain it
-                current_degree = cmds.getAttr(curve + ".degree")
-                
                 # Rebuild as closed curve maintaining the degree
                 cmds.rebuildCurve(curve, constructionHistory=False, replaceOriginal=True, 
                                 rebuildType=0, endKnots=1, keepRange=0, keepControlPoints=True,
@@ -3075,27 +4008,33 @@ class WeaponRigToolDialog(QDialog):
             print("Error sorting points: {0}".format(str(e)))
             return points
     
-    def apply_curve_offset(self, curve, offset_x, offset_y, offset_z):
-        """Apply offset to curve control vertices"""
+    def apply_curve_offset(self, curve, offset_x, offset_y, offset_z, is_preview=False):
+        """Apply offset to curve control vertices
+        
+        Final controls are edited with one undoable cmds.move over all CVs; temporary
+        previews write the CVs directly through MFnNurbsCurve.
+        """
         try:
             if not curve or not cmds.objExists(curve):
                 return
             
-            # Get number of CVs
-            spans = cmds.getAttr(curve + ".spans")
-            degree = cmds.getAttr(curve + ".degree")
-            num_cvs = spans + degree
-            
-            # Move each CV by the offset
-            for i in range(num_cvs):
-                cv_name = "{0}.cv[{1}]".format(curve, i)
-                current_pos = cmds.pointPosition(cv_name, world=False)  # Local space
-                new_pos = [
-                    current_pos[0] + offset_x,
-                    current_pos[1] + offset_y,
-                    current_pos[2] + offset_z
-                ]
-                cmds.move(new_pos[0], new_pos[1], new_pos[2], cv_name, absolute=True, objectSpace=True)
+            if not is_preview:
+                # Offset every CV in local space in one command
+                cmds.move(offset_x, offset_y, offset_z, curve + ".cv[*]", relative=True, objectSpace=True)
+                return
+            
+            curve_path = find_shape_path(curve, om2.MFn.kNurbsCurve)
+            if curve_path is None:
+                return
+            
+            # Read every CV once, offset them in local space and write them back in one call
+            curve_fn = om2.MFnNurbsCurve(curve_path)
+            offset = om2.MVector(offset_x, offset_y, offset_z)
+            positions = curve_fn.cvPositions(om2.MSpace.kObject)
+            for i in range(len(positions)):
+                positions[i] += offset
+            curve_fn.setCVPositions(positions, om2.MSpace.kObject)
+            curve_fn.updateCurve()
                 
         except Exception as e:
                          print("Error applying curve offset: {0}".format(str(e)))
@@ -3147,42 +4086,85 @@ class WeaponRigToolDialog(QDialog):
             if len(vertices) <= 20:
                 return vertices  # If few vertices, use them all
             
+            # Work on one array for the center, radius and distances (NumPy), else the list
+            pts = None
+            if np is not None:
+                pts = np.asarray(vertices, dtype=np.float64)
+            
             # Step 1: Find mesh center
-            center = self.calculate_mesh_center(vertices)
+            center = vertices_mean(pts if pts is not None else vertices)
             
-            # Step 2: Calculate distances from center
-            vertex_distances = []
-            for i, vertex in enumerate(vertices):
-                distance = sum((vertex[j] - center[j])**2 for j in range(3))**0.5
-                vertex_distances.append((distance, i, vertex))
-            
-            # Step 3: Sort by distance (furthest first - these are likely boundary points)
-            vertex_distances.sort(reverse=True)
-            
-            # Step 4: Cluster by spatial proximity
-            clustered = []
-            cluster_radius = self.calculate_cluster_radius(vertices)
-            
-            for distance, index, vertex in vertex_distances:
-                # Check if this vertex is far enough from existing clustered vertices
-                is_new_cluster = True
-                for existing_vertex in clustered:
-                    existing_distance = sum((vertex[j] - existing_vertex[j])**2 for j in range(3))**0.5
-                    if existing_distance < cluster_radius:
-                        is_new_cluster = False
-                        break
+            cluster_radius = self.calculate_cluster_radius(pts if pts is not None else vertices)
+            
+            if pts is not None:
+                # Steps 2-3: squared distances from center, furthest first (ties: higher index first)
+                offsets = pts - np.asarray(center, dtype=np.float64)
+                distances = (offsets * offsets).sum(axis=1)
+                order = np.lexsort((np.arange(len(pts)), distances))[::-1]
+                
+                # Step 4: greedy clustering; each accepted point masks out its whole neighborhood
+                # at once, so the next unmasked point in order is the next new cluster
+                radius_sq = cluster_radius * cluster_radius
+                if _cluster_representatives_jit is not None:
+                    representatives = _cluster_representatives_jit(pts, np.ascontiguousarray(order), radius_sq, 20)
+                    clustered = [vertices[index] for index in representatives]
+                else:
+                    available = np.ones(len(pts), dtype=bool)
+                    clustered = []
+                    for index in order:
+                        if not available[index]:
+                            continue
+                        clustered.append(vertices[index])
+                        
+                        # Stop when we have enough representative points
+                        if len(clustered) >= 20:
+                            break
+                        neighbor_offsets = pts - pts[index]
+                        available &= (neighbor_offsets * neighbor_offsets).sum(axis=1) >= radius_sq
+                
+                # Step 5: Ensure we have at least a minimum number of points
+                if len(clustered) < 8:
+                    # Take the N furthest points
+                    clustered = [vertices[index] for index in order[:max(8, len(vertices)//4)]]
+            else:
+                # Step 2: Calculate squared distances from center (same ordering, no square roots)
+                cx, cy, cz = center[0], center[1], center[2]
+                vertex_distances = []
+                for i, vertex in enumerate(vertices):
+                    dx = vertex[0] - cx
+                    dy = vertex[1] - cy
+                    dz = vertex[2] - cz
+                    vertex_distances.append((dx * dx + dy * dy + dz * dz, i, vertex))
+                
+                # Step 3: Sort by distance (furthest first - these are likely boundary points)
+                vertex_distances.sort(reverse=True)
                 
-                if is_new_cluster:
-                    clustered.append(vertex)
+                # Step 4: Cluster by spatial proximity
+                clustered = []
+                radius_sq = cluster_radius * cluster_radius
+                
+                for distance, index, vertex in vertex_distances:
+                    # Check if this vertex is far enough from existing clustered vertices
+                    is_new_cluster = True
+                    for existing_vertex in clustered:
+                        dx = vertex[0] - existing_vertex[0]
+                        dy = vertex[1] - existing_vertex[1]
+                        dz = vertex[2] - existing_vertex[2]
+                        if dx * dx + dy * dy + dz * dz < radius_sq:
+                            is_new_cluster = False
+                            break
                     
-                    # Stop when we have enough representative points
-                    if len(clustered) >= 20:
-                        break
-            
-            # Step 5: Ensure we have at least a minimum number of points
-            if len(clustered) < 8:
-                # Take the N furthest points
-                clustered = [item[2] for item in vertex_distances[:max(8, len(vertex_distances)//4)]]
+                    if is_new_cluster:
+                        clustered.append(vertex)
+                        
+                        # Stop when we have enough representative points
+                        if len(clustered) >= 20:
+                            break
+                
+                # Step 5: Ensure we have at least a minimum number of points
+                if len(clustered) < 8:
+                    # Take the N furthest points
+                    clustered = [item[2] for item in vertex_distances[:max(8, len(vertex_distances)//4)]]
             
             print("Clustered {0} vertices down to {1} representative points".format(len(vertices), len(clustered)))
             return clustered
@@ -3195,8 +4177,7 @@ class WeaponRigToolDialog(QDialog):
         """Calculate appropriate clustering radius based on mesh size"""
         try:
             # Find bounding box
-            min_coords = [min(v[i] for v in vertices) for i in range(3)]
-            max_coords = [max(v[i] for v in vertices) for i in range(3)]
+            min_coords, max_coords = vertices_bounds(vertices)
             
             # Calculate mesh dimensions
             dimensions = [max_coords[i] - min_coords[i] for i in range(3)]
@@ -3223,21 +4204,20 @@ class WeaponRigToolDialog(QDialog):
             bbox_dims = self.get_bbox_dimensions(vertices)
             
             # Project to the plane with largest area
+            mean = vertices_mean(vertices)
             if bbox_dims['xy_area'] >= bbox_dims['xz_area'] and bbox_dims['xy_area'] >= bbox_dims['yz_area']:
                 # Project to XY plane
                 projected = [(v[0], v[1]) for v in vertices]
                 constant_axis = 2  # Z
-                constant_value = sum(v[2] for v in vertices) / len(vertices)
             elif bbox_dims['xz_area'] >= bbox_dims['yz_area']:
                 # Project to XZ plane
                 projected = [(v[0], v[2]) for v in vertices]
                 constant_axis = 1  # Y
-                constant_value = sum(v[1] for v in vertices) / len(vertices)
             else:
                 # Project to YZ plane
                 projected = [(v[1], v[2]) for v in vertices]
                 constant_axis = 0  # X
-                constant_value = sum(v[0] for v in vertices) / len(vertices)
+            constant_value = mean[constant_axis]
             
             # Get 2D convex hull
             hull_2d = self.convex_hull_2d(projected)
@@ -3262,12 +4242,7 @@ class WeaponRigToolDialog(QDialog):
     
     def get_bbox_dimensions(self, vertices):
         """Get bounding box dimensions and areas"""
-        min_x = min(v[0] for v in vertices)
-        max_x = max(v[0] for v in vertices)
-        min_y = min(v[1] for v in vertices)
-        max_y = max(v[1] for v in vertices)
-        min_z = min(v[2] for v in vertices)
-        max_z = max(v[2] for v in vertices)
+        (min_x, min_y, min_z), (max_x, max_y, max_z) = vertices_bounds(vertices)
         
         width = max_x - min_x
         height = max_y - min_y
@@ -3285,13 +4260,8 @@ class WeaponRigToolDialog(QDialog):
     def create_curve_from_hull_points_with_transforms(self, hull_points, name, joint_pos, scale_multiplier, association):
         """Create curve from convex hull points with per-joint transformations"""
         try:
-            # Convert to joint-relative coordinates
-            curve_points_relative = self.convert_to_relative_points(hull_points, joint_pos)
-            
-            # Apply scale multiplier
-            if scale_multiplier != 1.0:
-                center = self.calculate_mesh_center(curve_points_relative)
-                curve_points_relative = self.scale_points_around_center(curve_points_relative, center, scale_multiplier)
+            # Convert to joint-relative coordinates and apply scale multiplier
+            curve_points_relative = relative_curve_points(hull_points, joint_pos, scale_multiplier)
             
             # Apply per-joint transformations if association is provided
             if association:
@@ -3329,17 +4299,20 @@ class WeaponRigToolDialog(QDialog):
             print("Enhancing curve points with target: {0}, min: {1}".format(target_points, min_points))
             
             if len(points) < min_points:
-                # Interpolate additional points if we have too few
-                enhanced_points = self.interpolate_curve_points(points, min_points)
-            elif len(points) > target_points * 2:
-                # If we have way too many points, intelligently reduce while preserving shape
-                enhanced_points = self.smart_simplify_points(points, target_points)
+                # Interpolate additional points if we have too few, fused with the
+                # midpoint pass below: halving k evenly spaced inserts gives 2k + 1
+                counts = self.get_interpolation_counts(len(points), min_points)
+                smooth_points = subdivide_segments(points, [2 * count + 1 for count in counts])
             else:
-                # Good number of points, just use as-is
-                enhanced_points = points
-            
-            # Add intermediate points for extra smoothness
-            smooth_points = self.add_intermediate_points(enhanced_points)
+                if len(points) > target_points * 2:
+                    # If we have way too many points, intelligently reduce while preserving shape
+                    enhanced_points = self.smart_simplify_points(points, target_points)
+                else:
+                    # Good number of points, just use as-is
+                    enhanced_points = points
+                
+                # Add intermediate points for extra smoothness
+                smooth_points = self.add_intermediate_points(enhanced_points)
             
             print("Enhanced curve points: {0} -> {1} points for smoother curve".format(len(points), len(smooth_points)))
             return smooth_points
@@ -3348,42 +4321,25 @@ class WeaponRigToolDialog(QDialog):
             print("Error enhancing curve points: {0}".format(str(e)))
             return points
     
-    def interpolate_curve_points(self, points, target_count):
-        """Interpolate additional points between existing points"""
-        if len(points) >= target_count:
-            return points
+    def get_interpolation_counts(self, point_count, target_count):
+        """Intermediate points per segment to interpolate point_count points towards target_count
         
-        interpolated = [points[0]]  # Start with first point
-        
-        for i in range(len(points) - 1):
-            current = points[i]
-            next_point = points[i + 1]
-            
-            # Add the current point
-            if i > 0:  # Skip first point as it's already added
-                interpolated.append(current)
-            
-            # Calculate how many intermediate points to add
-            remaining_segments = len(points) - 1 - i
-            remaining_target = target_count - len(interpolated)
-            
-            if remaining_segments > 0 and remaining_target > 1:
-                intermediate_count = min(2, remaining_target // remaining_segments)
-                
-                # Add intermediate points
-                for j in range(1, intermediate_count + 1):
-                    t = float(j) / (intermediate_count + 1)
-                    intermediate = [
-                        current[0] + t * (next_point[0] - current[0]),
-                        current[1] + t * (next_point[1] - current[1]),
-                        current[2] + t * (next_point[2] - current[2])
-                    ]
-                    interpolated.append(intermediate)
-        
-        # Add the last point
-        interpolated.append(points[-1])
-        
-        return interpolated
+        Each segment gets up to 2, spread over the segments left to reach target_count.
+        """
+        counts = []
+        current_count = 1
+        segment_count = point_count - 1
+        for i in range(segment_count):
+            if i > 0:
+                current_count += 1
+            remaining_target = target_count - current_count
+            intermediate_count = 0
+            if remaining_target > 1:
+                intermediate_count = min(2, remaining_target // (segment_count - i))
+            counts.append(intermediate_count)
+            current_count += intermediate_count
+        
+        return counts
     
     def smart_simplify_points(self, points, target_count):
         """Intelligently simplify points while preserving curve shape"""
@@ -3391,18 +4347,19 @@ class WeaponRigToolDialog(QDialog):
             return points
         
         # Use Douglas-Peucker algorithm for shape-preserving simplification
-        tolerance = 0.05  # Start with small tolerance
-        simplified = self.douglas_peucker_3d(points, tolerance)
+        # (squared tolerances; the point array is built once for all passes)
+        points_array = np.asarray(points, dtype=np.float64) if np is not None else None
+        tolerance_sq = 0.05 * 0.05  # Start with small tolerance
+        simplified = douglas_peucker_simplify(points, tolerance_sq, points_array)
         
-        # If still too many points, increase tolerance
-        while len(simplified) > target_count * 1.5 and tolerance < 1.0:
-            tolerance *= 1.5
-            simplified = self.douglas_peucker_3d(points, tolerance)
+        # If still too many points, increase tolerance (x1.5, i.e. x2.25 squared)
+        while len(simplified) > target_count * 1.5 and tolerance_sq < 1.0:
+            tolerance_sq *= 2.25
+            simplified = douglas_peucker_simplify(points, tolerance_sq, points_array)
         
         # If still too many, fall back to even sampling
         if len(simplified) > target_count * 1.5:
-            step = len(simplified) // target_count
-            simplified = [simplified[i] for i in range(0, len(simplified), step)]
+            simplified = sample_evenly(simplified, target_count)
         
         return simplified
     
@@ -3411,26 +4368,8 @@ class WeaponRigToolDialog(QDialog):
         if len(points) < 3:
             return points
         
-        smooth_points = []
-        
-        for i in range(len(points)):
-            # Add the current point
-            smooth_points.append(points[i])
-            
-            # Add intermediate point to next (except for last point)
-            if i < len(points) - 1:
-                current = points[i]
-                next_point = points[i + 1]
-                
-                # Create intermediate point
-                intermediate = [
-                    (current[0] + next_point[0]) / 2.0,
-                    (current[1] + next_point[1]) / 2.0,
-                    (current[2] + next_point[2]) / 2.0
-                ]
-                smooth_points.append(intermediate)
-        
-        return smooth_points
+        # Midpoint between each pair
+        return subdivide_segments(points, [1] * (len(points) - 1))
     
     def simplify_curve_points(self, points, min_points, max_points):
         """Simplify curve points using even sampling (legacy method)"""
@@ -3472,82 +4411,30 @@ class WeaponRigToolDialog(QDialog):
                 rot_x == 0 and rot_y == 0 and rot_z == 0):
                 return curve_points
             
-            transformed_points = []
-            
-            # Find curve center for rotation
-            curve_center = self.calculate_mesh_center(curve_points)
-            
             print("Applying per-joint transforms: offset=({0:.2f}, {1:.2f}, {2:.2f}), rotation=({3:.1f}, {4:.1f}, {5:.1f})".format(
                 offset_x, offset_y, offset_z, rot_x, rot_y, rot_z))
             
-            for point in curve_points:
-                # Start with original point
-                new_point = list(point)
-                
-                # Apply rotation around curve center if any rotation is specified
-                if rot_x != 0 or rot_y != 0 or rot_z != 0:
-                    # Translate to origin (relative to curve center)
-                    relative_point = [
-                        point[0] - curve_center[0],
-                        point[1] - curve_center[1],
-                        point[2] - curve_center[2]
-                    ]
-                    
-                    # Apply rotations (in degrees, convert to radians)
-                    import math
-                    
-                    # Apply X rotation
-                    if rot_x != 0:
-                        angle_rad = math.radians(rot_x)
-                        cos_a = math.cos(angle_rad)
-                        sin_a = math.sin(angle_rad)
-                        y = relative_point[1] * cos_a - relative_point[2] * sin_a
-                        z = relative_point[1] * sin_a + relative_point[2] * cos_a
-                        relative_point[1] = y
-                        relative_point[2] = z
-                    
-                    # Apply Y rotation
-                    if rot_y != 0:
-                        angle_rad = math.radians(rot_y)
-                        cos_a = math.cos(angle_rad)
-                        sin_a = math.sin(angle_rad)
-                        x = relative_point[0] * cos_a + relative_point[2] * sin_a
-                        z = -relative_point[0] * sin_a + relative_point[2] * cos_a
-                        relative_point[0] = x
-                        relative_point[2] = z
-                    
-                    # Apply Z rotation
-                    if rot_z != 0:
-                        angle_rad = math.radians(rot_z)
-                        cos_a = math.cos(angle_rad)
-                        sin_a = math.sin(angle_rad)
-                        x = relative_point[0] * cos_a - relative_point[1] * sin_a
-                        y = relative_point[0] * sin_a + relative_point[1] * cos_a
-                        relative_point[0] = x
-                        relative_point[1] = y
-                    
-                    # Translate back from curve center
-                    new_point = [
-                        relative_point[0] + curve_center[0],
-                        relative_point[1] + curve_center[1],
-                        relative_point[2] + curve_center[2]
-                    ]
-                
-                # Apply position offset
-                new_point[0] += offset_x
-                new_point[1] += offset_y
-                new_point[2] += offset_z
-                
-                transformed_points.append(new_point)
+            # Rotate around the curve center with one composite matrix (X, then Y, then Z),
+            # then apply the position offset
+            rotation_matrix = None
+            curve_center = None
+            if rot_x != 0 or rot_y != 0 or rot_z != 0:
+                curve_center = self.calculate_mesh_center(curve_points)
+                rotation_matrix = euler_rotation_matrix(rot_x, rot_y, rot_z)
             
-            return transformed_points
+            return rotate_and_offset_points(curve_points, curve_center, rotation_matrix,
+                                            [offset_x, offset_y, offset_z])
             
         except Exception as e:
             print("Error applying per-joint transforms: {0}".format(str(e)))
             return curve_points
     
-    def apply_per_joint_transforms_to_curve(self, curve, association):
-        """Apply per-joint transformations to an existing curve object using Maya transforms"""
+    def apply_per_joint_transforms_to_curve(self, curve, association, is_preview=False):
+        """Apply per-joint transformations to an existing curve object using Maya transforms
+        
+        Final controls go through undoable cmds.rotate/cmds.move; temporary previews are
+        transformed directly through MFnTransform.
+        """
         try:
             # Get transformation values
             offset_x = association.curve_offset_x
@@ -3562,29 +4449,44 @@ class WeaponRigToolDialog(QDialog):
                 rot_x == 0 and rot_y == 0 and rot_z == 0):
                 return
             
-            if not cmds.objExists(curve):
+            curve_path = find_dag_path(curve)
+            if curve_path is None:
                 return
             
             print("Applying per-joint transforms to curve: {0}".format(curve))
             print("Transforms: offset=({0:.2f}, {1:.2f}, {2:.2f}), rotation=({3:.1f}, {4:.1f}, {5:.1f})".format(
                 offset_x, offset_y, offset_z, rot_x, rot_y, rot_z))
             
-            # Apply rotations first (around current position)
-            if rot_x != 0 or rot_y != 0 or rot_z != 0:
-                # Get current position for rotation center
-                current_pos = cmds.xform(curve, query=True, worldSpace=True, translation=True)
+            if not is_preview:
+                # Apply rotations first, around the control's current position
+                if rot_x != 0 or rot_y != 0 or rot_z != 0:
+                    current_pos = cmds.xform(curve, query=True, worldSpace=True, translation=True)
+                    if rot_x != 0:
+                        cmds.rotate(rot_x, 0, 0, curve, relative=True, pivot=current_pos)
+                    if rot_y != 0:
+                        cmds.rotate(0, rot_y, 0, curve, relative=True, pivot=current_pos)
+                    if rot_z != 0:
+                        cmds.rotate(0, 0, rot_z, curve, relative=True, pivot=current_pos)
                 
-                # Apply rotations around the control's current center
-                if rot_x != 0:
-                    cmds.rotate(rot_x, 0, 0, curve, relative=True, pivot=current_pos)
-                if rot_y != 0:
-                    cmds.rotate(0, rot_y, 0, curve, relative=True, pivot=current_pos)
-                if rot_z != 0:
-                    cmds.rotate(0, 0, rot_z, curve, relative=True, pivot=current_pos)
-            
-            # Apply position offset (after rotation)
-            if offset_x != 0 or offset_y != 0 or offset_z != 0:
-                cmds.move(offset_x, offset_y, offset_z, curve, relative=True, worldSpace=True)
+                # Apply position offset (after rotation)
+                if offset_x != 0 or offset_y != 0 or offset_z != 0:
+                    cmds.move(offset_x, offset_y, offset_z, curve, relative=True, worldSpace=True)
+                return
+            
+            # One world-space rotation (X, then Y, then Z) about the curve's current
+            # position, then the position offset, set directly on the transform
+            curve_fn = om2.MFnTransform(curve_path)
+            translation = om2.MVector(offset_x, offset_y, offset_z)
+            if rot_x != 0 or rot_y != 0 or rot_z != 0:
+                pivot = om2.MPoint(curve_fn.translation(om2.MSpace.kWorld))
+                pivot_local = pivot * curve_path.inclusiveMatrixInverse()
+                rotation = om2.MEulerRotation(math.radians(rot_x), math.radians(rot_y), math.radians(rot_z))
+                curve_fn.rotateBy(rotation.asQuaternion(), om2.MSpace.kWorld)
+                # Move back so the pivot point stays where it was
+                translation = translation + (pivot - pivot_local * curve_path.inclusiveMatrix())
+            
+            if translation.length() > 0:
+                curve_fn.translateBy(translation, om2.MSpace.kWorld)
                 
         except Exception as e:
             print("Error applying per-joint transforms to curve: {0}".format(str(e)))
@@ -3992,21 +4894,44 @@ class WeaponRigToolDialog(QDialog):
         except:
             return point
     
+    def get_mesh_vertex_array(self, mesh_obj):
+        """World-space vertices of a mesh as one (N, 3) float64 array (NumPy only), or None"""
+        if np is None:
+            return None
+        vertices = self.get_mesh_vertices_world_space(mesh_obj)
+        if not vertices:
+            return None
+        return np.asarray(vertices, dtype=np.float64)
+    
+    def get_association_vertices(self, association):
+        """World-space vertices of all existing meshes of an association: one (N, 3)
+        array with NumPy, otherwise a list
+        """
+        if np is not None:
+            arrays = [self.get_mesh_vertex_array(mesh_obj) for mesh_obj in association.mesh_objects
+                      if cmds.objExists(mesh_obj)]
+            arrays = [array for array in arrays if array is not None]
+            return np.vstack(arrays) if arrays else np.empty((0, 3))
+        
+        all_vertices = []
+        for mesh_obj in association.mesh_objects:
+            if cmds.objExists(mesh_obj):
+                all_vertices.extend(self.get_mesh_vertices_world_space(mesh_obj))
+        return all_vertices
+    
     def get_mesh_vertices_world_space(self, mesh_obj):
         """Get all vertices of a mesh in world space"""
         try:
-            # Get all vertices
-            vertex_count = cmds.polyEvaluate(mesh_obj, vertex=True)
-            if not vertex_count:
-                return []
-            
-            vertices = []
-            for i in range(vertex_count):
-                vertex_name = "{0}.vtx[{1}]".format(mesh_obj, i)
-                world_pos = cmds.xform(vertex_name, query=True, worldSpace=True, translation=True)
-                vertices.append(world_pos)
+            # All positions in one API call when the mesh shape can be resolved
+            vertices = mesh_world_points(mesh_obj)
+            if vertices is not None:
+                return vertices
             
-            return vertices
+            # Otherwise query every vertex with one bulk xform call (flat x, y, z list)
+            flat = cmds.xform("{0}.vtx[*]".format(mesh_obj), query=True, worldSpace=True, translation=True)
+            if not flat:
+                return []
+            return [flat[i:i + 3] for i in range(0, len(flat), 3)]
             
         except Exception as e:
             print("Error getting vertices for {0}: {1}".format(mesh_obj, str(e)))
@@ -4123,41 +5048,56 @@ class WeaponRigToolDialog(QDialog):
         return scaled_outline
     
     def convex_hull_2d(self, points):
-        """Calculate 2D convex hull using Graham scan algorithm"""
+        """Calculate the 2D convex hull, counter-clockwise from the bottom-most point
+        
+        Uses Qhull (scipy) when available, otherwise a monotone chain scan.
+        """
         if len(points) < 3:
             return points
         
+        if ConvexHull is not None and np is not None:
+            try:
+                # Qhull copes with duplicate points, so run it on the raw input and
+                # skip the Python-level dedup. It lists 2D hull vertices
+                # counter-clockwise, like the scan below; rotate so the hull starts at
+                # the bottom-most (then leftmost) point, which is always a hull vertex
+                hull = [points[i] for i in ConvexHull(np.asarray(points, dtype=np.float64)).vertices.tolist()]
+                start = min(hull, key=lambda p: (p[1], p[0]))
+                offset = hull.index(start)
+                return hull[offset:] + hull[:offset]
+            except Exception:
+                pass  # Degenerate input (e.g. collinear points); use the chain scan
+        
         # Remove duplicates
         unique_points = list(set(points))
         if len(unique_points) < 3:
             return unique_points
         
-        # Find the bottom-most point (and leftmost in case of tie)
-        start = min(unique_points, key=lambda p: (p[1], p[0]))
-        
-        # Sort points by polar angle with respect to start point
-        def polar_angle(p):
-            import math
-            dx = p[0] - start[0]
-            dy = p[1] - start[1]
-            return math.atan2(dy, dx)
-        
-        sorted_points = sorted([p for p in unique_points if p != start], key=polar_angle)
-        
-        # Graham scan
-        hull = [start]
-        
-        for point in sorted_points:
-            # Remove points that would create a right turn
-            while len(hull) >= 2 and self.cross_product_2d(hull[-2], hull[-1], point) <= 0:
-                hull.pop()
-            hull.append(point)
-        
-        return hull
-    
-    def cross_product_2d(self, o, a, b):
-        """Calculate cross product for 2D points"""
-        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+        # Andrew's monotone chain: a plain lexicographic sort (no per-point atan2),
+        # then lower and upper chains built with inlined cross products
+        unique_points.sort()
+        
+        def build_chain(ordered):
+            chain = []
+            for point in ordered:
+                px, py = point[0], point[1]
+                # Remove points that would create a right turn (or are collinear)
+                while len(chain) >= 2:
+                    o, a = chain[-2], chain[-1]
+                    if (a[0] - o[0]) * (py - o[1]) - (a[1] - o[1]) * (px - o[0]) > 0:
+                        break
+                    chain.pop()
+                chain.append(point)
+            return chain
+        
+        lower = build_chain(unique_points)
+        upper = build_chain(reversed(unique_points))
+        hull = lower[:-1] + upper[:-1]
+        
+        # Counter-clockwise, starting at the bottom-most (then leftmost) point as before
+        start = min(hull, key=lambda p: (p[1], p[0]))
+        offset = hull.index(start)
+        return hull[offset:] + hull[:offset]
     
     def simplify_outline_points(self, points, min_points, max_points):
         """Simplify outline points to reduce control point count"""
@@ -4190,86 +5130,19 @@ class WeaponRigToolDialog(QDialog):
     
     def douglas_peucker_3d(self, points, tolerance):
         """Douglas-Peucker line simplification algorithm for 3D points"""
-        if len(points) <= 2:
-            return points
-        
-        # Find the point with maximum distance from line between first and last
-        max_distance = 0
-        max_index = 0
-        
-        for i in range(1, len(points) - 1):
-            distance = self.point_to_line_distance_3d(points[i], points[0], points[-1])
-            if distance > max_distance:
-                max_distance = distance
-                max_index = i
-        
-        # If maximum distance is greater than tolerance, recursively simplify
-        if max_distance > tolerance:
-            # Recursive call on both parts
-            left_part = self.douglas_peucker_3d(points[:max_index + 1], tolerance)
-            right_part = self.douglas_peucker_3d(points[max_index:], tolerance)
-            
-            # Combine results (remove duplicate point at junction)
-            return left_part[:-1] + right_part
-        else:
-            # All points are close to the line, return endpoints
-            return [points[0], points[-1]]
-    
-    def point_to_line_distance_3d(self, point, line_start, line_end):
-        """Calculate distance from a 3D point to a 3D line"""
-        import math
-        
-        # Vector from line_start to line_end
-        line_vec = [line_end[i] - line_start[i] for i in range(3)]
-        
-        # Vector from line_start to point
-        point_vec = [point[i] - line_start[i] for i in range(3)]
-        
-        # Calculate line length
-        line_length = math.sqrt(sum(v*v for v in line_vec))
-        
-        if line_length == 0:
-            # Line is a point, return distance to that point
-            return math.sqrt(sum((point[i] - line_start[i])**2 for i in range(3)))
-        
-        # Normalize line vector
-        line_unit = [v / line_length for v in line_vec]
-        
-        # Project point vector onto line
-        projection_length = sum(point_vec[i] * line_unit[i] for i in range(3))
-        
-        # Find closest point on line
-        if projection_length <= 0:
-            closest = line_start
-        elif projection_length >= line_length:
-            closest = line_end
-        else:
-            closest = [line_start[i] + projection_length * line_unit[i] for i in range(3)]
-        
-        # Calculate distance from point to closest point on line
-        return math.sqrt(sum((point[i] - closest[i])**2 for i in range(3)))
+        return douglas_peucker_simplify(points, tolerance * tolerance)
     
     def create_basic_control_shape(self, name, shape_type, final_scale, association=None):
         """Create a basic control shape with mesh-aware sizing"""
         if shape_type == "box":
             # Calculate rectangular prism dimensions to contain the mesh
             if association and association.mesh_objects:
-                # Get all vertices from associated meshes
-                all_vertices = []
-                for mesh_obj in association.mesh_objects:
-                    if cmds.objExists(mesh_obj):
-                        vertices = self.get_mesh_vertices_world_space(mesh_obj)
-                        if vertices:
-                            all_vertices.extend(vertices)
+                # Get all vertices from associated meshes (cached per mesh)
+                all_vertices = self.get_association_vertices(association)
                 
-                if all_vertices:
+                if len(all_vertices):
                     # Calculate bounding box dimensions
-                    min_x = min(v[0] for v in all_vertices)
-                    max_x = max(v[0] for v in all_vertices)
-                    min_y = min(v[1] for v in all_vertices)
-                    max_y = max(v[1] for v in all_vertices)
-                    min_z = min(v[2] for v in all_vertices)
-                    max_z = max(v[2] for v in all_vertices)
+                    (min_x, min_y, min_z), (max_x, max_y, max_z) = vertices_bounds(all_vertices)
                     
                     # Calculate individual dimensions for rectangular prism
                     box_width = (max_x - min_x) * 0.6 * final_scale   # X dimension
@@ -4291,38 +5164,21 @@ class WeaponRigToolDialog(QDialog):
                 box_width = box_height = box_depth = final_scale
             
             # Create rectangular prism control with calculated dimensions
-            points = [
-                [-box_width, -box_height, -box_depth], [box_width, -box_height, -box_depth],
-                [box_width, box_height, -box_depth], [-box_width, box_height, -box_depth],
-                [-box_width, -box_height, -box_depth], [-box_width, -box_height, box_depth],
-                [box_width, -box_height, box_depth], [box_width, box_height, box_depth],
-                [-box_width, box_height, box_depth], [-box_width, -box_height, box_depth],
-                [box_width, -box_height, box_depth], [box_width, -box_height, -box_depth],
-                [box_width, box_height, -box_depth], [box_width, box_height, box_depth],
-                [-box_width, box_height, box_depth], [-box_width, box_height, -box_depth]
-            ]
+            points = [[sx * box_width, sy * box_height, sz * box_depth] for sx, sy, sz in BOX_CURVE_TEMPLATE]
             # Create rectangular prism as degree 1 (linear) since it should have sharp corners
             control = cmds.curve(name=name, degree=1, point=points)
             
         elif shape_type == "cylinder":
             # Calculate cylinder radius to contain the mesh  
             if association and association.mesh_objects:
-                # Get all vertices from associated meshes
-                all_vertices = []
-                for mesh_obj in association.mesh_objects:
-                    if cmds.objExists(mesh_obj):
-                        vertices = self.get_mesh_vertices_world_space(mesh_obj)
-                        if vertices:
-                            all_vertices.extend(vertices)
+                # Get all vertices from associated meshes (cached per mesh)
+                all_vertices = self.get_association_vertices(association)
                 
-                if all_vertices:
+                if len(all_vertices):
                     # Calculate mesh center and maximum distance
                     center = self.calculate_mesh_center(all_vertices)
-                    max_distance = 0
-                    for vertex in all_vertices:
-                        # Calculate XZ distance from center (ignore Y for cylinder)
-                        distance = ((vertex[0] - center[0])**2 + (vertex[2] - center[2])**2)**0.5
-                        max_distance = max(max_distance, distance)
+                    # Calculate XZ distance from center (ignore Y for cylinder)
+                    max_distance = vertices_max_distance(all_vertices, center, axes=(0, 2))
                     
                     cylinder_radius = max_distance * 0.7 * final_scale  # 70% of max distance
                     cylinder_radius = max(cylinder_radius, final_scale * 0.3)  # At least 30% of scale
@@ -4340,22 +5196,14 @@ class WeaponRigToolDialog(QDialog):
         elif shape_type == "sphere":
             # Calculate sphere radius to contain the mesh
             if association and association.mesh_objects:
-                # Get all vertices from associated meshes
-                all_vertices = []
-                for mesh_obj in association.mesh_objects:
-                    if cmds.objExists(mesh_obj):
-                        vertices = self.get_mesh_vertices_world_space(mesh_obj)
-                        if vertices:
-                            all_vertices.extend(vertices)
+                # Get all vertices from associated meshes (cached per mesh)
+                all_vertices = self.get_association_vertices(association)
                 
-                if all_vertices:
+                if len(all_vertices):
                     # Calculate mesh center and maximum distance
                     center = self.calculate_mesh_center(all_vertices)
-                    max_distance = 0
-                    for vertex in all_vertices:
-                        # Calculate 3D distance from center
-                        distance = ((vertex[0] - center[0])**2 + (vertex[1] - center[1])**2 + (vertex[2] - center[2])**2)**0.5
-                        max_distance = max(max_distance, distance)
+                    # Calculate 3D distance from center
+                    max_distance = vertices_max_distance(all_vertices, center)
                     
                     sphere_radius = max_distance * 0.8 * final_scale  # 80% of max distance  
                     sphere_radius = max(sphere_radius, final_scale * 0.3)  # At least 30% of scale
@@ -4409,18 +5257,15 @@ class WeaponRigToolDialog(QDialog):
         controls_group = cmds.group(empty=True, name="S2_Controls", parent=rig_group)
         
         # Move controls to controls group (excluding excluded joints)
-        all_controls = []
-        for association in self.joint_associations:
-            if association.has_control and not association.is_excluded and cmds.objExists(association.control_name):
-                all_controls.append(association.control_name)
+        candidates = [association.control_name for association in self.get_active_control_associations()
+                      if association.control_name]
+        # Only controls that don't already have a parent (world-level), in one query
+        # and one parent call
+        unparented_controls = cmds.ls(candidates, assemblies=True) if candidates else []
         
-        if all_controls:
+        if unparented_controls:
             try:
-                for control in all_controls:
-                    # Check if control doesn't already have a parent
-                    parent = cmds.listRelatives(control, parent=True)
-                    if not parent:
-                        cmds.parent(control, controls_group)
+                cmds.parent(unparented_controls, controls_group)
             except Exception as e:
                 print("Warning: Error organizing controls: {0}".format(str(e)))
         
@@ -4434,30 +5279,45 @@ class WeaponRigToolDialog(QDialog):
         """Freeze transforms on all control curves before constraining"""
         print("\n=== FREEZING CONTROL TRANSFORMS ===")
         
+        candidates = [association.control_name for association in self.get_active_control_associations()
+                      if association.control_name]
+        controls = cmds.ls(candidates) if candidates else []
+        if not controls:
+            # makeIdentity with no objects would act on the selection instead
+            print("Froze transforms on 0 controls (0 failed)")
+            return 0
+        
+        # Store the current pivot positions so they survive the freeze
+        pivots = [(control, cmds.xform(control, query=True, worldSpace=True, rotatePivot=True))
+                  for control in controls]
+        
         frozen_count = 0
         failed_count = 0
-        
-        for association in self.joint_associations:
-            if (association.has_control and not association.is_excluded and 
-                cmds.objExists(association.control_name)):
+        try:
+            # One makeIdentity over every control
+            cmds.makeIdentity(controls, apply=True, translate=True, rotate=True, scale=True, normal=False, preserveNormals=True)
+            frozen = controls
+        except Exception:
+            # Something (e.g. a locked channel) blocks the batch; freeze one by one to isolate it
+            frozen = []
+            for control in controls:
                 try:
-                    # Store the current pivot position
-                    pivot_pos = cmds.xform(association.control_name, query=True, worldSpace=True, rotatePivot=True)
-                    
-                    # Freeze transforms while preserving the pivot
-                    cmds.makeIdentity(association.control_name, apply=True, translate=True, rotate=True, scale=True, normal=False, preserveNormals=True)
-                    
-                    # Restore the original pivot position
-                    cmds.xform(association.control_name, worldSpace=True, rotatePivot=pivot_pos)
-                    cmds.xform(association.control_name, worldSpace=True, scalePivot=pivot_pos)
-                    
-                    frozen_count += 1
-                    print("Froze transforms for control: {0} (pivot preserved)".format(association.control_name))
-                    
+                    cmds.makeIdentity(control, apply=True, translate=True, rotate=True, scale=True, normal=False, preserveNormals=True)
+                    frozen.append(control)
                 except Exception as e:
-                    print("Warning: Could not freeze transforms for {0}: {1}".format(association.control_name, str(e)))
+                    print("Warning: Could not freeze transforms for {0}: {1}".format(control, str(e)))
                     failed_count += 1
         
+        # Restore the original pivot positions
+        frozen_set = set(frozen)
+        for control, pivot_pos in pivots:
+            if control not in frozen_set:
+                continue
+            cmds.xform(control, worldSpace=True, rotatePivot=pivot_pos, scalePivot=pivot_pos)
+            frozen_count += 1
+            if self.verbose:
+                print("Froze transforms for control: {0} (pivot preserved)".format(control))
+        
         print("Froze transforms on {0} controls ({1} failed)".format(frozen_count, failed_count))
         return frozen_count
 
@@ -4467,9 +5327,14 @@ class WeaponRigToolDialog(QDialog):
         
         constraint_count = 0
         
-        for association in self.joint_associations:
-            if (association.has_control and not association.is_excluded and 
-                cmds.objExists(association.control_name) and cmds.objExists(association.joint_name)):
+        # One existence query for all controls and joints instead of two per association
+        associations = self.get_active_control_associations()
+        names = [name for association in associations
+                 for name in (association.control_name, association.joint_name) if name]
+        existing = set(cmds.ls(names)) if names else set()
+        
+        for association in associations:
+            if association.control_name in existing and association.joint_name in existing:
                 try:
                     # Using parent constraint (handles both position and rotation) and scale constraint
                     # instead of separate point and orient constraints
@@ -4500,7 +5365,7 @@ class WeaponRigToolDialog(QDialog):
         
         for joint_name, attachments in self.attachments_by_joint.items():
             # Check if this joint also has default mesh associations
-            has_default_mesh = any(assoc.joint_name == joint_name for assoc in self.joint_associations)
+            has_default_mesh = joint_name in self.associations_by_joint
             
             if has_default_mesh and attachments:
                 joints_with_attachments[joint_name] = attachments
@@ -4512,24 +5377,18 @@ class WeaponRigToolDialog(QDialog):
             return
         
         # Group attachments by category first, then by display name within category
-        attachments_by_category = {}  # {category: {display_name: [(joint_name, attachment_obj), ...]}}
+        attachments_by_category = defaultdict(lambda: defaultdict(list))  # {category: {display_name: [(joint_name, attachment_obj), ...]}}
         
         for joint_name, attachments in joints_with_attachments.items():
             attachment_names = self.attachment_names_by_joint.get(joint_name, [])
             attachment_categories = self.attachment_categories_by_joint.get(joint_name, [])
+            name_count = len(attachment_names)
+            category_count = len(attachment_categories)
             
             for i, attachment_obj in enumerate(attachments):
                 # Get category and display name
-                category = attachment_categories[i] if i < len(attachment_categories) else "Uncategorized"
-                display_name = attachment_names[i] if i < len(attachment_names) else attachment_obj.split('|')[-1].split(':')[-1]
-                
-                # Initialize category if needed
-                if category not in attachments_by_category:
-                    attachments_by_category[category] = {}
-                
-                # Initialize display name within category if needed
-                if display_name not in attachments_by_category[category]:
-                    attachments_by_category[category][display_name] = []
+                category = attachment_categories[i] if i < category_count else "Uncategorized"
+                display_name = attachment_names[i] if i < name_count else attachment_obj.split('|')[-1].split(':')[-1]
                 
                 attachments_by_category[category][display_name].append((joint_name, attachment_obj))
         
@@ -4541,12 +5400,20 @@ class WeaponRigToolDialog(QDialog):
                 print("  Display name '{0}': {1} attachment(s) across joints {2}".format(
                     display_name, len(attachment_list), joint_names))
         
+        # Attribute names already on the rig group (long and short), read once for all
+        # categories; make_valid_attribute_name adds each name it hands out
+        existing_attrs = self.get_attribute_names(rig_group)
+        
+        # Category attributes that can swap out each default mesh, keyed once all
+        # categories exist: {default mesh: [attribute, ...]}
+        default_mesh_drivers = defaultdict(list)
+        
         # Create enum attributes for each category
         for category, display_names in attachments_by_category.items():
             try:
                 # Create attribute name from category
                 attr_name = self.make_safe_attribute_name(category)
-                attr_name = self.make_valid_attribute_name(attr_name, rig_group)
+                attr_name = self.make_valid_attribute_name(attr_name, rig_group, existing_attrs)
                 
                 # Create enum values: "Default" + all display names in this category
                 unique_display_names = list(display_names.keys())
@@ -4561,25 +5428,28 @@ class WeaponRigToolDialog(QDialog):
                 print("  Category controls {0} unique display name(s)".format(len(unique_display_names)))
                 
                 # Set up the switching logic for this category
-                self.setup_category_attachment_switching(rig_group, attr_name, category, display_names)
+                self.setup_category_attachment_switching(rig_group, attr_name, category, display_names,
+                                                         default_mesh_drivers)
                 
             except Exception as e:
                 print("Error creating category attribute for '{0}': {1}".format(category, str(e)))
         
+        self.key_default_mesh_visibility(default_mesh_drivers)
         print("Two-tier attachment attribute setup complete")
     
     def make_safe_attribute_name(self, display_name):
         """Convert display name to a safe attribute name"""
-        # Replace spaces and special characters with underscores
-        safe_name = display_name.lower()
-        safe_name = ''.join(c if c.isalnum() else '_' for c in safe_name)
-        
-        # Remove multiple consecutive underscores
-        while '__' in safe_name:
-            safe_name = safe_name.replace('__', '_')
-        
-        # Remove leading/trailing underscores
-        safe_name = safe_name.strip('_')
+        # Pure function of a small set of category/display names; memoized per session
+        safe_name = SAFE_ATTRIBUTE_NAME_CACHE.get(display_name)
+        if safe_name is None:
+            safe_name = SAFE_ATTRIBUTE_NAME_CACHE[display_name] = self.build_safe_attribute_name(display_name)
+        return safe_name
+    
+    def build_safe_attribute_name(self, display_name):
+        """Uncached body of make_safe_attribute_name"""
+        # Replace runs of spaces, special characters and underscores with one underscore,
+        # then remove leading/trailing underscores
+        safe_name = _NON_ALNUM_RUN_RE.sub('_', display_name.lower()).strip('_')
         
         # Ensure it doesn't start with a number
         if safe_name and safe_name[0].isdigit():
@@ -4591,128 +5461,97 @@ class WeaponRigToolDialog(QDialog):
         
         return safe_name
     
-    def make_valid_attribute_name(self, desired_name, node):
-        """Ensure attribute name is valid and unique"""
+    def get_attribute_names(self, node):
+        """Set of all long and short attribute names on node"""
+        return set(cmds.listAttr(node) or []) | set(cmds.listAttr(node, shortNames=True) or [])
+    
+    def make_valid_attribute_name(self, desired_name, node, existing_attrs=None):
+        """Ensure attribute name is valid and unique
+        
+        existing_attrs may pass a set from get_attribute_names(node) to share across calls;
+        the returned name is added to it.
+        """
         # Replace invalid characters
-        valid_name = desired_name.replace('-', '_').replace(' ', '_')
-        valid_name = ''.join(c for c in valid_name if c.isalnum() or c == '_')
+        valid_name = _NON_WORD_CHAR_RE.sub('', desired_name.replace('-', '_').replace(' ', '_'))
         
         # Ensure it doesn't start with a number
         if valid_name and valid_name[0].isdigit():
             valid_name = "attr_" + valid_name
         
         # Make unique if it already exists
+        if existing_attrs is None:
+            existing_attrs = self.get_attribute_names(node)
         original_name = valid_name
         counter = 1
-        while cmds.attributeQuery(valid_name, node=node, exists=True):
+        while valid_name in existing_attrs:
             valid_name = "{0}_{1}".format(original_name, counter)
             counter += 1
         
+        existing_attrs.add(valid_name)
         return valid_name
     
-    def setup_category_attachment_switching(self, rig_group, attr_name, category, display_names_dict):
-        """Set up switching logic for a category with multiple display names"""
+    def setup_category_attachment_switching(self, rig_group, attr_name, category, display_names_dict,
+                                            default_mesh_drivers):
+        """Set up switching logic for a category with multiple display names
+        
+        Attachments are keyed here; the category attribute is added to
+        default_mesh_drivers for each affected default mesh, which is keyed later by
+        key_default_mesh_visibility.
+        """
         print("  Setting up category switching for '{0}'".format(category))
         
         try:
             attr_full_name = "{0}.{1}".format(rig_group, attr_name)
             
-            # Collect all attachments and their default meshes for this category
-            all_attachment_data = {}  # {display_name: {'attachments': [(joint, obj)], 'default_meshes': {joint: [meshes]}}}
-            affected_joints = set()
-            
-            for display_name, attachment_list in display_names_dict.items():
-                # Group attachments by joint for this display name
-                attachments_by_joint = {}
-                for joint_name, attachment_obj in attachment_list:
-                    if joint_name not in attachments_by_joint:
-                        attachments_by_joint[joint_name] = []
-                    attachments_by_joint[joint_name].append(attachment_obj)
-                    affected_joints.add(joint_name)
-                
-                # Find default meshes for each joint
-                default_meshes_by_joint = {}
-                for joint_name in attachments_by_joint.keys():
-                    default_meshes = self.find_default_meshes_for_joint(joint_name)
-                    if default_meshes:
-                        default_meshes_by_joint[joint_name] = default_meshes
-                
-                all_attachment_data[display_name] = {
-                    'attachments_by_joint': attachments_by_joint,
-                    'default_meshes_by_joint': default_meshes_by_joint
-                }
+            # Collect the attachments of each display name per joint in one pass, with
+            # the enum value of each display name (0 is "Default")
+            display_name_list = list(display_names_dict.keys())
+            attachments_by_joint = defaultdict(list)  # {joint: [(attr_value, [attachments])]}
             
-            # Build expression for the entire category
-            expression_lines = []
+            for attr_value, display_name in enumerate(display_name_list, 1):
+                display_attachments = defaultdict(list)
+                for joint_name, attachment_obj in display_names_dict[display_name]:
+                    display_attachments[joint_name].append(attachment_obj)
+                for joint_name, attachments in display_attachments.items():
+                    attachments_by_joint[joint_name].append((attr_value, attachments))
             
-            # Get enum index mapping
-            display_name_list = list(display_names_dict.keys())
+            affected_joints = list(attachments_by_joint.keys())
             
-            for joint_name in affected_joints:
-                # Default case (when attribute = 0): show defaults, hide all attachments
-                default_meshes = []
-                for display_name, data in all_attachment_data.items():
-                    if joint_name in data['default_meshes_by_joint']:
-                        default_meshes.extend(data['default_meshes_by_joint'][joint_name])
-                
-                # Remove duplicates while preserving order
-                seen = set()
-                unique_default_meshes = []
-                for mesh in default_meshes:
-                    if mesh not in seen:
-                        unique_default_meshes.append(mesh)
-                        seen.add(mesh)
-                
-                for mesh in unique_default_meshes:
-                    expression_lines.append("if ({0} == 0) {1}.visibility = 1;".format(attr_full_name, mesh))
-                    expression_lines.append("else {0}.visibility = 0;".format(mesh))
-                
-                # Hide all attachments when default is selected
-                for display_name, data in all_attachment_data.items():
-                    if joint_name in data['attachments_by_joint']:
-                        for attachment in data['attachments_by_joint'][joint_name]:
-                            expression_lines.append("if ({0} == 0) {1}.visibility = 0;".format(attr_full_name, attachment))
-                
-                # Attachment cases (when attribute > 0): hide defaults, show specific attachment set
-                for i, display_name in enumerate(display_name_list):
-                    attr_value = i + 1  # +1 because 0 is "Default"
-                    data = all_attachment_data[display_name]
-                    
-                    # Hide defaults for this display name
-                    for mesh in unique_default_meshes:
-                        expression_lines.append("if ({0} == {1}) {2}.visibility = 0;".format(attr_full_name, attr_value, mesh))
-                    
-                    # Show attachments for this display name, hide others
-                    for j, other_display_name in enumerate(display_name_list):
-                        other_data = all_attachment_data[other_display_name]
-                        if joint_name in other_data['attachments_by_joint']:
-                            for attachment in other_data['attachments_by_joint'][joint_name]:
-                                if j == i:  # This is the selected display name
-                                    expression_lines.append("if ({0} == {1}) {2}.visibility = 1;".format(attr_full_name, attr_value, attachment))
-                                else:  # Hide other display names
-                                    expression_lines.append("if ({0} == {1}) {2}.visibility = 0;".format(attr_full_name, attr_value, attachment))
+            # Enum values at which each attachment is visible (the display names it belongs
+            # to). Attachments are keyed in first-seen order, joint by joint
+            visible_values = {}
+            node_order = []
+            default_meshes = []
             
-            if expression_lines:
-                # Combine all lines into one expression
-                full_expression = " ".join(expression_lines)
-                
-                # Create the expression with a unique name
-                expression_name = "categoryAttachmentSwitch_{0}".format(self.make_safe_attribute_name(category))
-                
-                # Make sure expression name is unique
-                counter = 1
-                base_name = expression_name
-                while cmds.objExists(expression_name):
-                    expression_name = "{0}_{1}".format(base_name, counter)
-                    counter += 1
+            for joint_name in affected_joints:
+                for mesh in self.find_default_meshes_for_joint(joint_name):
+                    drivers = default_mesh_drivers[mesh]
+                    if attr_full_name not in drivers:
+                        drivers.append(attr_full_name)
+                        default_meshes.append(mesh)
                 
-                cmds.expression(name=expression_name, string=full_expression)
+                for attr_value, attachments in attachments_by_joint[joint_name]:
+                    for attachment in attachments:
+                        values = visible_values.get(attachment)
+                        if values is None:
+                            values = visible_values[attachment] = []
+                            node_order.append(attachment)
+                        if attr_value not in values:
+                            values.append(attr_value)
+            
+            if node_order or default_meshes:
+                # One stepped driven-key curve per attachment: visible at its own enum
+                # values, hidden at every other
+                value_count = len(display_name_list) + 1
+                for node in node_order:
+                    self.key_visibility_switch(node, attr_full_name, visible_values[node], value_count)
                 
-                print("    Created category switching expression '{0}' for {1} joint(s): {2}".format(
-                    expression_name, len(affected_joints), list(affected_joints)))
+                print("    Created category switching driven keys on {0} attachment(s) for {1} joint(s): {2}".format(
+                    len(node_order), len(affected_joints), list(affected_joints)))
+                print("    {0} default mesh(es) switched by this category".format(len(default_meshes)))
                 print("    Controls {0} display name(s): {1}".format(len(display_name_list), display_name_list))
             else:
-                print("    Warning: No valid expression lines generated for category '{0}'".format(category))
+                print("    Warning: No nodes to switch for category '{0}'".format(category))
                 
         except Exception as e:
             print("    Error setting up category attachment switching for '{0}': {1}".format(category, str(e)))
@@ -4779,37 +5618,86 @@ class WeaponRigToolDialog(QDialog):
         except Exception as e:
             print("    Error setting up shared attachment switching for '{0}': {1}".format(display_name, str(e)))
     
+    def key_visibility_switch(self, node, attr_full_name, visible_values, value_count):
+        """Drive node's visibility from an enum attribute with stepped driven keys
+        
+        The node is visible at visible_values and hidden at every other value in
+        range(value_count). Driven-key curves are evaluated natively by the DG, unlike an
+        expression node, which is re-interpreted on every evaluation. Only the values
+        where the visibility changes are keyed; the step tangents and constant
+        post-infinity hold each state up to the next key and beyond the last one.
+        """
+        driven_attr = node + ".visibility"
+        previous = None
+        for attr_value in range(value_count):
+            visible = 1 if attr_value in visible_values else 0
+            if visible != previous:
+                cmds.setDrivenKeyframe(driven_attr, currentDriver=attr_full_name, driverValue=attr_value,
+                                       value=visible, outTangentType='step')
+                previous = visible
+    
+    def key_default_mesh_visibility(self, default_mesh_drivers):
+        """Show each default mesh only while every category attribute that can replace it
+        is at "Default" (0)
+        
+        Driven keys from several attributes would be summed by a blendWeighted node, so a
+        mesh switched by more than one category is keyed from the sum of those
+        attributes (plusMinusAverage), which is 0 only when all of them are at "Default".
+        """
+        for mesh, driver_attrs in default_mesh_drivers.items():
+            try:
+                if len(driver_attrs) == 1:
+                    driver_attr = driver_attrs[0]
+                else:
+                    sum_node = cmds.createNode('plusMinusAverage', name="{0}_attachmentSwitch".format(
+                        mesh.split('|')[-1].split(':')[-1]))
+                    for i, category_attr in enumerate(driver_attrs):
+                        cmds.connectAttr(category_attr, "{0}.input1D[{1}]".format(sum_node, i))
+                    driver_attr = sum_node + ".output1D"
+                
+                self.key_visibility_switch(mesh, driver_attr, (0,), 2)
+            except Exception as e:
+                print("    Error keying default mesh visibility for '{0}': {1}".format(mesh, str(e)))
+    
+    def get_transforms_constrained_to_joint(self, joint_name):
+        """Set of transforms driven by a parent or scale constraint that targets joint_name
+        
+        Walks out from the joint's own constraint connections instead of checking the
+        constraints of every candidate transform.
+        """
+        constrained = set()
+        for constraint_type in ('parentConstraint', 'scaleConstraint'):
+            constraints = cmds.listConnections(joint_name, type=constraint_type, source=False,
+                                               destination=True) or []
+            for constraint in set(constraints):
+                try:
+                    # The joint also feeds constraints that drive it; keep those it targets
+                    constrained_object, target_list = self.resolve_constraint(
+                        constraint, constraint_type,
+                        cmds.ls(cmds.listConnections(constraint, source=False, destination=True) or [],
+                                type='transform'))
+                    if constrained_object and joint_name in target_list:
+                        constrained.add(constrained_object)
+                except Exception:
+                    continue
+        return constrained
+    
     def find_default_meshes_for_joint(self, joint_name):
         """Find default mesh objects constrained to a specific joint"""
         default_meshes = []
         
-        for association in self.joint_associations:
-            if association.joint_name == joint_name:
+        association = self.associations_by_joint.get(joint_name)
+        if association is not None:
+            # Only transforms constrained to the joint can match, so their names are
+            # searched instead of every transform in the scene
+            constrained = [(transform, transform.lower())
+                           for transform in sorted(self.get_transforms_constrained_to_joint(joint_name))]
+            if constrained:
                 for mesh_obj in association.mesh_objects:
-                    # Find actual mesh objects constrained to this joint
-                    all_transforms = cmds.ls(type='transform')
-                    for transform in all_transforms:
-                        if mesh_obj.lower() in transform.lower():
-                            # Check if it's constrained to the joint
-                            parent_constraints = cmds.listConnections(transform, type='parentConstraint') or []
-                            scale_constraints = cmds.listConnections(transform, type='scaleConstraint') or []
-                            constraints = parent_constraints + scale_constraints
-                            
-                            for constraint in constraints:
-                                try:
-                                    constraint_type = cmds.objectType(constraint)
-                                    if constraint_type == 'parentConstraint':
-                                        targets = cmds.parentConstraint(constraint, query=True, targetList=True) or []
-                                    elif constraint_type == 'scaleConstraint':
-                                        targets = cmds.scaleConstraint(constraint, query=True, targetList=True) or []
-                                    else:
-                                        continue
-                                    
-                                    if joint_name in targets:
-                                        default_meshes.append(transform)
-                                        break
-                                except:
-                                    continue
+                    # Actual mesh objects constrained to this joint whose name contains this mesh
+                    mesh_name = mesh_obj.lower()
+                    default_meshes.extend(transform for transform, lower_name in constrained
+                                          if mesh_name in lower_name)
         
         return default_meshes
     
@@ -4882,9 +5770,8 @@ class WeaponRigToolDialog(QDialog):
     
     def select_rig(self):
         """Select the chosen rig in the viewport"""
-        current_item = self.existing_rigs_list.currentItem()
-        if current_item and current_item.flags() & Qt.ItemIsSelectable:
-            rig_name = current_item.text()
+        rig_name = self.get_selected_rig_name()
+        if rig_name:
             if cmds.objExists(rig_name):
                 cmds.select(rig_name, replace=True)
                 print("Selected rig: {0}".format(rig_name))
@@ -4894,9 +5781,8 @@ class WeaponRigToolDialog(QDialog):
     
     def delete_rig(self):
         """Delete the selected weapon rig"""
-        current_item = self.existing_rigs_list.currentItem()
-        if current_item and current_item.flags() & Qt.ItemIsSelectable:
-            rig_name = current_item.text()
+        rig_name = self.get_selected_rig_name()
+        if rig_name:
             
             reply = QMessageBox.question(
                 self,
@@ -4932,6 +5818,7 @@ class WeaponRigToolDialog(QDialog):
 def get_maya_main_window():
     """Get Maya main window as parent for dialog"""
     if pyside_version:
+        _lazy_import_qt()
         main_window_ptr = omui.MQtUtil.mainWindow()
         return wrapInstance(int(main_window_ptr), QDialog)
     return None